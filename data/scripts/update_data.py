@@ -4,23 +4,101 @@ Retail Tariff Data Update Script
 Automatically regenerates all data and updates the HTML viewer
 """
 
+import multiprocessing
+import runpy
+import select
+import signal
+import socket
 import subprocess
 import sys
 import os
 from pathlib import Path
 
+# The browser helper is shared with the server launchers in src/server
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src" / "server"))
+from launch_helpers import open_browser
+
+# Child that serves the current directory on an already-listening socket at fd 3
+SERVE_INHERITED_SOCKET = (
+    "import socket, http.server as h\n"
+    "s = h.ThreadingHTTPServer(('', 0), h.SimpleHTTPRequestHandler, bind_and_activate=False)\n"
+    "s.socket.close(); s.socket = socket.socket(fileno=3)\n"
+    "s.serve_forever()\n"
+)
+
+def spawn_prebound_server(port):
+    """Bind and listen on port here, then hand the socket to a background http.server child"""
+    # Connections are queued by the kernel from this point on, so the browser
+    # can be opened as soon as the spawn returns instead of after a sleep
+    with socket.create_server(("", port), backlog=128) as lsock:
+        return os.posix_spawn(sys.executable, [sys.executable, "-c", SERVE_INHERITED_SOCKET], os.environ, file_actions=[
+            (os.POSIX_SPAWN_DUP2, lsock.fileno(), 3),
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            (os.POSIX_SPAWN_DUP2, 1, 2),
+        ])
+
 def run_command(command, description):
-    """Run a command and handle errors"""
-    print(f"🔄 {description}...")
+    """Run a command (argv list, no shell), streaming its output to the terminal"""
+    print(f"🔄 {description}...", flush=True)
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        subprocess.run(command, check=True)
         print(f"✅ {description} completed successfully")
         return True
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, OSError) as e:
         print(f"❌ {description} failed:")
-        print(f"   Error: {e.stderr}")
+        print(f"   Error: {e}")
         return False
 
+def wait_for_server(pid):
+    """Block until the server child exits; on Ctrl+C stop it (SIGTERM, then SIGKILL after 5 s)"""
+    if not hasattr(os, "pidfd_open"):  # macOS
+        try:
+            os.waitpid(pid, 0)
+        except KeyboardInterrupt:
+            os.kill(pid, signal.SIGTERM)
+            os.waitpid(pid, 0)
+            raise
+        return
+    
+    # waitid on a pidfd sleeps in the kernel until the child exits
+    pidfd = os.pidfd_open(pid)
+    try:
+        try:
+            os.waitid(os.P_PIDFD, pidfd, os.WEXITED)
+        except KeyboardInterrupt:
+            signal.pidfd_send_signal(pidfd, signal.SIGTERM)
+            if not select.select([pidfd], [], [], 5)[0]:
+                signal.pidfd_send_signal(pidfd, signal.SIGKILL)
+            os.waitid(os.P_PIDFD, pidfd, os.WEXITED)
+            raise
+    finally:
+        os.close(pidfd)
+
+def _run_script_main(script):
+    """Forkserver child: run a generator script as if it were started directly"""
+    sys.argv = [script]
+    runpy.run_path(script, run_name="__main__")
+
+def run_script(script, description):
+    """Run a Python script in a child forked from a warm forkserver and return success status"""
+    if "forkserver" not in multiprocessing.get_all_start_methods():  # Windows
+        return run_command([sys.executable, script], description)
+    
+    # The forkserver imports pandas/numpy once; every script forked from it skips that startup
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload(["numpy", "pandas"])
+    print(f"🔄 {description}...", flush=True)
+    proc = ctx.Process(target=_run_script_main, args=(script,))
+    proc.start()
+    proc.join()
+    if proc.exitcode == 0:
+        print(f"✅ {description} completed successfully")
+        return True
+    
+    print(f"❌ {description} failed:")
+    print(f"   Error: exit status {proc.exitcode}")
+    return False
+
 def check_dependencies():
     """Check if required packages are available"""
     print("📦 Checking Python dependencies...")
@@ -85,12 +163,12 @@ def main():
         sys.exit(1)
     
     # Generate synthetic data
-    if not run_command('python3 "../src/data_generation/Generate synthetic datasets for tariff.py"', "Generating synthetic datasets"):
+    if not run_script(str(Path("../src/data_generation/Generate synthetic datasets for tariff.py")), "Generating synthetic datasets"):
         print("❌ Data generation failed")
         sys.exit(1)
     
     # Generate HTML viewer
-    if not run_command("python3 ../src/viewers/generate_dynamic_html_viewer.py", "Generating dynamic HTML viewer"):
+    if not run_script(str(Path("../src/viewers/generate_dynamic_html_viewer.py")), "Generating dynamic HTML viewer"):
         print("❌ Dynamic HTML viewer generation failed")
         sys.exit(1)
     
@@ -106,28 +184,31 @@ def main():
         try:
             # Start web server in background
             print("🚀 Starting web server for dynamic viewer...")
+            server_pid = None
             if sys.platform == "win32":  # Windows
-                subprocess.Popen(["python", "-m", "http.server", "5200"], 
+                subprocess.Popen(["python", "-m", "http.server", "5002"], 
                                creationflags=subprocess.CREATE_NEW_CONSOLE)
-            else:  # macOS/Linux
-                subprocess.Popen(["python3", "-m", "http.server", "5200"], 
-                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            
-            # Wait a moment for server to start
-            import time
-            time.sleep(2)
+                
+                # Wait a moment for server to start
+                import time
+                time.sleep(2)
+            else:  # macOS/Linux: port 5002 is listening before the child even starts
+                server_pid = spawn_prebound_server(5002)
             
             # Open browser to localhost
-            if sys.platform == "darwin":  # macOS
-                subprocess.run(["open", "http://localhost:5002/data_viewer_dynamic.html"])
-            elif sys.platform == "win32":  # Windows
-                subprocess.run(["start", "http://localhost:5002/data_viewer_dynamic.html"], shell=True)
-            else:  # Linux
-                subprocess.run(["xdg-open", "http://localhost:5002/data_viewer_dynamic.html"])
+            open_browser("http://localhost:5002/data_viewer_dynamic.html")
             
             print("🌐 Dynamic HTML viewer opened at http://localhost:5002/data_viewer_dynamic.html")
             print("💡 Web server running on port 5002. Press Ctrl+C to stop.")
             
+            # Keep server running
+            if server_pid is not None:
+                try:
+                    wait_for_server(server_pid)
+                except KeyboardInterrupt:
+                    print("\n🛑 Stopping web server...")
+                    print("✅ Web server stopped")
+            
         except Exception as e:
             print(f"❌ Failed to start web server: {e}")
             print("💡 Manual options:")
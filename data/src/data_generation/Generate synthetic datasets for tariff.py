@@ -2,12 +2,22 @@
 import numpy as np
 import pandas as pd
 from pathlib import Path
-import math, random
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:  # fall back to pandas' writer; no Parquet output
+    pa = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # fall back to the NumPy expression in generate_sales_daily
+    njit = None
 
 # Reproducibility
 SEED = 42
-random.seed(SEED)
-np.random.seed(SEED)
+rng = np.random.default_rng(SEED)  # PCG64; shared by all generators below
 
 # ------------------
 # Config
@@ -26,6 +36,9 @@ TARIFF_CHANGE_DATES = [
     pd.Timestamp("2025-07-01"),
 ]
 
+# Numeric columns are rounded to <= 4 decimals, so float32 holds them exactly enough
+FLOAT = np.float32
+
 OUT_DIR = Path("./retail_tariff_data")
 OUT_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -48,31 +61,55 @@ def base_cost_mean(pt: str) -> float:
         "Toys": 14.0,
     }[pt]
 
-def daterange(start: pd.Timestamp, end: pd.Timestamp):
-    cur = start
-    while cur <= end:
-        yield cur
-        cur += pd.Timedelta(days=1)
+def _to_arrow(df: pd.DataFrame) -> "pa.Table":
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # Keep dates as YYYY-MM-DD like pandas does for midnight timestamps
+    for i, field in enumerate(table.schema):
+        if pa.types.is_timestamp(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.date32()))
+    return table
+
+def write_csv(df: pd.DataFrame, path: Path) -> None:
+    """Write df as CSV; uses PyArrow's columnar writer when it is installed."""
+    if pa is None:
+        df.to_csv(path, index=False)
+        return
+    table = _to_arrow(df)
+    try:
+        # Unquoted output matches pandas and the viewers' simple CSV parsing
+        pacsv.write_csv(table, path, pacsv.WriteOptions(quoting_style="none", quoting_header="none"))
+    except pa.ArrowInvalid:
+        pacsv.write_csv(table, path)
+
+def write_parquet(df: pd.DataFrame, path: Path) -> None:
+    """Write df as Parquet for the CRUD server's paged reads (needs PyArrow)."""
+    if pa is None:
+        return
+    pq.write_table(_to_arrow(df), path, compression="zstd", row_group_size=1000)
 
 # ------------------
 # 1) Tariffs (country, product_type, current_tariff, start_time)
 # ------------------
 def generate_tariffs() -> pd.DataFrame:
-    rows = []
     base_map = {"Electronics": 0.08, "Apparel": 0.12, "Home": 0.06, "Toys": 0.05}
     country_bias = {"China": 0.02, "Vietnam": -0.01, "Mexico": -0.005, "India": -0.002, "USA": 0.00}
-    for c in COUNTRIES:
-        for pt in PRODUCT_TYPES:
-            cur = max(0.0, base_map[pt] + country_bias.get(c, 0.0) + np.random.normal(0, 0.01))
-            for d in TARIFF_CHANGE_DATES:
-                cur = float(max(0.0, min(0.40, cur + np.random.normal(0, 0.01))))
-                rows.append({
-                    "country": c,
-                    "product_type": pt,
-                    "current_tariff": round(cur, 4),
-                    "start_time": d.normalize(),
-                })
-    df = pd.DataFrame(rows).sort_values(["product_type", "country", "start_time"]).reset_index(drop=True)
+    # (country, product_type) grid; all noise is drawn up front
+    base = np.array([[base_map[pt] + country_bias.get(c, 0.0) for pt in PRODUCT_TYPES] for c in COUNTRIES])
+    noise0 = rng.normal(0, 0.01, size=base.shape)
+    noise = rng.normal(0, 0.01, size=base.shape + (len(TARIFF_CHANGE_DATES),))
+    cur = np.maximum(0.0, base + noise0)
+    tariff = np.empty_like(noise)
+    for k in range(len(TARIFF_CHANGE_DATES)):
+        # Clamp at every step so a capped tariff drifts from the cap, as before
+        cur = np.clip(cur + noise[:, :, k], 0.0, 0.40)
+        tariff[:, :, k] = cur
+    n_pt, n_d = len(PRODUCT_TYPES), len(TARIFF_CHANGE_DATES)
+    df = pd.DataFrame({
+        "country": np.repeat(COUNTRIES, n_pt * n_d),
+        "product_type": np.tile(np.repeat(PRODUCT_TYPES, n_d), len(COUNTRIES)),
+        "current_tariff": np.round(tariff.ravel().astype(FLOAT), 4),
+        "start_time": np.tile(pd.DatetimeIndex(TARIFF_CHANGE_DATES).normalize(), len(COUNTRIES) * n_pt),
+    }).sort_values(["product_type", "country", "start_time"]).reset_index(drop=True)
     return df
 
 # ------------------
@@ -88,19 +125,18 @@ SUPPLIER_NAMES = {
 RISK_LEVELS = ["Low", "Medium", "High"]
 
 def generate_suppliers() -> pd.DataFrame:
-    rows = []
-    for c, names in SUPPLIER_NAMES.items():
-        for name in names:
-            rows.append({
-                "supplier_id": name,
-                "country": c,
-                "risk": np.random.choice(RISK_LEVELS, p=[0.5, 0.4, 0.1]),
-                "capacity_limit_qtr": int(np.random.randint(150_000, 800_000)),
-                "lead_time_days": int(np.random.randint(18, 40)),
-                "base_cost_multiplier": round(float(np.random.normal(1.03 if c != "China" else 1.0, 0.03)), 3),
-                "freight_adj": round(max(0.0, float(np.random.normal(0.4, 0.2))), 2),
-            })
-    return pd.DataFrame(rows)
+    countries = [c for c, names in SUPPLIER_NAMES.items() for _ in names]
+    n = len(countries)
+    cost_mu = np.where(np.asarray(countries) != "China", 1.03, 1.0)
+    return pd.DataFrame({
+        "supplier_id": [name for names in SUPPLIER_NAMES.values() for name in names],
+        "country": countries,
+        "risk": rng.choice(RISK_LEVELS, size=n, p=[0.5, 0.4, 0.1]),
+        "capacity_limit_qtr": rng.integers(150_000, 800_000, size=n),
+        "lead_time_days": rng.integers(18, 40, size=n),
+        "base_cost_multiplier": np.round(rng.normal(cost_mu, 0.03).astype(FLOAT), 3),
+        "freight_adj": np.round(np.maximum(0.0, rng.normal(0.4, 0.2, size=n)).astype(FLOAT), 2),
+    })
 
 def generate_markets() -> pd.DataFrame:
     tz_map = {
@@ -122,96 +158,141 @@ def generate_markets() -> pd.DataFrame:
 # 3) Products catalog (with AUR)
 # ------------------
 def generate_products(suppliers: pd.DataFrame) -> pd.DataFrame:
-    rows = []
-    pid = 1
-    for pt in PRODUCT_TYPES:
-        for _ in range(N_PRODUCTS_PER_TYPE):
-            origin = random.choice(COUNTRIES)
-            aur = max(5.0, float(np.random.normal(aur_by_type(pt), aur_by_type(pt) * 0.1)))
-            base_cost = max(1.0, float(np.random.normal(base_cost_mean(pt), base_cost_mean(pt) * 0.1)))
-            s_choices = suppliers[suppliers.country == origin]
-            supplier_id = s_choices.sample(1).iloc[0].supplier_id if not s_choices.empty else None
-            rows.append({
-                "product_id": f"SKU-{pid:04d}",
-                "product_name": f"{pt[:3].upper()} Item {pid}",
-                "product_type": pt,
-                "country_of_origin": origin,
-                "AUR": round(aur, 2),
-                "base_cost": round(base_cost, 2),
-                "weight_kg": round(max(0.1, float(np.random.lognormal(mean=0.0, sigma=0.5))), 3),
-                "supplier_id": supplier_id,
-            })
-            pid += 1
-    return pd.DataFrame(rows)
+    n = N_PRODUCTS_PER_TYPE * len(PRODUCT_TYPES)
+    pid = np.arange(1, n + 1)
+    product_type = np.repeat(PRODUCT_TYPES, N_PRODUCTS_PER_TYPE)
+    aur_mu = np.repeat([aur_by_type(pt) for pt in PRODUCT_TYPES], N_PRODUCTS_PER_TYPE)
+    cost_mu = np.repeat([base_cost_mean(pt) for pt in PRODUCT_TYPES], N_PRODUCTS_PER_TYPE)
+    origin = rng.choice(COUNTRIES, size=n)
+    aur = np.maximum(5.0, rng.normal(aur_mu, aur_mu * 0.1)).astype(FLOAT)
+    base_cost = np.maximum(1.0, rng.normal(cost_mu, cost_mu * 0.1)).astype(FLOAT)
+    weight = np.maximum(0.1, rng.lognormal(mean=0.0, sigma=0.5, size=n)).astype(FLOAT)
+
+    # Pick one supplier uniformly from each product's origin country
+    by_country = {c: suppliers.loc[suppliers.country == c, "supplier_id"].to_numpy() for c in COUNTRIES}
+    pick = rng.random(n)
+    supplier_id = [
+        by_country[o][int(u * by_country[o].size)] if by_country[o].size else None
+        for o, u in zip(origin, pick)
+    ]
+    return pd.DataFrame({
+        "product_id": [f"SKU-{i:04d}" for i in pid],
+        "product_name": [f"{pt[:3].upper()} Item {i}" for pt, i in zip(product_type, pid)],
+        "product_type": product_type,
+        "country_of_origin": origin,
+        "AUR": np.round(aur, 2),
+        "base_cost": np.round(base_cost, 2),
+        "weight_kg": np.round(weight, 3),
+        "supplier_id": supplier_id,
+    })
 
 # ------------------
 # 4) Cost & transit lanes
 # ------------------
 def generate_cost_transit(products: pd.DataFrame, suppliers: pd.DataFrame) -> pd.DataFrame:
-    rows = []
-    for _, p in products.iterrows():
-        origin = p.country_of_origin
-        dests = np.random.choice(DEST_MARKETS, size=np.random.randint(1, 3), replace=False)
-        srow = suppliers[suppliers.supplier_id == p.supplier_id]
-        base_mult = 1.0
-        freight_adj = 0.0
-        lead_time_base = 28
-        if not srow.empty:
-            base_mult = float(srow.iloc[0].base_cost_multiplier)
-            freight_adj = float(srow.iloc[0].freight_adj)
-            lead_time_base = int(srow.iloc[0].lead_time_days)
-        for dest in dests:
-            lane = f"{origin}->{dest}"
-            transit = int(max(10, np.random.normal(lead_time_base, 4)))
-            cost_of_sourcing = max(1.0, p.base_cost * base_mult)
-            freight_per_unit = round(max(0.2, float(np.random.normal(0.8 + freight_adj, 0.25))), 2)
-            rows.append({
-                "product_id": p.product_id,
-                "origin_country": origin,
-                "destination_market": dest,
-                "lane": lane,
-                "lead_time_days": transit,
-                "transit_time_days": transit,
-                "cost_of_sourcing": round(float(cost_of_sourcing), 2),
-                "freight_per_unit": freight_per_unit,
-                "incoterm": np.random.choice(["FOB", "CIF", "DDP"], p=[0.5, 0.3, 0.2]),
-            })
-    return pd.DataFrame(rows)
+    # Left-join supplier attributes once; products without a supplier fall back to defaults
+    lanes = products.merge(
+        suppliers[["supplier_id", "base_cost_multiplier", "freight_adj", "lead_time_days"]],
+        on="supplier_id", how="left",
+    ).fillna({"base_cost_multiplier": 1.0, "freight_adj": 0.0, "lead_time_days": 28})
+
+    # 1-2 distinct destinations per product: shuffle each row of market indexes, keep the first n
+    n_dests = rng.integers(1, 3, size=len(lanes))
+    order = rng.permuted(np.tile(np.arange(len(DEST_MARKETS)), (len(lanes), 1)), axis=1)
+    keep = np.arange(len(DEST_MARKETS))[None, :] < n_dests[:, None]
+    dests = np.asarray(DEST_MARKETS)[order[keep]]
+    lanes = lanes.loc[lanes.index.repeat(n_dests)].reset_index(drop=True)
+    total = len(lanes)
+
+    origin = lanes["country_of_origin"].to_numpy()
+    transit = np.maximum(10, rng.normal(lanes["lead_time_days"].to_numpy(dtype=float), 4, size=total)).astype(int)
+    cost_of_sourcing = np.maximum(1.0, lanes["base_cost"].to_numpy() * lanes["base_cost_multiplier"].to_numpy()).astype(FLOAT)
+    freight_per_unit = np.maximum(0.2, rng.normal(0.8 + lanes["freight_adj"].to_numpy(), 0.25, size=total)).astype(FLOAT)
+    return pd.DataFrame({
+        "product_id": lanes["product_id"].to_numpy(),
+        "origin_country": origin,
+        "destination_market": dests,
+        "lane": origin.astype(object) + "->" + dests.astype(object),
+        "lead_time_days": transit,
+        "transit_time_days": transit,
+        "cost_of_sourcing": np.round(cost_of_sourcing, 2),
+        "freight_per_unit": np.round(freight_per_unit, 2),
+        "incoterm": rng.choice(["FOB", "CIF", "DDP"], size=total, p=[0.5, 0.3, 0.2]),
+    })
 
 # ------------------
 # 5) Sales (daily + weekly)
 # ------------------
+# Lookup tables indexed by product_type code (PRODUCT_TYPES order) and by weekday (Mon=0)
+PRODUCT_TYPES_ARR = np.array(PRODUCT_TYPES, dtype=object)
+BASE_MU_BY_TYPE = np.array([8, 14, 10, 9], dtype=FLOAT)
+WEEKDAY_BUMP = np.array([1.0, 1.0, 1.0, 1.0, 1.0, 1.2, 1.25], dtype=FLOAT)
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True)
+    def _sales_kernel(base_mu, week_bump, month_trend, z_fcst, z_actual, out_fcst, out_actual):
+        # Fused demand, noise and clamps; one pass per product row
+        for p in prange(base_mu.size):
+            for d in range(week_bump.size):
+                f = max(0.0, base_mu[p] * week_bump[d] * month_trend[d] + 2.0 * z_fcst[p, d])
+                out_fcst[p, d] = f
+                out_actual[p, d] = max(0.0, f + 2.5 * z_actual[p, d])
+else:
+    _sales_kernel = None
+
 def generate_sales_daily(products: pd.DataFrame) -> pd.DataFrame:
-    rows = []
-    base_mu_map = {"Electronics": 8, "Apparel": 14, "Home": 10, "Toys": 9}
-    for _, p in products.iterrows():
-        base_mu = base_mu_map[p.product_type]
-        for d in daterange(START_DATE, END_DATE):
-            dow = d.weekday()
-            week_bump = {5: 1.2, 6: 1.25}.get(dow, 1.0)
-            month_trend = 1.0 + 0.02 * math.sin((d.dayofyear / 365) * 2 * math.pi)
-            fcst = max(0, np.random.normal(base_mu * week_bump * month_trend, 2.0))
-            actual = max(0, np.random.normal(fcst, 2.5))
-            rows.append({
-                "date": d.normalize(),
-                "product_id": p.product_id,
-                "prod_type": p.product_type,
-                "sales_forecast": round(float(fcst), 2),
-                "actual_sales": round(float(actual), 2),
-            })
-    return pd.DataFrame(rows)
+    # Build the full (n_products, n_days) grid in one shot instead of looping per row
+    dates = pd.date_range(START_DATE, END_DATE).normalize()
+    week_bump = WEEKDAY_BUMP[dates.weekday.to_numpy()]
+    month_trend = (1.0 + 0.02 * np.sin((dates.dayofyear.to_numpy() / 365) * 2 * np.pi)).astype(FLOAT)
+    type_codes = pd.Categorical(products["product_type"], categories=PRODUCT_TYPES).codes
+    base_mu = BASE_MU_BY_TYPE[type_codes]
+    n_days = len(dates)
+    # Noise is drawn outside the kernel so output stays reproducible under prange
+    z_fcst = rng.standard_normal((len(products), n_days), dtype=FLOAT)
+    z_actual = rng.standard_normal((len(products), n_days), dtype=FLOAT)
+    if _sales_kernel is not None:
+        fcst = np.empty_like(z_fcst)
+        actual = np.empty_like(z_actual)
+        _sales_kernel(base_mu, week_bump, month_trend, z_fcst, z_actual, fcst, actual)
+    else:
+        mu = base_mu[:, None] * week_bump[None, :] * month_trend[None, :]
+        fcst = np.maximum(0, mu + 2.0 * z_fcst)
+        actual = np.maximum(0, fcst + 2.5 * z_actual)
+    # Each column is one flat array in (product, day) order; no per-row objects are built
+    return pd.DataFrame({
+        "date": np.tile(dates.values, len(products)),
+        "product_id": np.repeat(products["product_id"].to_numpy(), n_days),
+        "prod_type": PRODUCT_TYPES_ARR[np.repeat(type_codes, n_days)],
+        "sales_forecast": np.round(fcst.ravel(), 2),
+        "actual_sales": np.round(actual.ravel(), 2),
+    }, copy=False)
 
 def to_weekly(df_daily: pd.DataFrame) -> pd.DataFrame:
-    df = df_daily.copy()
-    df["year"] = df["date"].dt.isocalendar().year
-    df["week"] = df["date"].dt.isocalendar().week
-    grp = df.groupby(["year", "week", "product_id", "prod_type"], as_index=False).agg({
-        "sales_forecast": "sum",
-        "actual_sales": "sum",
-    })
-    grp["week_start"] = pd.to_datetime(grp["year"].astype(str) + grp["week"].astype(str) + "1", format="%G%V%u")
+    # Monday-start weeks: bins [Mon, next Mon) labelled by their Monday, i.e. the ISO week start
+    week = pd.Grouper(key="date", freq="W-MON", closed="left", label="left")
+    grp = df_daily.groupby([week, "product_id", "prod_type"], as_index=False, sort=True)[["sales_forecast", "actual_sales"]].sum()
+    grp = grp.rename(columns={"date": "week_start"})
+    grp[["sales_forecast", "actual_sales"]] = grp[["sales_forecast", "actual_sales"]].round(2)
+    iso = grp["week_start"].dt.isocalendar()
+    grp["year"] = iso["year"]
+    grp["week"] = iso["week"]
     return grp[["week_start", "year", "week", "product_id", "prod_type", "sales_forecast", "actual_sales"]]
 
+def fuse_sales(sales_daily: pd.DataFrame, products: pd.DataFrame, tariffs: pd.DataFrame) -> pd.DataFrame:
+    """Denormalize daily sales with product attributes and the tariff in effect that day."""
+    df = sales_daily.merge(products.drop(columns="product_type"), on="product_id", how="left")
+    # Tariff for each sale = latest change at or before the sale date for its origin/type
+    df = pd.merge_asof(
+        df.sort_values("date"),
+        tariffs.rename(columns={"start_time": "tariff_start_time"}).sort_values("tariff_start_time"),
+        left_on="date", right_on="tariff_start_time",
+        left_by=["country_of_origin", "prod_type"], right_by=["country", "product_type"],
+        direction="backward",
+    )
+    df = df.drop(columns=["country", "product_type"]).sort_values(["product_id", "date"]).reset_index(drop=True)
+    return df
+
 # ------------------
 # Build
 # ------------------
@@ -230,14 +311,22 @@ sales_daily = sales_daily[["date", "product_id", "prod_type", "sales_forecast",
 sales_weekly = sales_weekly[["week_start", "year", "week", "product_id", "prod_type", "sales_forecast", "actual_sales"]]
 cost_transit = cost_transit[["product_id", "origin_country", "destination_market", "lane", "lead_time_days", "transit_time_days", "cost_of_sourcing", "freight_per_unit", "incoterm"]]
 
-# Save
-tariffs.to_csv(OUT_DIR / "tariffs.csv", index=False)
-products.to_csv(OUT_DIR / "products.csv", index=False)
-sales_daily.to_csv(OUT_DIR / "sales_daily.csv", index=False)
-sales_weekly.to_csv(OUT_DIR / "sales_weekly.csv", index=False)
-cost_transit.to_csv(OUT_DIR / "cost_transit.csv", index=False)
-suppliers.to_csv(OUT_DIR / "suppliers.csv", index=False)
-markets.to_csv(OUT_DIR / "markets.csv", index=False)
+# Sales x product x tariff, joined once so consumers need no lookups
+fused = fuse_sales(sales_daily, products, tariffs)
+
+# Save (Parquet after CSV, so it is never older than the CSV it mirrors)
+for name, df in {
+    "tariffs": tariffs,
+    "products": products,
+    "sales_daily": sales_daily,
+    "sales_weekly": sales_weekly,
+    "cost_transit": cost_transit,
+    "suppliers": suppliers,
+    "markets": markets,
+    "fused": fused,
+}.items():
+    write_csv(df, OUT_DIR / f"{name}.csv")
+    write_parquet(df, OUT_DIR / f"{name}.parquet")
 
 # Preview to user as small samples
 print("\n=== TARIFFS (sample) ===")
@@ -254,5 +343,7 @@ print("\n=== SUPPLIERS (sample) ===")
 print(suppliers.head(20))
 print("\n=== MARKETS (sample) ===")
 print(markets.head(20))
+print("\n=== FUSED SALES (sample) ===")
+print(fused.head(20))
 
 str(OUT_DIR)
@@ -7,22 +7,67 @@ Provides REST API endpoints for Create, Read, Update, Delete operations
 import os
 import csv
 import json
+import re
+import threading
+from itertools import islice
 import pandas as pd
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
-from datetime import datetime
+from datetime import date
 import logging
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:  # fall back to csv.DictReader; Parquet mirrors are ignored
+    pa = None
+
+try:
+    import orjson
+except ImportError:  # fall back to json and Flask's default JSON provider
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = Flask(__name__)
-CORS(app)  # Enable CORS for all routes
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson; keys stay sorted like Flask's default provider"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+app = Flask(__name__, static_folder=None)  # /static is served by serve_viewer_asset
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+CORS(app, expose_headers=['X-Total-Count', 'X-Row-Ids'])  # Enable CORS for all routes
 
 # Configuration
 DATA_DIR = "retail_tariff_data"
 PORT = 5001
+NDJSON = 'application/x-ndjson'
+
+# Parsed CSV rows keyed by path, tagged with (mtime_ns, size) of the file they came from
+_CACHE = {}
+# Header and data-row byte offsets keyed by path, tagged the same way
+_INDEX = {}
+_CACHE_LOCK = threading.Lock()
+# Column value -> row indices maps keyed by (path, column), tagged with the parsed rows they index
+_VALUE_INDEX = {}
+# Distinct values per column keyed by path, tagged with the parsed rows they summarize
+_FILTER_OPTIONS = {}
+# Columns with more distinct values than this get no filter dropdown
+FILTER_OPTION_LIMIT = 20
+# Table listing for /api/tables, rebuilt when DATA_DIR's mtime changes
+_TABLES_CACHE = {'mtime': None, 'data': []}
+
+# Shape check for date fields ahead of date.fromisoformat
+_ISO_DATE = re.compile(r'\d{4}-\d{2}-\d{2}', re.ASCII)
 
 # Data validation rules for each table
 VALIDATION_RULES = {
@@ -89,131 +134,421 @@ VALIDATION_RULES = {
     }
 }
 
-def validate_data(table_name, data):
-    """Validate data against table rules"""
-    if table_name not in VALIDATION_RULES:
-        return False, f"Unknown table: {table_name}"
-    
-    rules = VALIDATION_RULES[table_name]
-    errors = []
+def _compile_type_check(field, rule):
+    """Build the type/range check for one field, resolving its rule once"""
+    rule_type = rule["type"]
     
-    for field, rule in rules.items():
-        value = data.get(field)
-        
-        # Check required fields
-        if rule.get("required", False) and (value is None or value == ""):
-            errors.append(f"{field} is required")
-            continue
-        
-        # Skip validation for empty optional fields
-        if not rule.get("required", False) and (value is None or value == ""):
-            continue
-        
-        # Type validation
-        if rule["type"] == "string":
+    if rule_type == "string":
+        max_length = rule.get("max_length")
+        def check(value, errors):
             if not isinstance(value, str):
                 errors.append(f"{field} must be a string")
-            elif "max_length" in rule and len(value) > rule["max_length"]:
-                errors.append(f"{field} must be {rule['max_length']} characters or less")
-        elif rule["type"] == "integer":
-            try:
-                int_val = int(value)
-                if "min" in rule and int_val < rule["min"]:
-                    errors.append(f"{field} must be at least {rule['min']}")
-                if "max" in rule and int_val > rule["max"]:
-                    errors.append(f"{field} must be at most {rule['max']}")
-            except (ValueError, TypeError):
-                errors.append(f"{field} must be an integer")
-        elif rule["type"] == "float":
+            elif max_length is not None and len(value) > max_length:
+                errors.append(f"{field} must be {max_length} characters or less")
+        return check
+    
+    if rule_type in ("integer", "float"):
+        cast = int if rule_type == "integer" else float
+        type_error = f"{field} must be an integer" if rule_type == "integer" else f"{field} must be a number"
+        min_val = rule.get("min")
+        max_val = rule.get("max")
+        def check(value, errors):
             try:
-                float_val = float(value)
-                if "min" in rule and float_val < rule["min"]:
-                    errors.append(f"{field} must be at least {rule['min']}")
-                if "max" in rule and float_val > rule["max"]:
-                    errors.append(f"{field} must be at most {rule['max']}")
+                num = cast(value)
             except (ValueError, TypeError):
-                errors.append(f"{field} must be a number")
-        elif rule["type"] == "date":
+                errors.append(type_error)
+                return
+            if min_val is not None and num < min_val:
+                errors.append(f"{field} must be at least {min_val}")
+            if max_val is not None and num > max_val:
+                errors.append(f"{field} must be at most {max_val}")
+        return check
+    
+    if rule_type == "date":
+        def check(value, errors):
             try:
-                datetime.strptime(value, "%Y-%m-%d")
+                if _ISO_DATE.fullmatch(value):
+                    date.fromisoformat(value)
+                    return
             except (ValueError, TypeError):
-                errors.append(f"{field} must be a valid date (YYYY-MM-DD)")
-        elif rule["type"] == "email":
+                pass
+            errors.append(f"{field} must be a valid date (YYYY-MM-DD)")
+        return check
+    
+    if rule_type == "email":
+        def check(value, errors):
             if "@" not in str(value) or "." not in str(value):
                 errors.append(f"{field} must be a valid email address")
-        
-        # Choice validation
-        if "choices" in rule and value not in rule["choices"]:
-            errors.append(f"{field} must be one of: {', '.join(rule['choices'])}")
+        return check
     
+    return None
+
+def _compile_field(field, rule):
+    """Build a validator for one field that appends its errors to a list"""
+    required = rule.get("required", False)
+    checks = []
+    type_check = _compile_type_check(field, rule)
+    if type_check is not None:
+        checks.append(type_check)
+    if "choices" in rule:
+        choices = rule["choices"]
+        choices_error = f"{field} must be one of: {', '.join(choices)}"
+        def check_choice(value, errors):
+            if value not in choices:
+                errors.append(choices_error)
+        checks.append(check_choice)
+    
+    def validate_field(data, errors):
+        value = data.get(field)
+        if value is None or value == "":
+            # Required fields must be present; empty optional fields are skipped
+            if required:
+                errors.append(f"{field} is required")
+            return
+        for check in checks:
+            check(value, errors)
+    return validate_field
+
+def _compile_rules(rules):
+    """Compile a table's rules into a single function returning its error list"""
+    field_validators = [_compile_field(field, rule) for field, rule in rules.items()]
+    
+    def validate(data):
+        errors = []
+        for validate_field in field_validators:
+            validate_field(data, errors)
+        return errors
+    return validate
+
+# Validators compiled once from VALIDATION_RULES
+_VALIDATORS = {table: _compile_rules(rules) for table, rules in VALIDATION_RULES.items()}
+
+def validate_data(table_name, data):
+    """Validate data against table rules"""
+    validator = _VALIDATORS.get(table_name)
+    if validator is None:
+        return False, f"Unknown table: {table_name}"
+    
+    errors = validator(data)
     return len(errors) == 0, errors
 
+def read_only_error(table_name):
+    """Error response for a write to a table without validation rules (e.g. the derived fused table), else None"""
+    if table_name in _VALIDATORS:
+        return None
+    return jsonify({'error': f'Table {table_name} is read-only'}), 403
+
 def get_csv_path(table_name):
     """Get the CSV file path for a table"""
     return os.path.join(DATA_DIR, f"{table_name}.csv")
 
+def _parse_csv(csv_path):
+    """Parse a CSV file into a list of row dicts"""
+    if pa is None:
+        with open(csv_path, 'r', newline='', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            return list(reader)
+    
+    # Read every column as a string so rows match what csv.DictReader returns
+    with open(csv_path, 'r', newline='', encoding='utf-8') as file:
+        header = next(csv.reader(file), [])
+    if not header:
+        return []
+    convert_options = pacsv.ConvertOptions(column_types={name: pa.string() for name in header})
+    return pacsv.read_csv(csv_path, convert_options=convert_options).to_pylist()
+
 def read_csv_data(table_name):
-    """Read data from CSV file"""
+    """Read data from CSV file, reusing the parsed rows while the file is unchanged.
+    
+    The returned list is shared with the cache; copy it before mutating.
+    """
     csv_path = get_csv_path(table_name)
-    if not os.path.exists(csv_path):
+    try:
+        st = os.stat(csv_path)
+    except FileNotFoundError:
         return []
     
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _CACHE_LOCK:
+        hit = _CACHE.get(csv_path)
+        if hit and hit[0] == stamp:
+            return hit[1]
+        rows = _parse_csv(csv_path)
+        _CACHE[csv_path] = (stamp, rows)
+        return rows
+
+def _build_index(csv_path):
+    """Scan a CSV file once, returning its header and the byte offset of each data row.
+    
+    Returns None when a quoted field spans lines, since rows then don't map to lines.
+    """
+    offsets = []
+    with open(csv_path, 'rb') as file:
+        header_line = file.readline()
+        pos = len(header_line)
+        for line in file:
+            if line.count(b'"') % 2:
+                return None
+            if line.strip():
+                offsets.append(pos)
+            pos += len(line)
+    header = next(csv.reader([header_line.decode('utf-8-sig')]), [])
+    return header, offsets
+
+def _fresh_parquet_path(csv_path, csv_stat):
+    """Return the generator's Parquet mirror of a CSV if it is at least as new as the CSV"""
+    if pa is None:
+        return None
+    parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+    try:
+        if os.stat(parquet_path).st_mtime_ns >= csv_stat.st_mtime_ns:
+            return parquet_path
+    except FileNotFoundError:
+        pass
+    return None
+
+def _read_parquet_page(parquet_path, start_idx, end_idx):
+    """Read rows [start_idx:end_idx] by loading only the row groups that overlap them"""
+    pf = pq.ParquetFile(parquet_path)
+    total_count = pf.metadata.num_rows
+    wanted = range(total_count)[start_idx:end_idx]
+    if not wanted:
+        return [], total_count
+    
+    groups = []
+    group_start = 0
+    first_row = None
+    for i in range(pf.num_row_groups):
+        group_end = group_start + pf.metadata.row_group(i).num_rows
+        if group_end > wanted.start and group_start < wanted.stop:
+            if first_row is None:
+                first_row = group_start
+            groups.append(i)
+        group_start = group_end
+    
+    table = pf.read_row_groups(groups).slice(wanted.start - first_row, len(wanted))
+    # Cast to strings so rows look the same as rows parsed from the CSV
+    table = pa.table({name: table.column(name).cast(pa.string()) for name in table.column_names})
+    return table.to_pylist(), total_count
+
+def _iter_csv_rows(csv_path, header, offsets):
+    """Yield the rows starting at offsets[0], one per offset, parsing as it goes"""
     with open(csv_path, 'r', newline='', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        return list(reader)
+        file.seek(offsets[0])
+        reader = csv.DictReader(file, fieldnames=header)
+        yield from islice(reader, len(offsets))
+
+def iter_table_page(table_name, start_idx, end_idx):
+    """Like read_table_page, but returns (row_iterator, total_count).
+    
+    CSV-backed pages are parsed lazily while the iterator is consumed.
+    """
+    csv_path = get_csv_path(table_name)
+    try:
+        st = os.stat(csv_path)
+    except FileNotFoundError:
+        return iter(()), 0
+    
+    parquet_path = _fresh_parquet_path(csv_path, st)
+    if parquet_path is not None:
+        rows, total_count = _read_parquet_page(parquet_path, start_idx, end_idx)
+        return iter(rows), total_count
+    
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _CACHE_LOCK:
+        hit = _INDEX.get(csv_path)
+        if hit and hit[0] == stamp:
+            index = hit[1]
+        else:
+            index = _build_index(csv_path)
+            _INDEX[csv_path] = (stamp, index)
+    
+    if index is None:
+        all_data = read_csv_data(table_name)
+        return iter(all_data[start_idx:end_idx]), len(all_data)
+    
+    header, offsets = index
+    page_offsets = offsets[start_idx:end_idx]
+    if not header or not page_offsets:
+        return iter(()), len(offsets)
+    return _iter_csv_rows(csv_path, header, page_offsets), len(offsets)
+
+def read_table_page(table_name, start_idx, end_idx):
+    """Read rows [start_idx:end_idx] of a table without parsing the whole file.
+    
+    Uses the Parquet mirror written by the generator while it is up to date,
+    otherwise a byte-offset index into the CSV. Returns (rows, total_count).
+    """
+    rows, total_count = iter_table_page(table_name, start_idx, end_idx)
+    return list(rows), total_count
+
+def _value_index(csv_path, rows, column):
+    """Map each value of a column to the ascending indices of the rows holding it"""
+    key = (csv_path, column)
+    with _CACHE_LOCK:
+        hit = _VALUE_INDEX.get(key)
+        if hit and hit[0] is rows:
+            return hit[1]
+    
+    index = {}
+    for i, row in enumerate(rows):
+        index.setdefault(row.get(column), []).append(i)
+    with _CACHE_LOCK:
+        _VALUE_INDEX[key] = (rows, index)
+    return index
+
+def read_filtered_page(table_name, filters, start_idx, end_idx):
+    """Read rows [start_idx:end_idx] of the rows matching every column=value in filters.
+    
+    Returns (rows, row_ids, total_count); row_ids are the rows' indices in the
+    full table, which is what the row endpoints expect.
+    """
+    rows = read_csv_data(table_name)
+    if not rows:
+        return [], [], 0
+    if any(column not in rows[0] for column in filters):
+        return [], [], 0
+    
+    # Look each value up in its column's index, then intersect starting from the shortest list
+    csv_path = get_csv_path(table_name)
+    candidates = sorted((_value_index(csv_path, rows, column).get(value, []) for column, value in filters.items()), key=len)
+    matches = candidates[0]
+    for other in candidates[1:]:
+        keep = set(other)
+        matches = [i for i in matches if i in keep]
+    
+    row_ids = matches[start_idx:end_idx]
+    return [rows[i] for i in row_ids], row_ids, len(matches)
+
+def filter_options(table_name):
+    """Map each column with at most FILTER_OPTION_LIMIT distinct values to those values, in first-seen order"""
+    rows = read_csv_data(table_name)
+    csv_path = get_csv_path(table_name)
+    with _CACHE_LOCK:
+        hit = _FILTER_OPTIONS.get(csv_path)
+        if hit and hit[0] is rows:
+            return hit[1]
+    
+    options = {}
+    for column in (rows[0] if rows else ()):
+        seen = {}
+        for row in rows:
+            seen[row[column]] = None
+            if len(seen) > FILTER_OPTION_LIMIT:
+                break
+        else:
+            options[column] = list(seen)
+    with _CACHE_LOCK:
+        _FILTER_OPTIONS[csv_path] = (rows, options)
+    return options
+
+def filter_args():
+    """Collect filter[column]=value query parameters; empty values don't filter"""
+    return {key[7:-1]: value for key, value in request.args.items()
+            if key.startswith('filter[') and key.endswith(']') and value}
+
+def invalidate_cache(table_name):
+    """Drop the cached rows, page index, value indexes and filter options for a table"""
+    csv_path = get_csv_path(table_name)
+    with _CACHE_LOCK:
+        _CACHE.pop(csv_path, None)
+        _INDEX.pop(csv_path, None)
+        _FILTER_OPTIONS.pop(csv_path, None)
+        for key in [key for key in _VALUE_INDEX if key[0] == csv_path]:
+            del _VALUE_INDEX[key]
 
 def write_csv_data(table_name, data):
     """Write data to CSV file"""
     csv_path = get_csv_path(table_name)
     
-    if not data:
-        # Create empty file with headers
+    try:
+        if not data:
+            # Create empty file with headers
+            with open(csv_path, 'w', newline='', encoding='utf-8') as file:
+                writer = csv.writer(file)
+                writer.writerow([])
+            return
+        
+        # Write data with headers
         with open(csv_path, 'w', newline='', encoding='utf-8') as file:
-            writer = csv.writer(file)
-            writer.writerow([])
+            fieldnames = data[0].keys()
+            writer = csv.DictWriter(file, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(data)
+    finally:
+        invalidate_cache(table_name)
+
+def append_csv_row(table_name, row):
+    """Append one row to a table's CSV without rewriting the file"""
+    csv_path = get_csv_path(table_name)
+    try:
+        with open(csv_path, 'r', newline='', encoding='utf-8') as file:
+            header = next(csv.reader(file), [])
+    except FileNotFoundError:
+        header = []
+    if not header:
+        write_csv_data(table_name, [row])
         return
     
-    # Write data with headers
-    with open(csv_path, 'w', newline='', encoding='utf-8') as file:
-        fieldnames = data[0].keys()
-        writer = csv.DictWriter(file, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(data)
+    try:
+        with open(csv_path, 'rb+') as file:
+            # Terminate a last line that lacks a newline so the row starts on its own line
+            file.seek(0, os.SEEK_END)
+            if file.tell() > 0:
+                file.seek(-1, os.SEEK_END)
+                if file.read(1) not in (b'\n', b'\r'):
+                    file.write(b'\r\n')
+        with open(csv_path, 'a', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=header)
+            writer.writerow(row)
+    finally:
+        invalidate_cache(table_name)
 
 # API Routes
 
 @app.route('/api/tables', methods=['GET'])
 def get_tables():
     """Get list of available tables"""
-    tables = []
-    for filename in os.listdir(DATA_DIR):
-        if filename.endswith('.csv'):
-            table_name = filename[:-4]  # Remove .csv extension
-            tables.append({
-                'name': table_name,
-                'file': filename,
-                'path': f"/api/tables/{table_name}"
-            })
-    return jsonify(tables)
+    mtime = os.stat(DATA_DIR).st_mtime_ns
+    if mtime != _TABLES_CACHE['mtime']:
+        tables = []
+        with os.scandir(DATA_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith('.csv'):
+                    table_name = entry.name[:-4]  # Remove .csv extension
+                    tables.append({
+                        'name': table_name,
+                        'file': entry.name,
+                        'path': f"/api/tables/{table_name}",
+                        'read_only': table_name not in _VALIDATORS
+                    })
+        _TABLES_CACHE.update(mtime=mtime, data=tables)
+    return jsonify(_TABLES_CACHE['data'])
 
 @app.route('/api/tables/<table_name>', methods=['GET'])
 def get_table_data(table_name):
-    """Get paginated data from a table"""
+    """Get paginated data from a table, optionally filtered with filter[column]=value.
+    
+    Clients that prefer application/x-ndjson get the rows streamed as by /stream.
+    """
+    if request.accept_mimetypes.best_match(['application/json', NDJSON]) == NDJSON:
+        return stream_table_data(table_name)
     try:
         # Get pagination parameters
         page = int(request.args.get('page', 1))
         per_page = int(request.args.get('per_page', 50))
+        filters = filter_args()
         
-        # Read all data
-        all_data = read_csv_data(table_name)
-        total_count = len(all_data)
-        
-        # Calculate pagination
+        # Calculate pagination and read only the requested rows
         start_idx = (page - 1) * per_page
         end_idx = start_idx + per_page
-        paginated_data = all_data[start_idx:end_idx]
+        row_ids = None
+        if filters:
+            paginated_data, row_ids, total_count = read_filtered_page(table_name, filters, start_idx, end_idx)
+        else:
+            paginated_data, total_count = read_table_page(table_name, start_idx, end_idx)
         
-        return jsonify({
+        result = {
             'table': table_name,
             'data': paginated_data,
             'count': total_count,
@@ -222,21 +557,66 @@ def get_table_data(table_name):
             'total_pages': (total_count + per_page - 1) // per_page,
             'has_next': end_idx < total_count,
             'has_prev': page > 1
-        })
+        }
+        if row_ids is not None:
+            result['row_ids'] = row_ids
+        return jsonify(result)
     except Exception as e:
         logger.error(f"Error reading table {table_name}: {e}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/tables/<table_name>/stream', methods=['GET'])
+def stream_table_data(table_name):
+    """Stream a page of a table as NDJSON, one row per line"""
+    try:
+        page = int(request.args.get('page', 1))
+        per_page = int(request.args.get('per_page', 50))
+        filters = filter_args()
+        
+        start_idx = (page - 1) * per_page
+        end_idx = start_idx + per_page
+        row_ids = None
+        if filters:
+            rows, row_ids, total_count = read_filtered_page(table_name, filters, start_idx, end_idx)
+        else:
+            rows, total_count = iter_table_page(table_name, start_idx, end_idx)
+    except Exception as e:
+        logger.error(f"Error streaming table {table_name}: {e}")
+        return jsonify({'error': str(e)}), 500
+    
+    def generate():
+        for row in rows:
+            if orjson is not None:
+                yield orjson.dumps(row) + b'\n'
+            else:
+                yield json.dumps(row) + '\n'
+    
+    response = Response(stream_with_context(generate()), mimetype=NDJSON)
+    response.headers['X-Total-Count'] = str(total_count)
+    if row_ids is not None:
+        # Filtered rows aren't contiguous, so send their table indices for edit/delete
+        response.headers['X-Row-Ids'] = ','.join(map(str, row_ids))
+    return response
+
+@app.route('/api/tables/<table_name>/filters', methods=['GET'])
+def get_filter_options(table_name):
+    """Get the distinct values of each low-cardinality column, for filter dropdowns"""
+    try:
+        return jsonify(filter_options(table_name))
+    except Exception as e:
+        logger.error(f"Error reading filter options for {table_name}: {e}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/tables/<table_name>/<int:row_id>', methods=['GET'])
 def get_row(table_name, row_id):
     """Get a specific row by index"""
     try:
-        data = read_csv_data(table_name)
-        if 0 <= row_id < len(data):
+        rows, _ = read_table_page(table_name, row_id, row_id + 1)
+        if rows:
             return jsonify({
                 'table': table_name,
                 'row_id': row_id,
-                'data': data[row_id]
+                'data': rows[0]
             })
         else:
             return jsonify({'error': 'Row not found'}), 404
@@ -247,6 +627,10 @@ def get_row(table_name, row_id):
 @app.route('/api/tables/<table_name>', methods=['POST'])
 def create_row(table_name):
     """Create a new row"""
+    read_only = read_only_error(table_name)
+    if read_only:
+        return read_only
+    
     try:
         new_data = request.get_json()
         
@@ -255,20 +639,15 @@ def create_row(table_name):
         if not is_valid:
             return jsonify({'error': 'Validation failed', 'details': errors}), 400
         
-        # Read existing data
-        data = read_csv_data(table_name)
-        
-        # Add new row
-        data.append(new_data)
-        
-        # Write back to CSV
-        write_csv_data(table_name, data)
+        # Append to the CSV; the new row's id is the current row count
+        _, row_id = read_table_page(table_name, 0, 0)
+        append_csv_row(table_name, new_data)
         
         logger.info(f"Created new row in {table_name}")
         return jsonify({
             'message': 'Row created successfully',
             'table': table_name,
-            'row_id': len(data) - 1,
+            'row_id': row_id,
             'data': new_data
         }), 201
         
@@ -279,6 +658,10 @@ def create_row(table_name):
 @app.route('/api/tables/<table_name>/<int:row_id>', methods=['PUT'])
 def update_row(table_name, row_id):
     """Update an existing row"""
+    read_only = read_only_error(table_name)
+    if read_only:
+        return read_only
+    
     try:
         updated_data = request.get_json()
         
@@ -287,8 +670,8 @@ def update_row(table_name, row_id):
         if not is_valid:
             return jsonify({'error': 'Validation failed', 'details': errors}), 400
         
-        # Read existing data
-        data = read_csv_data(table_name)
+        # Read existing data (copied, the cached list is shared)
+        data = list(read_csv_data(table_name))
         
         if 0 <= row_id < len(data):
             # Update the row
@@ -314,9 +697,13 @@ def update_row(table_name, row_id):
 @app.route('/api/tables/<table_name>/<int:row_id>', methods=['DELETE'])
 def delete_row(table_name, row_id):
     """Delete a row"""
+    read_only = read_only_error(table_name)
+    if read_only:
+        return read_only
+    
     try:
-        # Read existing data
-        data = read_csv_data(table_name)
+        # Read existing data (copied, the cached list is shared)
+        data = list(read_csv_data(table_name))
         
         if 0 <= row_id < len(data):
             # Remove the row
@@ -350,6 +737,13 @@ def get_validation_rules(table_name):
     else:
         return jsonify({'error': 'Table not found'}), 404
 
+# Viewer assets are linked with a content-hash query string, so they never change in place
+@app.route('/static/<path:filename>')
+def serve_viewer_asset(filename):
+    response = send_from_directory('../../static', filename)
+    response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
+
 # Serve static files (HTML viewer)
 @app.route('/')
 def serve_index():
@@ -0,0 +1,44 @@
+"""
+Shared helpers for the launcher scripts: opening the browser and serving until stopped
+"""
+
+import os
+import signal
+import sys
+import threading
+import webbrowser
+
+# Spawn file actions for the opener, built once: stdout and stderr to /dev/null
+if hasattr(os, "posix_spawn"):
+    DISCARD_OUTPUT = [(os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0), (os.POSIX_SPAWN_DUP2, 1, 2)]
+
+def open_browser(url):
+    """Open url in the default browser without waiting for the opener to exit"""
+    if sys.platform.startswith("linux"):
+        argv = ["xdg-open", url]
+    elif sys.platform == "darwin":
+        argv = ["open", url]
+    else:
+        return webbrowser.open(url)
+    # Spawn the platform opener directly instead of webbrowser's candidate search
+    try:
+        os.posix_spawnp(argv[0], argv, os.environ, file_actions=DISCARD_OUTPUT)
+    except OSError:  # opener not installed
+        return webbrowser.open(url)
+    return True
+
+def serve_until_signalled(server):
+    """Serve until Ctrl+C or SIGTERM, with the main thread parked in sigwait"""
+    if not hasattr(signal, "sigwait"):  # Windows
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        return
+    
+    stop_signals = {signal.SIGINT, signal.SIGTERM}
+    # Block first so the server thread and its request threads inherit the mask
+    signal.pthread_sigmask(signal.SIG_BLOCK, stop_signals)
+    # No poll timeout: the thread only wakes for connections and is never shut down
+    threading.Thread(target=server.serve_forever, args=(None,), daemon=True).start()
+    signal.sigwait(stop_signals)
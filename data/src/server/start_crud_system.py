@@ -4,45 +4,141 @@ Start CRUD System for Retail Tariff Data
 Generates data, creates CRUD viewer, and starts the server
 """
 
+import logging
+import os
 import subprocess
 import sys
-import time
-import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 from pathlib import Path
 
-def run_command(command, description):
-    """Run a command and return success status"""
-    print(f"🔄 {description}...")
+from launch_helpers import open_browser, serve_until_signalled
+
+# Resolved once so each spawn execs an absolute path with no PATH search
+PY = os.path.realpath(sys.executable)
+DATA_SCRIPT = Path("src/data_generation/Generate synthetic datasets for tariff.py").resolve()
+VIEWER_SCRIPT = Path("src/viewers/generate_crud_html_viewer.py").resolve()
+
+# What each generator writes, relative to the launcher's working directory
+DATA_OUTPUTS = [Path("retail_tariff_data") / f"{name}.csv" for name in (
+    "tariffs", "products", "sales_daily", "sales_weekly", "cost_transit", "suppliers", "markets", "fused")]
+VIEWER_OUTPUTS = [Path("../data_viewer_crud.html"), Path("../static/viewer.css")]
+
+# Spawn file action built once and shared by every child: stdout to /dev/null
+if hasattr(os, "posix_spawn"):
+    DISCARD_STDOUT = (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0)
+
+def spawn_and_wait(argv):
+    """posix_spawn argv[0] as given (no PATH lookup) with stdout discarded; return (exit code, stderr bytes)"""
+    r, w = os.pipe()
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        pid = os.posix_spawn(argv[0], argv, os.environ, file_actions=[DISCARD_STDOUT, (os.POSIX_SPAWN_DUP2, w, 2)])
+    except OSError:
+        os.close(r)
+        raise
+    finally:
+        os.close(w)
+    with open(r, "rb") as f:
+        stderr = f.read()
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status), stderr
+
+def run_command(argv, description):
+    """Run a command (argv list, no shell) and return success status"""
+    print(f"🔄 {description}...")
+    # stdout is never shown, so discard it; stderr is kept as bytes and only decoded on failure
+    if hasattr(os, "posix_spawn"):
+        returncode, stderr = spawn_and_wait(argv)
+    else:
+        result = subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        returncode, stderr = result.returncode, result.stderr
+    if returncode == 0:
         print(f"✅ {description} completed")
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ {description} failed: {e}")
-        if e.stdout:
-            print(f"Output: {e.stdout}")
-        if e.stderr:
-            print(f"Error: {e.stderr}")
+    
+    print(f"❌ {description} failed: exit status {returncode}")
+    if stderr:
+        print(f"Error: {stderr.decode(errors='replace')}")
+    return False
+
+def outputs_fresh(script, outputs):
+    """Make-style check: every output exists and is newer than the script that generates it"""
+    try:
+        built_from = script.stat().st_mtime
+        return all(output.stat().st_mtime > built_from for output in outputs)
+    except OSError:
         return False
 
+def run_generator(script, outputs, description):
+    """Run a generator script unless its outputs are already up to date"""
+    if outputs_fresh(script, outputs):
+        print(f"✅ {description} skipped (outputs up to date)")
+        return True
+    return run_command([PY, str(script)], description)
+
+DEPS_STAMP = Path(".deps_ok")
+
 def check_dependencies():
     """Check if required packages are installed"""
     print("🔍 Checking dependencies...")
     
+    # Skip the probe when it already passed since requirements.txt last changed
     try:
-        import flask
-        import flask_cors
-        print("✅ Flask dependencies found")
-        return True
-    except ImportError as e:
-        print(f"❌ Missing dependencies: {e}")
+        if DEPS_STAMP.stat().st_mtime > Path("requirements.txt").stat().st_mtime:
+            print("✅ Flask dependencies found")
+            return True
+    except OSError:
+        pass
+    
+    # find_spec locates the packages without importing (executing) them
+    missing = [name for name in ("flask", "flask_cors") if find_spec(name) is None]
+    if missing:
+        print(f"❌ Missing dependencies: {', '.join(missing)}")
         print("💡 Install with: pip install -r requirements.txt")
         return False
+    
+    print("✅ Flask dependencies found")
+    try:
+        DEPS_STAMP.touch()
+    except OSError:
+        pass
+    return True
+
+# Static console sections, each written with a single write() and flush
+STARTUP_BANNER = "\n".join([
+    "🚀 Starting Retail Tariff Data CRUD System",
+    "=" * 50,
+])
+SETUP_BANNER = "\n".join([
+    "\n🎉 CRUD System Setup Complete!",
+    "📋 Generated files:",
+    "   • retail_tariff_data/ - CSV data files",
+    "   • data_viewer_crud.html - CRUD-enabled viewer",
+    "   • crud_server.py - Backend API server",
+    "\n🌐 Starting CRUD Server...",
+    "📊 Features available:",
+    "   • Create new rows",
+    "   • Edit existing rows",
+    "   • Delete rows",
+    "   • Data validation",
+    "   • Real-time CSV updates",
+    "   • Filtering and export",
+    "\n🚀 Starting CRUD server on http://localhost:5001",
+    "💡 Press Ctrl+C to stop the server",
+])
+SHUTDOWN_BANNER = "\n".join([
+    "\n🛑 Shutting down CRUD server...",
+    "✅ Server stopped",
+])
+
+def emit(text):
+    """Write a block of console output in one call"""
+    sys.stdout.write(text + "\n")
+    sys.stdout.flush()
 
 def main():
     """Main function to start the CRUD system"""
-    print("🚀 Starting Retail Tariff Data CRUD System")
-    print("=" * 50)
+    emit(STARTUP_BANNER)
     
     # Check dependencies
     if not check_dependencies():
@@ -50,60 +146,45 @@ def main():
         print("   pip install -r requirements.txt")
         return False
     
-    # Generate synthetic data
-    if not run_command('python3 "src/data_generation/Generate synthetic datasets for tariff.py"', "Generating synthetic datasets"):
+    # Generate synthetic data and the CRUD HTML viewer concurrently;
+    # the viewer is static and doesn't read the CSVs
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        data_ok = pool.submit(run_generator, DATA_SCRIPT, DATA_OUTPUTS, "Generating synthetic datasets")
+        viewer_ok = pool.submit(run_generator, VIEWER_SCRIPT, VIEWER_OUTPUTS, "Generating CRUD HTML viewer")
+    
+    if not data_ok.result():
         print("❌ Data generation failed")
         return False
     
-    # Generate CRUD HTML viewer
-    if not run_command("python3 src/viewers/generate_crud_html_viewer.py", "Generating CRUD HTML viewer"):
+    if not viewer_ok.result():
         print("❌ CRUD viewer generation failed")
         return False
     
-    print("\n🎉 CRUD System Setup Complete!")
-    print("📋 Generated files:")
-    print("   • retail_tariff_data/ - CSV data files")
-    print("   • data_viewer_crud.html - CRUD-enabled viewer")
-    print("   • crud_server.py - Backend API server")
-    
-    print("\n🌐 Starting CRUD Server...")
-    print("📊 Features available:")
-    print("   • Create new rows")
-    print("   • Edit existing rows")
-    print("   • Delete rows")
-    print("   • Data validation")
-    print("   • Real-time CSV updates")
-    print("   • Filtering and export")
+    emit(SETUP_BANNER)
     
     # Start the CRUD server
     try:
-        print(f"\n🚀 Starting CRUD server on http://localhost:5001")
-        print("💡 Press Ctrl+C to stop the server")
-        
-        # Start server in background
-        server_process = subprocess.Popen([
-            sys.executable, "src/server/crud_server.py"
-        ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         
-        # Wait a moment for server to start
-        time.sleep(3)
+        # Run the server in this process instead of a second interpreter. It is
+        # imported only now so Flask isn't loaded during generation. make_server
+        # binds the port before returning, so no readiness wait is needed.
+        import crud_server
+        from werkzeug.serving import make_server
+        logging.getLogger("werkzeug").setLevel(logging.WARNING)
+        server = make_server("0.0.0.0", crud_server.PORT, crud_server.app, threaded=True)
         
         # Open browser
         try:
-            webbrowser.open("http://localhost:5001")
+            open_browser("http://localhost:5001")
             print("🌐 CRUD viewer opened in your browser")
         except Exception as e:
             print(f"❌ Failed to open browser: {e}")
             print("💡 Please open http://localhost:5001 manually")
         
         # Keep server running
-        try:
-            server_process.wait()
-        except KeyboardInterrupt:
-            print("\n🛑 Shutting down CRUD server...")
-            server_process.terminate()
-            server_process.wait()
-            print("✅ Server stopped")
+        serve_until_signalled(server)
+        server.server_close()
+        emit(SHUTDOWN_BANNER)
             
     except Exception as e:
         print(f"❌ Failed to start CRUD server: {e}")
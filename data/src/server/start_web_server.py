@@ -2,12 +2,27 @@
 """
 Start web server for dynamic HTML viewer
 """
+import os
 import subprocess
 import sys
-import webbrowser
 import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
+from launch_helpers import open_browser, serve_until_signalled
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    """Static file handler that doesn't log every request to the console"""
+    
+    def log_message(self, format, *args):
+        pass
+    
+    def end_headers(self):
+        # Viewer assets are linked with a content-hash query string, so they never change in place
+        if self.path.startswith("/static/"):
+            self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+        super().end_headers()
+
 def start_web_server():
     """Start web server and open dynamic viewer"""
     print("🚀 Starting web server for dynamic HTML viewer...")
@@ -20,37 +35,39 @@ def start_web_server():
     
     try:
         # Start web server
+        url = "http://localhost:5002/data_viewer_dynamic.html"
         if sys.platform == "win32":  # Windows
             server_process = subprocess.Popen(
                 ["python", "-m", "http.server", "5002"],
                 creationflags=subprocess.CREATE_NEW_CONSOLE
             )
-        else:  # macOS/Linux
-            server_process = subprocess.Popen(
-                ["python3", "-m", "http.server", "5002"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
-        
-        # Wait for server to start
-        print("⏳ Starting server...")
-        time.sleep(2)
+            
+            # Wait for server to start
+            print("⏳ Starting server...")
+            time.sleep(2)
+        else:  # macOS/Linux: serve in-process; the socket is listening once this returns
+            httpd = ThreadingHTTPServer(("", 5002), QuietHandler)
         
         # Open browser
-        url = "http://localhost:5002/data_viewer_dynamic.html"
         print(f"🌐 Opening {url}")
-        webbrowser.open(url)
+        open_browser(url)
         
         print("✅ Web server started successfully!")
         print("📊 Dynamic viewer should now load CSV data properly")
         print("💡 Press Ctrl+C to stop the server")
         
         # Keep server running
-        try:
-            server_process.wait()
-        except KeyboardInterrupt:
+        if sys.platform == "win32":
+            try:
+                server_process.wait()
+            except KeyboardInterrupt:
+                print("\n🛑 Stopping web server...")
+                server_process.terminate()
+                print("✅ Web server stopped")
+        else:
+            serve_until_signalled(httpd)
             print("\n🛑 Stopping web server...")
-            server_process.terminate()
+            httpd.server_close()
             print("✅ Web server stopped")
             
     except Exception as e:
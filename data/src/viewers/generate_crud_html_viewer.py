@@ -4,21 +4,15 @@ Generate CRUD-enabled HTML viewer for retail tariff data
 Creates an interactive data viewer with full Create, Read, Update, Delete capabilities
 """
 
+import hashlib
 import os
 import json
 from pathlib import Path
 
-def create_crud_html_viewer():
-    """Create HTML viewer with CRUD capabilities"""
-    
-    html_content = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Retail Tariff Data - CRUD Viewer</title>
-    <style>
-        * {
+# Page sections, built once at import. The stylesheet is written next to the
+# viewer as static/viewer.css so browsers cache it instead of every load
+# retransferring it inline.
+VIEWER_CSS = """        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
@@ -241,6 +235,32 @@ def create_crud_html_viewer():
             background: #f8f9fa;
         }
 
+        .table-viewport {
+            max-height: 600px;
+            overflow-y: auto;
+        }
+
+        .table-viewport .data-table th {
+            position: sticky;
+            top: 0;
+            z-index: 1;
+        }
+
+        .data-table tr.spacer td {
+            padding: 0;
+            border: none;
+        }
+
+        .data-table tr.spacer td:not(:empty) {
+            padding: 20px;
+            text-align: center;
+            color: #6c757d;
+        }
+
+        .data-table tr.spacer:hover {
+            background: none;
+        }
+
         .data-table tr.editing {
             background: #fff3cd;
         }
@@ -276,6 +296,11 @@ def create_crud_html_viewer():
             font-size: 12px;
         }
 
+        /* Tables without validation rules (e.g. the derived fused table) can't be edited */
+        .read-only #addRowBtn, .read-only .actions-col {
+            display: none;
+        }
+
         .modal {
             display: none;
             position: fixed;
@@ -401,7 +426,8 @@ def create_crud_html_viewer():
             font-weight: 600;
         }
 
-        .filter-group select {
+        .filter-group select,
+        .filter-group input {
             padding: 8px 12px;
             border: 1px solid #ddd;
             border-radius: 6px;
@@ -485,8 +511,27 @@ def create_crud_html_viewer():
                 text-align: center;
             }
         }
-    </style>
-</head>
+"""
+
+CSS_FILE = Path("static") / "viewer.css"
+# Content hash in the stylesheet URL, so the server can mark it immutable
+CSS_VERSION = hashlib.sha256(VIEWER_CSS.encode()).hexdigest()[:12]
+# Every section is defined in this file, so its bytes key the generated page.
+# The stamp sits on the line after the doctype, where main() can read it
+# without loading or hashing the whole output.
+VIEWER_STAMP = f"<!-- cfg:{hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()} -->"
+
+HEAD_HTML = f"""<!DOCTYPE html>
+{VIEWER_STAMP}
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Retail Tariff Data - CRUD Viewer</title>
+    <link rel="stylesheet" href="static/viewer.css?v={CSS_VERSION}">
+"""
+
+BODY_HTML = """</head>
 <body>
     <div class="container">
         <div class="header">
@@ -505,12 +550,17 @@ def create_crud_html_viewer():
                 </button>
             </div>
 
+            <div class="filter-group">
+                <label for="searchInput">search this page</label>
+                <input type="search" id="searchInput" placeholder="Search...">
+            </div>
+
             <div class="filters" id="filters">
                 <!-- Dynamic filters will be added here -->
             </div>
 
             <div>
-                <button class="btn btn-success" onclick="showAddModal()">
+                <button class="btn btn-success" id="addRowBtn" onclick="showAddModal()">
                     ➕ Add Row
                 </button>
                 <button class="btn btn-secondary" onclick="clearFilters()">
@@ -552,7 +602,12 @@ def create_crud_html_viewer():
             <div class="alert alert-info" id="infoAlert">
                 Select a table from the dropdown above to view and edit data.
             </div>
-            
+
+            <!-- Data table, rendered by renderTable -->
+            <div class="table-viewport" id="tableView"></div>
+            <template id="rowTpl"></template>
+            <template id="formTpl"></template>
+
             <!-- Pagination Controls -->
             <div class="pagination-controls" id="paginationControls" style="display: none;">
                 <div class="pagination-info">
@@ -597,31 +652,131 @@ def create_crud_html_viewer():
         </div>
     </div>
 
-    <script>
+"""
+
+SCRIPT_HTML = """    <script>
         // Global variables
         let currentTable = '';
         let tableData = [];
         let filteredData = [];
         let validationRules = {};
+        let readOnlyTables = new Set();  // tables the server won't accept writes to
+        let formTemplateRules = null;  // rules the form template was last built from
         let editingRowId = null;
         let currentPage = 1;
-        let perPage = 50;
+        let perPage = 500;
         let totalPages = 1;
         let totalCount = 0;
+        let loadSeq = 0;
+        let pageLoadId = null;  // loadSeq of the page load in flight, if any
+        let reconcileTimer = null;
+        const RECONCILE_MS = 30000;
+        let filterTimer = null;
+        // Filters the server applied to the loaded page, and each loaded row's index in the full table
+        let activeFilters = {};
+        let rowIds = new Map();
+        let pageRowIds = null;
+        let pageStart = 0;
+        let stringPool = new Map();
+        let filtersTable = null;  // table the filter dropdowns were built for
+        let filterOptions = null;  // server-computed dropdown values for the whole table, if available
+        // Each row's cells lowercased and joined by a unit separator, built the first time a search visits it
+        let searchText = new WeakMap();
+        // Column names of the loaded table; the array is only replaced when the
+        // columns change, so its identity tells whether the table shell is current
+        let currentHeaders = [];
+        let renderedColumns = null;
+
+        // Windowed table rendering
+        const OVERSCAN_ROWS = 10;
+        let rowHeight = 56;
+        let rowHeightMeasured = false;
+        let rowPool = [];
+        let viewportHeight = 600;
+
+        // Frame scheduler: DOM work queued during an event runs in the next
+        // animation frame, all writes first and then all reads
+        const pendingWrites = new Set();
+        const pendingReads = new Set();
+        let frameRequested = false;
 
         // API Base URL
         const API_BASE = 'http://localhost:5001/api';
 
+        // Validation rules and the table list don't change while the page is open,
+        // so each is fetched once; caching the promise also dedupes concurrent loads
+        const rulesCache = new Map();
+        let tablesPromise = null;
+
+        function getValidationRules(table) {
+            if (!rulesCache.has(table)) {
+                rulesCache.set(table, fetch(`${API_BASE}/validation-rules/${table}`).then(r => r.json()).catch(error => {
+                    rulesCache.delete(table);
+                    throw error;
+                }));
+            }
+            return rulesCache.get(table);
+        }
+
+        // Resolves to null when the options can't be loaded, so filters fall back to the page's rows
+        const filterOptionsCache = new Map();
+
+        function getFilterOptions(table) {
+            if (!filterOptionsCache.has(table)) {
+                filterOptionsCache.set(table, fetch(`${API_BASE}/tables/${table}/filters`).then(r => {
+                    if (!r.ok) throw new Error(`HTTP ${r.status}`);
+                    return r.json();
+                }).catch(error => {
+                    filterOptionsCache.delete(table);
+                    console.error('Error loading filter options:', error);
+                    return null;
+                }));
+            }
+            return filterOptionsCache.get(table);
+        }
+
+        function getTables() {
+            if (!tablesPromise) {
+                tablesPromise = fetch(`${API_BASE}/tables`).then(r => r.json()).catch(error => {
+                    tablesPromise = null;
+                    throw error;
+                });
+            }
+            return tablesPromise;
+        }
+
         // Initialize the application
-        document.addEventListener('DOMContentLoaded', function() {
-            loadTables();
+        document.addEventListener('DOMContentLoaded', async function() {
             setupEventListeners();
+            await loadTables();
+            restoreView();
         });
 
+        // Back/forward restores the view from the URL; pages seen before come from the page cache
+        window.addEventListener('popstate', restoreView);
+
+        function schedule(fn, phase = 'write') {
+            (phase === 'read' ? pendingReads : pendingWrites).add(fn);
+            if (!frameRequested) {
+                frameRequested = true;
+                requestAnimationFrame(flushFrame);
+            }
+        }
+
+        function flushFrame() {
+            frameRequested = false;
+            const writes = [...pendingWrites];
+            pendingWrites.clear();
+            writes.forEach(fn => fn());
+            const reads = [...pendingReads];
+            pendingReads.clear();
+            reads.forEach(fn => fn());
+        }
+
         function setupEventListeners() {
             document.getElementById('tableSelect').addEventListener('change', function() {
                 if (this.value) {
-                    loadTableData();
+                    loadTableData(1, {});
                 }
             });
 
@@ -629,16 +784,41 @@ def create_crud_html_viewer():
                 e.preventDefault();
                 saveRow();
             });
+
+            // Re-render the visible window at most once per frame while scrolling
+            document.getElementById('tableView').addEventListener('scroll', function() {
+                schedule(renderWindow);
+            });
+
+            // One delegated listener for every row's edit/delete buttons
+            document.getElementById('tableContainer').addEventListener('click', function(e) {
+                const button = e.target.closest('button[data-action]');
+                if (!button) return;
+                const rowId = +button.closest('tr').dataset.rowId;
+                if (button.dataset.action === 'edit') {
+                    editRow(rowId);
+                } else if (button.dataset.action === 'delete') {
+                    deleteRow(rowId);
+                }
+            });
+
+            document.getElementById('filters').addEventListener('change', function(e) {
+                if (e.target.matches('select[data-field]')) {
+                    scheduleFilter();
+                }
+            });
+
+            document.getElementById('searchInput').addEventListener('input', scheduleFilter);
         }
 
         async function loadTables() {
             try {
-                const response = await fetch(`${API_BASE}/tables`);
-                const tables = await response.json();
+                const tables = await getTables();
                 
                 const select = document.getElementById('tableSelect');
                 select.innerHTML = '<option value="">Select a table...</option>';
                 
+                readOnlyTables = new Set(tables.filter(table => table.read_only).map(table => table.name));
                 tables.forEach(table => {
                     const option = document.createElement('option');
                     option.value = table.name;
@@ -650,7 +830,46 @@ def create_crud_html_viewer():
             }
         }
 
-        async function loadTableData(page = 1) {
+        // The table, page and server filters are mirrored in the URL (?t=&p=&filter[col]=)
+        // so back/forward steps through views and a view can be shared
+        function recordView(page, filters, historyMode) {
+            const params = new URLSearchParams({ t: currentTable, p: page });
+            Object.entries(filters).forEach(([field, value]) => params.append(`filter[${field}]`, value));
+            const query = `?${params}`;
+            if (query === location.search) return;
+
+            const state = { table: currentTable, page, filters };
+            // The first view replaces the bare entry the viewer was opened with
+            if (historyMode === 'push' && location.search) {
+                history.pushState(state, '', query);
+            } else {
+                history.replaceState(state, '', query);
+            }
+        }
+
+        function restoreView() {
+            const params = new URLSearchParams(location.search);
+            const select = document.getElementById('tableSelect');
+            const table = params.get('t');
+            if (!table || ![...select.options].some(option => option.value === table)) return;
+
+            const filters = {};
+            params.forEach((value, key) => {
+                if (key.startsWith('filter[') && key.endsWith(']') && value) {
+                    filters[key.slice(7, -1)] = value;
+                }
+            });
+            select.value = table;
+            loadTableData(Math.max(1, parseInt(params.get('p'), 10) || 1), filters, 'replace');
+        }
+
+        function pageParams(page, filters) {
+            const params = new URLSearchParams({ page, per_page: perPage });
+            Object.entries(filters).forEach(([field, value]) => params.append(`filter[${field}]`, value));
+            return params;
+        }
+
+        async function loadTableData(page = 1, filters = activeFilters, historyMode = 'push') {
             const tableSelect = document.getElementById('tableSelect');
             currentTable = tableSelect.value;
             
@@ -661,138 +880,736 @@ def create_crud_html_viewer():
 
             showLoading(true);
             currentPage = page;
+            activeFilters = filters;
+            
+            const loadId = ++loadSeq;
+            pageLoadId = loadId;
+            // This load fetches fresh rows, so a pending reconciliation is moot
+            clearTimeout(reconcileTimer);
+            reconcileTimer = null;
+            const filtered = Object.keys(filters).length > 0;
+            const params = pageParams(page, filters);
             
             try {
-                // Load paginated data and validation rules in parallel
-                const [dataResponse, rulesResponse] = await Promise.all([
-                    fetch(`${API_BASE}/tables/${currentTable}?page=${page}&per_page=${perPage}`),
-                    fetch(`${API_BASE}/validation-rules/${currentTable}`)
-                ]);
-
-                const dataResult = await dataResponse.json();
-                const rulesResult = await rulesResponse.json();
-
-                if (dataResult.error) {
-                    throw new Error(dataResult.error);
+                // Load validation rules and filter options in parallel with the streamed page;
+                // read-only tables have no rules and no editing controls
+                const readOnly = readOnlyTables.has(currentTable);
+                document.body.classList.toggle('read-only', readOnly);
+                const rulesPromise = readOnly ? Promise.resolve({ rules: {} }) : getValidationRules(currentTable);
+                const optionsPromise = getFilterOptions(currentTable);
+
+                // A copy saved by an earlier visit is shown at once; the fetch below revalidates it
+                const cacheKey = `${currentTable}|${params}`;
+                const cached = await readCachedPage(cacheKey);
+                if (loadId !== loadSeq) return;
+                if (cached) {
+                    beginPage(cached.total, cached.rowIds, page);
+                    addPageRows(cached.rows);
                 }
 
-                tableData = dataResult.data;
-                filteredData = [...tableData];
-                validationRules = rulesResult.rules;
-                totalCount = dataResult.count;
-                totalPages = dataResult.total_pages;
+                // Rows are rendered as they arrive, at most once per animation frame;
+                // over a cached copy they are collected and swapped in only if changed
+                const rows = [];
+                let total = 0;
+                let idList = null;
+                await streamTablePage(`${API_BASE}/tables/${currentTable}/stream?${params}`, (count, ids) => {
+                    if (loadId !== loadSeq) return;
+                    total = count;
+                    idList = ids;
+                    if (!cached) beginPage(total, idList, page);
+                }, batch => {
+                    if (loadId !== loadSeq) return false;  // a newer load took over
+                    rows.push(...batch);
+                    if (!cached) addPageRows(batch);
+                    return true;
+                });
+                if (loadId !== loadSeq) return;
 
-                updateStatusBar();
-                renderTable();
-                createPagination();
+                if (cached && (total !== cached.total || idList !== cached.rowIds || !samePageRows(rows, cached.rows))) {
+                    beginPage(total, idList, page);
+                    addPageRows(rows);
+                }
+                writeCachedPage(cacheKey, { total, rowIds: idList, rows });
+
+                recordView(page, filters, historyMode);
+                validationRules = (await rulesPromise).rules;
+                filterOptions = await optionsPromise;
+                if (loadId !== loadSeq) return;
+                schedule(updateStatusBar);
+                if (tableData.length === 0 && !filtered) {
+                    currentHeaders = [];
+                    schedule(renderTable);
+                }
                 
-                if (page === 1) {
-                    createFilters();
+                // Filter dropdowns are built for a new table or an unfiltered first page
+                // and kept while filtering, so the other options stay selectable
+                if ((page === 1 && !filtered) || filtersTable !== currentTable) {
+                    schedule(createFilters);
+                } else {
+                    schedule(syncFilterSelects);
+                }
+                if (document.getElementById('searchInput').value.trim()) {
+                    schedule(filterRows);  // re-apply the search box to the new page
+                }
+                if (page === 1 && !filtered) {
                     showAlert('success', `Loaded ${totalCount} records from ${currentTable} (showing page ${page})`);
+                } else if (page === 1) {
+                    showAlert('success', `Found ${totalCount} matching records in ${currentTable}`);
                 }
                 
             } catch (error) {
                 showAlert('error', 'Failed to load data: ' + error.message);
                 console.error('Error loading data:', error);
             } finally {
+                if (pageLoadId === loadId) pageLoadId = null;
                 showLoading(false);
             }
         }
 
+        // Saved edits are applied to the loaded page in place instead of refetching it;
+        // RECONCILE_MS after the last edit the page is quietly refetched and swapped in
+        // only if the server's copy differs (e.g. a row slid in after a delete)
+        function pageIndexOf(rowId) {
+            return tableData.findIndex(row => rowIds.get(row) === rowId);
+        }
+
+        // A saved row in the shape the stream returns: every column, as strings
+        function pageRow(data) {
+            const row = {};
+            currentHeaders.forEach(header => {
+                row[header] = String(data[header] ?? '');
+            });
+            return row;
+        }
+
+        function applyLocalUpdate(rowId, data) {
+            const index = pageIndexOf(rowId);
+            if (index < 0) return;
+            const oldRow = tableData[index];
+            const row = pageRow(data);
+            tableData[index] = row;
+            if (filteredData !== tableData) {
+                const i = filteredData.indexOf(oldRow);
+                if (i >= 0) filteredData[i] = row;
+            }
+            rowIds.delete(oldRow);
+            rowIds.set(row, rowId);
+            afterLocalChange();
+        }
+
+        function applyLocalInsert(rowId, data) {
+            // Outside the server filters the new row doesn't change this view
+            const matches = Object.entries(activeFilters).every(([field, value]) => String(data[field] ?? '') === value);
+            if (!matches) return;
+
+            // The row is appended to the table, so it is the last match; it is shown
+            // only when that position falls on the loaded page
+            totalCount++;
+            totalPages = Math.ceil(totalCount / perPage);
+            if (totalCount - 1 >= pageStart && totalCount - 1 < pageStart + perPage) {
+                const row = pageRow(data);
+                tableData.push(row);
+                if (filteredData !== tableData) filteredData.push(row);
+                rowIds.set(row, rowId);
+            }
+            afterLocalChange();
+        }
+
+        function applyLocalDelete(rowId) {
+            const index = pageIndexOf(rowId);
+            if (index >= 0) {
+                const row = tableData[index];
+                tableData.splice(index, 1);
+                if (filteredData !== tableData) {
+                    const i = filteredData.indexOf(row);
+                    if (i >= 0) filteredData.splice(i, 1);
+                }
+                rowIds.delete(row);
+            }
+            // Every later row moves up one place in the table
+            rowIds.forEach((id, row) => {
+                if (id > rowId) rowIds.set(row, id - 1);
+            });
+            totalCount--;
+            totalPages = Math.ceil(totalCount / perPage);
+            afterLocalChange();
+        }
+
+        function afterLocalChange() {
+            schedule(createPagination);
+            schedule(updateStatusBar);
+            schedule(renderWindow);
+            clearTimeout(reconcileTimer);
+            reconcileTimer = setTimeout(reconcilePage, RECONCILE_MS);
+        }
+
+        async function reconcilePage() {
+            reconcileTimer = null;
+            if (!currentTable || pageLoadId !== null) return;
+
+            const loadId = loadSeq;
+            const page = currentPage;
+            const params = pageParams(page, activeFilters);
+            const cacheKey = `${currentTable}|${params}`;
+            const rows = [];
+            let total = 0;
+            let idList = null;
+            try {
+                await streamTablePage(`${API_BASE}/tables/${currentTable}/stream?${params}`, (count, ids) => {
+                    total = count;
+                    idList = ids;
+                }, batch => {
+                    if (loadId !== loadSeq) return false;
+                    rows.push(...batch);
+                    return true;
+                });
+            } catch (error) {
+                console.error('Error reconciling page:', error);
+                return;
+            }
+            if (loadId !== loadSeq) return;  // a newer load took over and fetched fresh rows
+            writeCachedPage(cacheKey, { total, rowIds: idList, rows });
+
+            const localIds = tableData.map(row => rowIds.get(row)).join(',');
+            const serverIds = idList ?? rows.map((_, k) => pageStart + k).join(',');
+            if (total !== totalCount || serverIds !== localIds || !samePageRows(rows, tableData)) {
+                beginPage(total, idList, page);
+                addPageRows(rows);
+                if (document.getElementById('searchInput').value.trim()) {
+                    schedule(filterRows);
+                }
+            }
+        }
+
+        // Reset the page state for a page of `total` matching rows
+        function beginPage(total, idList, page) {
+            totalCount = total;
+            totalPages = Math.ceil(totalCount / perPage);
+            tableData = [];
+            filteredData = tableData;
+            rowIds = new Map();
+            // Filtered pages list their rows' table indices; plain pages are contiguous
+            pageRowIds = idList ? idList.split(',').map(Number) : null;
+            pageStart = (page - 1) * perPage;
+            stringPool = new Map();
+            schedule(createPagination);
+        }
+
+        function addPageRows(batch) {
+            if (batch.length === 0) return;
+            const first = tableData.length === 0;
+            if (first) {
+                const keys = Object.keys(batch[0]);
+                if (keys.join(',') !== currentHeaders.join(',')) {
+                    currentHeaders = keys;
+                }
+            }
+            for (let k = 0, n = tableData.length; k < batch.length; k++, n++) {
+                const row = batch[k];
+                rowIds.set(row, pageRowIds ? pageRowIds[n] : pageStart + n);
+                // Share one string per distinct cell value; category-like columns repeat a lot
+                for (const key in row) {
+                    const value = row[key];
+                    const pooled = stringPool.get(value);
+                    if (pooled === undefined) {
+                        stringPool.set(value, value);
+                    } else {
+                        row[key] = pooled;
+                    }
+                }
+            }
+            tableData.push(...batch);
+            schedule(first ? renderTable : renderWindow);
+            schedule(updateStatusBar);
+        }
+
+        function samePageRows(a, b) {
+            if (a.length !== b.length) return false;
+            if (a.length && Object.keys(a[0]).length !== Object.keys(b[0]).length) return false;
+            for (let i = 0; i < a.length; i++) {
+                const x = a[i];
+                const y = b[i];
+                for (const key in x) {
+                    if (x[key] !== y[key]) return false;
+                }
+            }
+            return true;
+        }
+
+        // Persistent page cache: the most recently loaded pages are kept in IndexedDB,
+        // keyed by "table|query"; without IndexedDB every load goes to the network
+        const PAGE_CACHE_LIMIT = 50;
+        let pageCachePromise = null;
+
+        function openPageCache() {
+            if (!pageCachePromise) {
+                pageCachePromise = new Promise(resolve => {
+                    if (!window.indexedDB) {
+                        resolve(null);
+                        return;
+                    }
+                    const request = indexedDB.open('tariff-crud-viewer', 1);
+                    request.onupgradeneeded = () => {
+                        request.result.createObjectStore('pages').createIndex('savedAt', 'savedAt');
+                    };
+                    request.onsuccess = () => resolve(request.result);
+                    request.onerror = () => resolve(null);
+                });
+            }
+            return pageCachePromise;
+        }
+
+        function idbRequest(request) {
+            return new Promise((resolve, reject) => {
+                request.onsuccess = () => resolve(request.result);
+                request.onerror = () => reject(request.error);
+            });
+        }
+
+        async function readCachedPage(key) {
+            const db = await openPageCache();
+            if (!db) return null;
+            try {
+                return (await idbRequest(db.transaction('pages').objectStore('pages').get(key))) || null;
+            } catch (error) {
+                return null;
+            }
+        }
+
+        async function writeCachedPage(key, page) {
+            const db = await openPageCache();
+            if (!db) return;
+            try {
+                const store = db.transaction('pages', 'readwrite').objectStore('pages');
+                store.put({ ...page, savedAt: Date.now() }, key);
+
+                // Evict the oldest pages beyond the limit
+                let excess = (await idbRequest(store.count())) - PAGE_CACHE_LIMIT;
+                if (excess > 0) {
+                    const cursorRequest = store.index('savedAt').openKeyCursor();
+                    cursorRequest.onsuccess = () => {
+                        const cursor = cursorRequest.result;
+                        if (cursor && excess-- > 0) {
+                            store.delete(cursor.primaryKey);
+                            cursor.continue();
+                        }
+                    };
+                }
+            } catch (error) {
+                console.error('Error caching page:', error);
+            }
+        }
+
+        // Forget every cached page and the filter options of a table after it was changed
+        async function dropCachedTable(table) {
+            filterOptionsCache.delete(table);
+            const db = await openPageCache();
+            if (!db) return;
+            try {
+                const tx = db.transaction('pages', 'readwrite');
+                tx.objectStore('pages').delete(IDBKeyRange.bound(`${table}|`, `${table}|\\uffff`));
+                await new Promise(resolve => {
+                    tx.oncomplete = tx.onerror = tx.onabort = resolve;
+                });
+            } catch (error) {
+                console.error('Error clearing cached pages:', error);
+            }
+        }
+
+        // Fetch and NDJSON parsing run in a worker so a large page doesn't block
+        // clicks and scrolling; the main thread only receives parsed row batches
+        let rowsWorker = null;
+        let rowsRequestId = 0;
+        let finishRowsRequest = null;
+
+        function streamTablePage(url, onStart, onRows) {
+            if (!window.Worker) {
+                return streamTablePageInline(url, onStart, onRows);
+            }
+            if (!rowsWorker) {
+                const source = `${readNdjson}; (${rowsWorkerMain})();`;
+                rowsWorker = new Worker(URL.createObjectURL(new Blob([source], { type: 'text/javascript' })));
+            }
+            if (finishRowsRequest) {
+                finishRowsRequest();  // superseded by this request
+            }
+
+            const id = ++rowsRequestId;
+            return new Promise((resolve, reject) => {
+                const finish = error => {
+                    rowsWorker.removeEventListener('message', onMessage);
+                    finishRowsRequest = null;
+                    error ? reject(error) : resolve();
+                };
+                const onMessage = e => {
+                    const msg = e.data;
+                    if (msg.id !== id) return;
+                    if (msg.type === 'start') onStart(msg.total, msg.rowIds);
+                    else if (msg.type === 'rows') onRows(msg.rows);
+                    else if (msg.type === 'done') finish();
+                    else finish(new Error(msg.message));
+                };
+                finishRowsRequest = () => finish();
+                rowsWorker.addEventListener('message', onMessage);
+                rowsWorker.postMessage({ id, url });
+            });
+        }
+
+        // Without a worker, a newer load aborts the previous fetch here instead
+        let inlineController = null;
+
+        async function streamTablePageInline(url, onStart, onRows) {
+            if (inlineController) {
+                inlineController.abort();
+            }
+            const controller = new AbortController();
+            inlineController = controller;
+
+            try {
+                const response = await fetch(url, { headers: { Accept: 'application/x-ndjson' }, signal: controller.signal });
+                if (!response.ok) {
+                    const result = await response.json();
+                    throw new Error(result.error || response.statusText);
+                }
+                onStart(parseInt(response.headers.get('X-Total-Count'), 10) || 0, response.headers.get('X-Row-Ids'));
+                await readNdjson(response, onRows);
+            } catch (error) {
+                if (error.name !== 'AbortError') throw error;  // aborted: a newer load took over
+            } finally {
+                if (inlineController === controller) {
+                    inlineController = null;
+                }
+            }
+        }
+
+        // Body of the rows worker; it is started from this function's source
+        // together with readNdjson, so nothing else from the page is in scope
+        function rowsWorkerMain() {
+            let controller = null;
+            self.onmessage = async e => {
+                const { id, url } = e.data;
+                if (controller) controller.abort();
+                controller = new AbortController();
+                try {
+                    const response = await fetch(url, { headers: { Accept: 'application/x-ndjson' }, signal: controller.signal });
+                    if (!response.ok) {
+                        const result = await response.json().catch(() => ({}));
+                        self.postMessage({ id, type: 'error', message: result.error || response.statusText });
+                        return;
+                    }
+                    self.postMessage({
+                        id,
+                        type: 'start',
+                        total: parseInt(response.headers.get('X-Total-Count'), 10) || 0,
+                        rowIds: response.headers.get('X-Row-Ids')
+                    });
+                    await readNdjson(response, rows => self.postMessage({ id, type: 'rows', rows }));
+                    self.postMessage({ id, type: 'done' });
+                } catch (error) {
+                    if (error.name !== 'AbortError') {
+                        self.postMessage({ id, type: 'error', message: error.message });
+                    }
+                }
+            };
+        }
+
+        // Read an NDJSON body, passing each chunk's parsed rows to onRows;
+        // onRows returns false to stop reading
+        async function readNdjson(response, onRows) {
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+            while (true) {
+                const { value, done } = await reader.read();
+                if (done) break;
+                buffer += decoder.decode(value, { stream: true });
+                const lines = buffer.split('\\n');
+                buffer = lines.pop();
+                const batch = [];
+                for (const line of lines) {
+                    if (line) batch.push(JSON.parse(line));
+                }
+                if (batch.length && onRows(batch) === false) {
+                    reader.cancel();
+                    return;
+                }
+            }
+            buffer += decoder.decode();
+            if (buffer.trim()) {
+                onRows([JSON.parse(buffer)]);
+            }
+        }
+
         function renderTable() {
-            const container = document.getElementById('tableContainer');
-            
-            if (filteredData.length === 0) {
-                container.innerHTML = '<div class="alert alert-info">No data to display.</div>';
+            const view = document.getElementById('tableView');
+
+            // An empty page has no columns to show; an empty filter result keeps the shell
+            if (currentHeaders.length === 0) {
+                view.innerHTML = '<div class="alert alert-info">No data to display.</div>';
+                renderedColumns = null;
                 return;
             }
 
-            const headers = Object.keys(filteredData[0]);
-            
-            let html = `
-                <table class="data-table">
-                    <thead>
-                        <tr>
-                            ${headers.map(header => `<th>${header.replace(/_/g, ' ').toUpperCase()}</th>`).join('')}
-                            <th>Actions</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-            `;
-
-            filteredData.forEach((row, index) => {
-                // Calculate global row ID for pagination
-                const globalRowId = (currentPage - 1) * perPage + index;
-                html += `
-                    <tr data-row-id="${globalRowId}">
-                        ${headers.map(header => `
-                            <td>
-                                <span class="cell-content" data-field="${header}">${row[header] || ''}</span>
-                            </td>
-                        `).join('')}
-                        <td>
-                            <div class="action-buttons">
-                                <button class="btn btn-primary" onclick="editRow(${globalRowId})" title="Edit">
-                                    ✏️
-                                </button>
-                                <button class="btn btn-danger" onclick="deleteRow(${globalRowId})" title="Delete">
-                                    🗑️
-                                </button>
-                            </div>
-                        </td>
-                    </tr>
-                `;
+            prepareTable(currentHeaders);
+            view.scrollTop = 0;
+            renderWindow();
+        }
+
+        // Only the rows inside the scroll viewport (plus overscan) exist in the DOM;
+        // spacer rows above and below stand in for the rest to keep the scrollbar honest
+        function renderWindow() {
+            const view = document.getElementById('tableView');
+            const tbody = document.getElementById('dataBody');
+            if (!tbody) return;
+
+            const headers = renderedColumns;
+            const visibleRows = Math.ceil(viewportHeight / rowHeight) + 2 * OVERSCAN_ROWS;
+            const start = Math.max(0, Math.floor(view.scrollTop / rowHeight) - OVERSCAN_ROWS);
+            const end = Math.min(filteredData.length, start + visibleRows);
+            const count = end - start;
+
+            // Grow or shrink the set of pooled rows attached between the spacers
+            const tpl = document.getElementById('rowTpl').content.firstElementChild;
+            const bottomSpacer = tbody.lastElementChild;
+            while (rowPool.length < count) {
+                rowPool.push(tpl.cloneNode(true));
+            }
+            const attached = tbody.children.length - 2;
+            for (let k = attached; k < count; k++) {
+                tbody.insertBefore(rowPool[k], bottomSpacer);
+            }
+            for (let k = attached - 1; k >= count; k--) {
+                rowPool[k].remove();
+            }
+
+            // Recycle the pooled rows: rewrite their text for the current window
+            for (let k = 0; k < count; k++) {
+                const i = start + k;
+                const row = filteredData[i];
+                const tr = rowPool[k];
+                // The row's index in the full table, which the row endpoints take
+                tr.dataset.rowId = rowIds.get(row);
+                for (let j = 0; j < headers.length; j++) {
+                    tr.children[j].firstChild.textContent = row[headers[j]] || '';
+                }
+            }
+
+            tbody.firstElementChild.style.height = `${start * rowHeight}px`;
+            bottomSpacer.style.height = `${(filteredData.length - end) * rowHeight}px`;
+            bottomSpacer.firstElementChild.textContent = filteredData.length ? '' : 'No rows match the current filters.';
+
+            if (!rowHeightMeasured && count > 0) {
+                schedule(measureTable, 'read');
+            }
+        }
+
+        // Read phase: measure the viewport and real row height once per table shell,
+        // and re-render the window in the next frame if the estimate was off
+        function measureTable() {
+            const view = document.getElementById('tableView');
+            const first = rowPool[0];
+            if (!first || !first.isConnected) return;
+
+            const measuredRow = first.offsetHeight;
+            const measuredViewport = view.clientHeight;
+            rowHeightMeasured = true;
+            if ((measuredRow && measuredRow !== rowHeight) || (measuredViewport && measuredViewport !== viewportHeight)) {
+                rowHeight = measuredRow || rowHeight;
+                viewportHeight = measuredViewport || viewportHeight;
+                schedule(renderWindow);
+            }
+        }
+
+        // Build the table shell and the <tr> template only when the columns change
+        function prepareTable(headers) {
+            const view = document.getElementById('tableView');
+            if (headers === renderedColumns) {
+                return document.getElementById('dataBody');
+            }
+
+            // Column names come from the CSV header, so they are only ever set as text
+            const table = document.createElement('table');
+            table.className = 'data-table';
+            const headRow = table.createTHead().insertRow();
+            headers.forEach(header => {
+                const th = document.createElement('th');
+                th.textContent = header.replace(/_/g, ' ').toUpperCase();
+                headRow.appendChild(th);
             });
+            const actionsTh = document.createElement('th');
+            actionsTh.textContent = 'Actions';
+            actionsTh.className = 'actions-col';
+            headRow.appendChild(actionsTh);
+
+            const tbody = table.createTBody();
+            tbody.id = 'dataBody';
+            for (let k = 0; k < 2; k++) {
+                const spacer = tbody.insertRow();
+                spacer.className = 'spacer';
+                spacer.insertCell().colSpan = headers.length + 1;
+            }
+            view.replaceChildren(table);
 
-            html += '</tbody></table>';
-            container.innerHTML = html;
+            const rowTemplate = document.createElement('tr');
+            headers.forEach(header => {
+                const span = document.createElement('span');
+                span.className = 'cell-content';
+                span.dataset.field = header;
+                rowTemplate.insertCell().appendChild(span);
+            });
+            const actionsCell = rowTemplate.insertCell();
+            actionsCell.className = 'actions-col';
+            actionsCell.innerHTML = '<div class="action-buttons"><button class="btn btn-primary" data-action="edit" title="Edit">✏️</button><button class="btn btn-danger" data-action="delete" title="Delete">🗑️</button></div>';
+            document.getElementById('rowTpl').content.replaceChildren(rowTemplate);
+            renderedColumns = headers;
+            rowPool = [];
+            rowHeightMeasured = false;
+            return tbody;
+        }
+
+        function createOption(value, text = value) {
+            const option = document.createElement('option');
+            option.value = value;
+            option.textContent = text;
+            return option;
+        }
+
+        // Collect distinct values for every column of the loaded page in one pass; a column
+        // stops collecting once it passes 20 values since it won't get a filter
+        function collectPageValues(headers) {
+            const valueSets = headers.map(() => new Set());
+            for (let i = 0; i < tableData.length; i++) {
+                const row = tableData[i];
+                for (let j = 0; j < headers.length; j++) {
+                    const values = valueSets[j];
+                    if (values.size <= 20) {
+                        values.add(row[headers[j]]);
+                    }
+                }
+            }
+            return valueSets;
         }
 
         function createFilters() {
             const filtersContainer = document.getElementById('filters');
             filtersContainer.innerHTML = '';
+            filtersTable = currentTable;
 
             if (tableData.length === 0) return;
 
-            const headers = Object.keys(tableData[0]);
+            const headers = currentHeaders;
+
+            // The server's per-table option lists cover every row; it leaves out columns with
+            // more than 20 values, which only keep a dropdown for their active filter
+            const valueSets = filterOptions
+                ? headers.map(header => new Set(filterOptions[header] ?? (header in activeFilters ? [activeFilters[header]] : null)))
+                : collectPageValues(headers);
             
-            headers.forEach(header => {
-                const uniqueValues = [...new Set(tableData.map(row => row[header]))].slice(0, 20);
+            headers.forEach((header, j) => {
+                const uniqueValues = Array.from(valueSets[j]);
                 
-                if (uniqueValues.length > 1 && uniqueValues.length <= 20) {
+                // A column with an active filter keeps its dropdown so it can be cleared
+                if ((uniqueValues.length > 1 || header in activeFilters) && uniqueValues.length <= 20) {
                     const filterGroup = document.createElement('div');
                     filterGroup.className = 'filter-group';
                     
-                    filterGroup.innerHTML = `
-                        <label>${header.replace(/_/g, ' ')}</label>
-                        <select onchange="applyFilters()" data-field="${header}">
-                            <option value="">All</option>
-                            ${uniqueValues.map(value => `
-                                <option value="${value}">${value}</option>
-                            `).join('')}
-                        </select>
-                    `;
+                    const label = document.createElement('label');
+                    label.textContent = header.replace(/_/g, ' ');
+                    const select = document.createElement('select');
+                    select.dataset.field = header;
+                    select.appendChild(createOption('', 'All'));
+                    uniqueValues.forEach(value => select.appendChild(createOption(value)));
+                    select.value = activeFilters[header] || '';
+                    filterGroup.append(label, select);
                     
                     filtersContainer.appendChild(filterGroup);
                 }
             });
         }
 
-        function applyFilters() {
-            const filterSelects = document.querySelectorAll('#filters select');
-            filteredData = [...tableData];
+        function syncFilterSelects() {
+            document.querySelectorAll('#filters select').forEach(select => {
+                select.value = activeFilters[select.dataset.field] || '';
+            });
+        }
 
-            filterSelects.forEach(select => {
-                const field = select.dataset.field;
-                const value = select.value;
-                
-                if (value) {
-                    filteredData = filteredData.filter(row => row[field] == value);
+        // Coalesce a burst of filter changes into one filter + render pass
+        function scheduleFilter() {
+            clearTimeout(filterTimer);
+            filterTimer = setTimeout(applyFilters, 60);
+        }
+
+        function collectFilterState() {
+            const filters = {};
+            document.querySelectorAll('#filters select').forEach(select => {
+                if (select.value) {
+                    filters[select.dataset.field] = select.value;
                 }
             });
+            return filters;
+        }
+
+        function applyFilters() {
+            const filters = collectFilterState();
+
+            // Dropdown filters run locally only when the page holds the whole unfiltered
+            // table; otherwise the server filters every row and pages the matches
+            if (totalPages > 1 || Object.keys(activeFilters).length > 0) {
+                if (!sameFilters(filters, activeFilters)) {
+                    loadTableData(1, filters);
+                    return;
+                }
+                filterRows();
+                return;
+            }
+            filterRows(filters);
+            recordView(currentPage, filters, 'push');
+        }
+
+        function sameFilters(a, b) {
+            const keys = Object.keys(a);
+            return keys.length === Object.keys(b).length && keys.every(key => a[key] === b[key]);
+        }
+
+        // Local pass over the loaded page: dropdown filters the server didn't apply, then the search box
+        function filterRows(filters = {}) {
+            const active = Object.entries(filters);
+            const query = document.getElementById('searchInput').value.trim().toLowerCase();
+
+            // Plain loops and string comparison: no per-row callback or == coercion
+            const out = [];
+            for (let i = 0, n = tableData.length; i < n; i++) {
+                const row = tableData[i];
+                let keep = true;
+                for (let k = 0; k < active.length; k++) {
+                    const [field, value] = active[k];
+                    if (String(row[field]) !== value) {
+                        keep = false;
+                        break;
+                    }
+                }
+                if (keep && query && !rowSearchText(row).includes(query)) {
+                    keep = false;
+                }
+                if (keep) out.push(row);
+            }
+            filteredData = out;
+
+            schedule(updateStatusBar);
+            schedule(renderTable);
+        }
 
-            updateStatusBar();
-            renderTable();
+        function rowSearchText(row) {
+            let text = searchText.get(row);
+            if (text === undefined) {
+                text = '';
+                for (let j = 0; j < currentHeaders.length; j++) {
+                    text += '\\x1f' + (row[currentHeaders[j]] ?? '');
+                }
+                text = text.toLowerCase();
+                searchText.set(row, text);
+            }
+            return text;
         }
 
         function clearFilters() {
@@ -800,10 +1617,16 @@ def create_crud_html_viewer():
             filterSelects.forEach(select => {
                 select.value = '';
             });
+            document.getElementById('searchInput').value = '';
             
+            if (Object.keys(activeFilters).length > 0) {
+                loadTableData(1, {});
+                return;
+            }
             filteredData = [...tableData];
-            updateStatusBar();
-            renderTable();
+            recordView(currentPage, {}, 'push');
+            schedule(updateStatusBar);
+            schedule(renderTable);
         }
 
         function updateStatusBar() {
@@ -856,6 +1679,10 @@ def create_crud_html_viewer():
                 showAlert('error', 'Please select a table first.');
                 return;
             }
+            if (readOnlyTables.has(currentTable)) {
+                showAlert('error', `${currentTable} is read-only.`);
+                return;
+            }
 
             editingRowId = null;
             document.getElementById('modalTitle').textContent = 'Add New Row';
@@ -866,10 +1693,10 @@ def create_crud_html_viewer():
         }
 
         function editRow(rowId) {
-            if (!currentTable) return;
+            if (!currentTable || readOnlyTables.has(currentTable)) return;
 
             editingRowId = rowId;
-            const rowData = tableData[rowId];
+            const rowData = tableData.find(row => rowIds.get(row) === rowId);
             
             document.getElementById('modalTitle').textContent = 'Edit Row';
             document.getElementById('submitBtn').textContent = 'Update';
@@ -878,57 +1705,66 @@ def create_crud_html_viewer():
             document.getElementById('addModal').classList.add('show');
         }
 
-        function createFormFields(data = {}) {
-            const container = document.getElementById('formFields');
-            container.innerHTML = '';
+        // Rules are fixed per table, so the empty form is built once into #formTpl
+        // and each modal open clones it and fills in the values
+        function buildFormTemplate() {
+            const fragment = document.getElementById('formTpl').content;
+            fragment.replaceChildren();
 
             Object.keys(validationRules).forEach(field => {
                 const rule = validationRules[field];
-                const value = data[field] || '';
                 
                 const formGroup = document.createElement('div');
                 formGroup.className = 'form-group';
                 
-                let inputHtml = '';
+                const label = document.createElement('label');
+                label.htmlFor = field;
+                label.textContent = field.replace(/_/g, ' ').toUpperCase() + (rule.required ? ' *' : '');
+
+                let input;
                 if (rule.type === 'string' && rule.choices) {
                     // Dropdown for choices
-                    inputHtml = `
-                        <select name="${field}" required="${rule.required}">
-                            <option value="">Select...</option>
-                            ${rule.choices.map(choice => `
-                                <option value="${choice}" ${value === choice ? 'selected' : ''}>${choice}</option>
-                            `).join('')}
-                        </select>
-                    `;
+                    input = document.createElement('select');
+                    input.appendChild(createOption('', 'Select...'));
+                    rule.choices.forEach(choice => input.appendChild(createOption(choice)));
                 } else {
                     // Text input
-                    const inputType = rule.type === 'email' ? 'email' : 
-                                    rule.type === 'integer' ? 'number' : 
-                                    rule.type === 'float' ? 'number' : 'text';
-                    
-                    inputHtml = `
-                        <input type="${inputType}" 
-                               name="${field}" 
-                               value="${value}"
-                               ${rule.required ? 'required' : ''}
-                               ${rule.min !== undefined ? `min="${rule.min}"` : ''}
-                               ${rule.max !== undefined ? `max="${rule.max}"` : ''}
-                               ${rule.max_length ? `maxlength="${rule.max_length}"` : ''}
-                               step="${rule.type === 'float' ? '0.01' : '1'}">
-                    `;
+                    input = document.createElement('input');
+                    input.type = rule.type === 'email' ? 'email' : 
+                                 rule.type === 'integer' ? 'number' : 
+                                 rule.type === 'float' ? 'number' : 'text';
+                    if (rule.min !== undefined) input.min = rule.min;
+                    if (rule.max !== undefined) input.max = rule.max;
+                    if (rule.max_length) input.maxLength = rule.max_length;
+                    input.step = rule.type === 'float' ? '0.01' : '1';
                 }
+                input.name = field;
+                input.required = !!rule.required;
+
+                const error = document.createElement('div');
+                error.className = 'error';
+                error.id = `error-${field}`;
+
+                formGroup.append(label, input, error);
                 
-                formGroup.innerHTML = `
-                    <label for="${field}">
-                        ${field.replace(/_/g, ' ').toUpperCase()}
-                        ${rule.required ? ' *' : ''}
-                    </label>
-                    ${inputHtml}
-                    <div class="error" id="error-${field}"></div>
-                `;
-                
-                container.appendChild(formGroup);
+                fragment.appendChild(formGroup);
             });
+            formTemplateRules = validationRules;
+        }
+
+        function createFormFields(data = {}) {
+            if (formTemplateRules !== validationRules) {
+                buildFormTemplate();
+            }
+
+            const fields = document.getElementById('formTpl').content.cloneNode(true);
+            fields.querySelectorAll('[name]').forEach(control => {
+                control.value = data[control.name] || '';
+                if (control.selectedIndex === -1) {
+                    control.selectedIndex = 0;  // value isn't one of the choices
+                }
+            });
+            document.getElementById('formFields').replaceChildren(fields);
         }
 
         async function saveRow() {
@@ -939,11 +1775,12 @@ def create_crud_html_viewer():
             // Clear previous errors
             document.querySelectorAll('.error').forEach(el => el.textContent = '');
 
+            const rowId = editingRowId;
             try {
                 let response;
-                if (editingRowId !== null) {
+                if (rowId !== null) {
                     // Update existing row
-                    response = await fetch(`${API_BASE}/tables/${currentTable}/${editingRowId}`, {
+                    response = await fetch(`${API_BASE}/tables/${currentTable}/${rowId}`, {
                         method: 'PUT',
                         headers: {
                             'Content-Type': 'application/json',
@@ -965,7 +1802,15 @@ def create_crud_html_viewer():
 
                 if (response.ok) {
                     hideAddModal();
-                    loadTableData(); // Reload data
+                    // Other cached pages may have shifted; this one is updated in place
+                    await dropCachedTable(currentTable);
+                    if (currentHeaders.length === 0) {
+                        loadTableData(currentPage, activeFilters, 'replace');  // no columns to place the row in yet
+                    } else if (rowId !== null) {
+                        applyLocalUpdate(rowId, result.data);
+                    } else {
+                        applyLocalInsert(result.row_id, result.data);
+                    }
                     showAlert('success', result.message);
                 } else {
                     if (result.details) {
@@ -987,6 +1832,7 @@ def create_crud_html_viewer():
         }
 
         async function deleteRow(rowId) {
+            if (readOnlyTables.has(currentTable)) return;
             if (!confirm('Are you sure you want to delete this row?')) {
                 return;
             }
@@ -999,7 +1845,8 @@ def create_crud_html_viewer():
                 const result = await response.json();
 
                 if (response.ok) {
-                    loadTableData(); // Reload data
+                    await dropCachedTable(currentTable);
+                    applyLocalDelete(rowId);
                     showAlert('success', result.message);
                 } else {
                     showAlert('error', result.error);
@@ -1033,29 +1880,89 @@ def create_crud_html_viewer():
             alert.textContent = message;
         }
 
-        function exportData() {
+        const EXPORT_CHUNK_ROWS = 1000;
+
+        // Quote a field only when it holds a quote, comma or line break, or has
+        // leading/trailing whitespace that a trimming reader would drop
+        function csvField(value) {
+            if (value.indexOf('"') >= 0) {
+                return `"${value.replaceAll('"', '""')}"`;
+            }
+            const last = value.length - 1;
+            if (value.indexOf(',') >= 0 || value.indexOf('\\n') >= 0 || value.indexOf('\\r') >= 0 ||
+                (last >= 0 && (value[0] <= ' ' || value[last] <= ' '))) {
+                return `"${value}"`;
+            }
+            return value;
+        }
+
+        // The Blob is assembled from encoded chunks of EXPORT_CHUNK_ROWS lines, so
+        // the whole CSV never exists as one string next to its Blob copy. Like
+        // rowsWorkerMain, this also runs from its source inside a worker.
+        function buildCsvBlob(headers, rows) {
+            const encoder = new TextEncoder();
+            const parts = [encoder.encode(headers.map(csvField).join(',') + '\\n')];
+            const cells = new Array(headers.length);
+            let chunk = [];
+            for (let i = 0; i < rows.length; i++) {
+                const row = rows[i];
+                for (let j = 0; j < headers.length; j++) {
+                    cells[j] = csvField(String(row[headers[j]] ?? ''));
+                }
+                chunk.push(cells.join(','));
+                if (chunk.length === EXPORT_CHUNK_ROWS) {
+                    parts.push(encoder.encode(chunk.join('\\n') + '\\n'));
+                    chunk = [];
+                }
+            }
+            if (chunk.length) {
+                parts.push(encoder.encode(chunk.join('\\n') + '\\n'));
+            }
+            return new Blob(parts, { type: 'text/csv' });
+        }
+
+        // Build the CSV in a one-shot worker so escaping a large table doesn't
+        // freeze the page; the rows are structured-cloned and the Blob comes back
+        function buildCsvBlobInWorker(headers, rows) {
+            const source = `const EXPORT_CHUNK_ROWS = ${EXPORT_CHUNK_ROWS}; ${csvField}; ${buildCsvBlob};
+                self.onmessage = e => self.postMessage(buildCsvBlob(e.data.headers, e.data.rows));`;
+            const url = URL.createObjectURL(new Blob([source], { type: 'text/javascript' }));
+            const worker = new Worker(url);
+            return new Promise((resolve, reject) => {
+                worker.onmessage = e => resolve(e.data);
+                worker.onerror = e => reject(new Error(e.message));
+                worker.postMessage({ headers, rows });
+            }).finally(() => {
+                worker.terminate();
+                URL.revokeObjectURL(url);
+            });
+        }
+
+        async function exportData() {
             if (filteredData.length === 0) {
                 showAlert('error', 'No data to export.');
                 return;
             }
 
-            const headers = Object.keys(filteredData[0]);
-            const csvContent = [
-                headers.join(','),
-                ...filteredData.map(row => 
-                    headers.map(header => `"${(row[header] || '').toString().replace(/"/g, '""')}"`).join(',')
-                )
-            ].join('\\n');
+            const headers = currentHeaders;
+            const rows = filteredData;
+            const table = currentTable;
+            let blob;
+            try {
+                blob = window.Worker ? await buildCsvBlobInWorker(headers, rows) : buildCsvBlob(headers, rows);
+            } catch (error) {
+                showAlert('error', 'Failed to export: ' + error.message);
+                return;
+            }
 
-            const blob = new Blob([csvContent], { type: 'text/csv' });
             const url = window.URL.createObjectURL(blob);
             const a = document.createElement('a');
             a.href = url;
-            a.download = `${currentTable}_export.csv`;
+            a.download = `${table}_export.csv`;
             a.click();
             window.URL.revokeObjectURL(url);
 
-            showAlert('success', `Exported ${filteredData.length} records to CSV.`);
+            showAlert('success', `Exported ${rows.length} records to CSV.`);
         }
 
         // Close modal when clicking outside
@@ -1068,20 +1975,51 @@ def create_crud_html_viewer():
 </body>
 </html>"""
 
-    return html_content
+def create_crud_html_viewer(out):
+    """Write the HTML viewer with CRUD capabilities to an open text file, section by section"""
+    out.writelines((HEAD_HTML, BODY_HTML, SCRIPT_HTML))
+
+def write_if_changed(path, text):
+    """Write text to path unless the file already holds exactly that content; return True if written"""
+    new = text.encode('utf-8')
+    try:
+        unchanged = hashlib.sha256(path.read_bytes()).digest() == hashlib.sha256(new).digest()
+    except OSError:  # not generated yet
+        unchanged = False
+    if unchanged:
+        return False
+    path.write_bytes(new)
+    return True
+
+def read_stamp(path):
+    """Return the config stamp line of a generated viewer, or None if there is no file"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            f.readline()  # doctype
+            return f.readline().rstrip('\n')
+    except OSError:
+        return None
 
 def main():
     """Generate the CRUD HTML viewer"""
     print("🚀 Generating CRUD-enabled HTML viewer...")
     
-    html_content = create_crud_html_viewer()
+    # Write to file; unchanged outputs are left alone so their mtimes stay accurate.
+    # A matching stamp means the page was generated from this exact source; any
+    # other stamp means the content differs, so the sections are written as-is.
+    output_file = Path("../data_viewer_crud.html")
+    html_written = read_stamp(output_file) != VIEWER_STAMP
+    if html_written:
+        with open(output_file, 'w', encoding='utf-8', newline='', buffering=1 << 16) as f:
+            create_crud_html_viewer(f)
     
-    # Write to file
-    output_file = "../data_viewer_crud.html"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # The stylesheet goes next to the viewer, where its relative link points
+    css_file = output_file.parent / CSS_FILE
+    css_file.parent.mkdir(exist_ok=True)
+    css_written = write_if_changed(css_file, VIEWER_CSS)
     
-    print(f"✅ CRUD HTML viewer generated: {output_file}")
+    print(f"✅ CRUD HTML viewer {'generated' if html_written else 'unchanged'}: {output_file}")
+    print(f"✅ Stylesheet {'generated' if css_written else 'unchanged'}: {css_file}")
     print("📋 Features included:")
     print("   • Full CRUD operations (Create, Read, Update, Delete)")
     print("   • Inline editing with validation")
@@ -4,212 +4,182 @@ Generate dynamic HTML viewer that loads CSV data at runtime
 """
 import pandas as pd
 import os
+import gzip
+import hashlib
+import json
 from pathlib import Path
 
-def generate_dynamic_html_viewer():
-    """Generate HTML viewer that dynamically loads CSV data"""
-    
-    # Data files to process
-    data_files = [
-        {'id': 'tariffs', 'name': 'Tariffs', 'file': 'tariffs.csv', 'icon': '📈'},
-        {'id': 'products', 'name': 'Products', 'file': 'products.csv', 'icon': '🛍️'},
-        {'id': 'suppliers', 'name': 'Suppliers', 'file': 'suppliers.csv', 'icon': '🏭'},
-        {'id': 'markets', 'name': 'Markets', 'file': 'markets.csv', 'icon': '🌍'},
-        {'id': 'cost-transit', 'name': 'Cost & Transit', 'file': 'cost_transit.csv', 'icon': '🚚'},
-        {'id': 'sales-daily', 'name': 'Sales Daily', 'file': 'sales_daily.csv', 'icon': '📅'},
-        {'id': 'sales-weekly', 'name': 'Sales Weekly', 'file': 'sales_weekly.csv', 'icon': '📊'}
-    ]
-    
-    # Generate complete HTML
-    html_content = generate_dynamic_html_template(data_files)
-    
-    # Save HTML file
-    output_file = "../data_viewer_dynamic.html"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
-    
-    print(f"🎉 Dynamic HTML viewer generated: {output_file}")
-    print(f"📊 Data files: {len(data_files)}")
-    print("💡 This version loads CSV data dynamically at runtime")
-    
-    return output_file
+try:
+    import brotli
+except ImportError:  # only .gz copies are written
+    brotli = None
 
-def generate_dynamic_html_template(data_files):
-    """Generate HTML template with dynamic data loading"""
-    
-    # Create data files configuration for JavaScript
-    data_files_js = str(data_files).replace("'", '"')
-    
-    html_template = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Retail Tariff Data Viewer - Dynamic</title>
-    <style>
-        body {{
+# Page sections, built once at import. The stylesheet and script are written to
+# static/ next to the viewer so browsers cache them across loads; only the data
+# file list and filter options are spliced into the page when it is written.
+STYLE_CSS = """        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             margin: 0;
             padding: 20px;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
             background: white;
             border-radius: 15px;
             box-shadow: 0 20px 40px rgba(0,0,0,0.1);
             overflow: hidden;
-        }}
+        }
         
-        .header {{
+        .header {
             background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%);
             color: white;
             padding: 30px;
             text-align: center;
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             margin: 0;
             font-size: 2.5em;
             font-weight: 300;
-        }}
+        }
         
-        .header p {{
+        .header p {
             margin: 10px 0 0 0;
             opacity: 0.8;
             font-size: 1.1em;
-        }}
+        }
         
-        .content {{
+        .content {
             padding: 30px;
-        }}
+        }
         
-        .stats {{
+        .stats {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             margin-bottom: 30px;
-        }}
+        }
         
-        .stat-card {{
+        .stat-card {
             background: linear-gradient(135deg, #74b9ff 0%, #0984e3 100%);
             color: white;
             padding: 20px;
             border-radius: 10px;
             text-align: center;
             box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .stat-number {{
+        .stat-number {
             font-size: 2em;
             font-weight: bold;
             margin-bottom: 5px;
-        }}
+        }
         
-        .stat-label {{
+        .stat-label {
             font-size: 0.9em;
             opacity: 0.9;
-        }}
+        }
         
-        .toc {{
+        .toc {
             background: #f8f9fa;
             padding: 20px;
             border-radius: 10px;
             margin-bottom: 30px;
-        }}
+        }
         
-        .toc h3 {{
+        .toc h3 {
             margin-top: 0;
             color: #2c3e50;
-        }}
+        }
         
-        .toc ul {{
+        .toc ul {
             list-style: none;
             padding: 0;
-        }}
+        }
         
-        .toc li {{
+        .toc li {
             margin: 8px 0;
-        }}
+        }
         
-        .toc a {{
+        .toc a {
             color: #3498db;
             text-decoration: none;
             padding: 5px 10px;
             border-radius: 5px;
             transition: background-color 0.2s;
-        }}
+        }
         
-        .toc a:hover {{
+        .toc a:hover {
             background-color: #e3f2fd;
-        }}
+        }
         
-        .table-section {{
+        .table-section {
             margin-bottom: 40px;
             border: 1px solid #e0e0e0;
             border-radius: 10px;
             overflow: hidden;
             box-shadow: 0 5px 15px rgba(0,0,0,0.08);
-        }}
+        }
         
-        .table-header {{
+        .table-header {
             background: linear-gradient(135deg, #3498db 0%, #2980b9 100%);
             color: white;
             padding: 20px;
             font-size: 1.3em;
             font-weight: 600;
-        }}
+        }
         
-        .table-filters {{
+        .table-filters {
             background: #f8f9fa;
             padding: 20px;
             border-bottom: 1px solid #e0e0e0;
-        }}
+        }
         
-        .filters-container {{
+        .filters-container {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 15px;
             align-items: end;
-        }}
+        }
         
-        .filter-group {{
+        .filter-group {
             display: flex;
             flex-direction: column;
             gap: 5px;
-        }}
+        }
         
-        .filter-group label {{
+        .filter-group label {
             font-weight: 600;
             color: #495057;
             font-size: 0.9em;
-        }}
+        }
         
-        .filter-select {{
+        .filter-select {
             padding: 8px 12px;
             border: 1px solid #ced4da;
             border-radius: 5px;
             background: white;
             font-size: 0.9em;
             transition: border-color 0.2s;
-        }}
+        }
         
-        .filter-select:focus {{
+        .filter-select:focus {
             outline: none;
             border-color: #3498db;
             box-shadow: 0 0 0 2px rgba(52, 152, 219, 0.2);
-        }}
+        }
         
-        .filter-actions {{
+        .filter-actions {
             display: flex;
             gap: 10px;
             align-items: end;
-        }}
+        }
         
-        .clear-filters, .export-csv {{
+        .clear-filters, .export-csv {
             padding: 8px 16px;
             border: none;
             border-radius: 5px;
@@ -217,39 +187,39 @@ def generate_dynamic_html_template(data_files):
             font-size: 0.9em;
             font-weight: 600;
             transition: all 0.2s;
-        }}
+        }
         
-        .clear-filters {{
+        .clear-filters {
             background: #6c757d;
             color: white;
-        }}
+        }
         
-        .clear-filters:hover {{
+        .clear-filters:hover {
             background: #5a6268;
-        }}
+        }
         
-        .export-csv {{
+        .export-csv {
             background: #28a745;
             color: white;
-        }}
+        }
         
-        .export-csv:hover {{
+        .export-csv:hover {
             background: #218838;
-        }}
+        }
         
-        .table-content {{
+        .table-content {
             overflow-x: auto;
             max-height: 500px;
             overflow-y: auto;
-        }}
+        }
         
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
             font-size: 0.9em;
-        }}
+        }
         
-        th {{
+        th {
             background: #f8f9fa;
             color: #495057;
             padding: 12px 8px;
@@ -259,38 +229,47 @@ def generate_dynamic_html_template(data_files):
             position: sticky;
             top: 0;
             z-index: 10;
-        }}
+        }
         
-        td {{
+        td {
             padding: 10px 8px;
             border-bottom: 1px solid #dee2e6;
-        }}
+        }
         
-        tr:nth-child(even) {{
+        tr.even {
             background-color: #f8f9fa;
-        }}
+        }
+        
+        tr.spacer td {
+            padding: 0;
+            border: none;
+        }
         
-        tr:hover {{
+        tr:hover {
             background-color: #e3f2fd;
             transition: background-color 0.2s;
-        }}
+        }
         
-        .loading {{
+        .loading {
             text-align: center;
             padding: 40px;
             color: #666;
-        }}
+        }
         
-        .error {{
+        .error {
             background: #ffebee;
             color: #c62828;
             padding: 20px;
             border-radius: 10px;
             margin: 20px 0;
             border-left: 4px solid #c62828;
-        }}
+        }
         
-        .refresh-btn {{
+        tr.hidden {
+            display: none;
+        }
+        
+        .refresh-btn {
             background: #17a2b8;
             color: white;
             border: none;
@@ -299,169 +278,350 @@ def generate_dynamic_html_template(data_files):
             cursor: pointer;
             font-size: 1em;
             margin-bottom: 20px;
-        }}
+        }
         
-        .refresh-btn:hover {{
+        .refresh-btn:hover {
             background: #138496;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>📊 Retail Tariff Data Viewer - Dynamic</h1>
-            <p>Real-time data loading from CSV files with interactive filtering</p>
-        </div>
+        }
         
-        <div class="content">
-            <button class="refresh-btn" onclick="loadAllData()">🔄 Refresh Data</button>
-            
-            <div class="stats" id="stats">
-                <div class="stat-card">
-                    <div class="stat-number" id="total-records">-</div>
-                    <div class="stat-label">Total Records</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-number" id="total-tables">-</div>
-                    <div class="stat-label">Data Tables</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-number" id="last-updated">-</div>
-                    <div class="stat-label">Last Updated</div>
-                </div>
-            </div>
-            
-            <div class="toc">
-                <h3>📋 Table of Contents</h3>
-                <ul id="toc-list">
-                    <li><a href="#tariffs">📈 Tariffs</a></li>
-                    <li><a href="#products">🛍️ Products</a></li>
-                    <li><a href="#suppliers">🏭 Suppliers</a></li>
-                    <li><a href="#markets">🌍 Markets</a></li>
-                    <li><a href="#cost-transit">🚚 Cost & Transit</a></li>
-                    <li><a href="#sales-daily">📅 Sales Daily</a></li>
-                    <li><a href="#sales-weekly">📊 Sales Weekly</a></li>
-                </ul>
-            </div>
-            
-            <div id="data-container">
-                <div class="loading">Loading data from CSV files...</div>
-            </div>
-        </div>
-    </div>
+        .refresh-btn:disabled {
+            opacity: 0.6;
+            cursor: wait;
+        }
+"""
 
-    <script>
-        // Data files configuration
-        const dataFiles = {data_files_js};
-        
-        let totalRecords = 0;
+SCRIPT_JS = """        let totalRecords = 0;
         let loadedTables = 0;
-        let tableData = {{}};
+        let tableData = {};
 
-        // Function to parse CSV
-        function parseCSV(csvText) {{
-            const lines = csvText.trim().split('\\n');
-            const headers = lines[0].split(',');
-            const data = [];
-            
-            for (let i = 1; i < lines.length; i++) {{
-                const values = lines[i].split(',');
-                const row = {{}};
-                headers.forEach((header, index) => {{
-                    row[header.trim()] = values[index] ? values[index].trim() : '';
-                }});
-                data.push(row);
-            }}
-            
-            return {{ headers, data }};
-        }}
-
-        // Function to create table HTML with filters
-        function createTableHTML(id, name, icon, headers, data) {{
-            const tableId = `table-${{id}}`;
-            const maxRows = 100; // Limit display to first 100 rows for performance
-            const displayData = data.slice(0, maxRows);
-            
-            // Create filter inputs
-            const filterInputs = headers.map(col => {{
-                const uniqueVals = [...new Set(data.map(row => row[col]))].slice(0, 20);
+        // Quote-aware CSV parser fed straight from the response stream. Each decoded
+        // chunk is scanned once, copying plain runs with slice(); quoted fields may hold
+        // commas, newlines and "" escapes. Yields the records completed in each chunk.
+        const QUOTE = 34, COMMA = 44, LF = 10, CR = 13;
+
+        async function* parseCSVStream(body) {
+            const reader = body.pipeThrough(new TextDecoderStream()).getReader();
+            let record = [];
+            let field = '';
+            let fieldStart = true;  // nothing read for the current field yet
+            let quoted = false;     // inside a quoted field
+            let quoteSeen = false;  // just read a quote inside a quoted field
+
+            const endField = () => {
+                record.push(field);
+                field = '';
+                fieldStart = true;
+            };
+            const endRecord = records => {
+                if (field.charCodeAt(field.length - 1) === CR) {
+                    field = field.slice(0, -1);
+                }
+                endField();
+                if (record.length > 1 || record[0] !== '') {  // skip blank lines
+                    records.push(record);
+                }
+                record = [];
+            };
+            // Chunks with no quotes (most of them) can't open or escape a field, so
+            // they're split by jumping between delimiters with native indexOf
+            // instead of testing every character; returns where the tail starts
+            const scanPlain = (chunk, records) => {
+                let start = 0;
+                let comma = chunk.indexOf(',');
+                let lf = chunk.indexOf('\\n');
+                while (comma >= 0 || lf >= 0) {
+                    if (comma >= 0 && (lf < 0 || comma < lf)) {
+                        field += chunk.slice(start, comma);
+                        endField();
+                        start = comma + 1;
+                        comma = chunk.indexOf(',', start);
+                    } else {
+                        field += chunk.slice(start, lf);
+                        endRecord(records);
+                        start = lf + 1;
+                        lf = chunk.indexOf('\\n', start);
+                    }
+                }
+                if (start < chunk.length) {
+                    fieldStart = false;
+                }
+                return start;
+            };
+
+            for (;;) {
+                const { value: chunk, done } = await reader.read();
+                if (done) break;
+
+                const records = [];
+                const plain = !quoted && !quoteSeen && chunk.indexOf('"') < 0;
+                let start = plain ? scanPlain(chunk, records) : 0;
+                for (let i = plain ? chunk.length : 0; i < chunk.length; i++) {
+                    const c = chunk.charCodeAt(i);
+                    if (quoted) {
+                        if (c === QUOTE) {
+                            field += chunk.slice(start, i);
+                            quoted = false;
+                            quoteSeen = true;
+                            start = i + 1;
+                        }
+                        continue;
+                    }
+                    if (quoteSeen) {
+                        quoteSeen = false;
+                        if (c === QUOTE) {  // "" inside quotes is a literal quote
+                            field += '"';
+                            quoted = true;
+                            start = i + 1;
+                            continue;
+                        }
+                    }
+                    if (c === COMMA) {
+                        field += chunk.slice(start, i);
+                        endField();
+                        start = i + 1;
+                    } else if (c === LF) {
+                        field += chunk.slice(start, i);
+                        endRecord(records);
+                        start = i + 1;
+                    } else if (c === QUOTE && fieldStart) {
+                        quoted = true;
+                        fieldStart = false;
+                        start = i + 1;
+                    } else {
+                        fieldStart = false;
+                    }
+                }
+                field += chunk.slice(start);
+                if (records.length) {
+                    yield records;
+                }
+            }
+
+            if (field !== '' || record.length) {
+                const records = [];
+                endRecord(records);
+                if (records.length) {
+                    yield records;
+                }
+            }
+        }
+
+        function createElement(tag, className = '', text) {
+            const el = document.createElement(tag);
+            if (className) el.className = className;
+            if (text !== undefined) el.textContent = text;
+            return el;
+        }
+
+        function createOption(value, text = value) {
+            const option = document.createElement('option');
+            option.value = value;
+            option.textContent = text;
+            return option;
+        }
+
+        // Windowed table body: only the rows around the viewport exist as <tr>
+        // nodes, recycled from a fixed pool as the container scrolls
+        const POOL_SIZE = 40;
+        const OVERSCAN = 10;
+        const ROW_HEIGHT_ESTIMATE = 37;
+
+        class VirtualTable {
+            constructor(scroller, tbody, columns, rowCount) {
+                this.scroller = scroller;
+                this.tbody = tbody;
+                this.columns = columns;
+                this.indexes = Array.from({ length: rowCount }, (_, i) => i);
+                this.rowHeight = 0;
+                this.pool = [];
+                this.frame = 0;
+
+                this.topSpacer = this.createSpacer();
+                this.bottomSpacer = this.createSpacer();
+                tbody.append(this.topSpacer, this.bottomSpacer);
+                scroller.addEventListener('scroll', () => this.scheduleRender(), { passive: true });
+                this.render();
+            }
+
+            createSpacer() {
+                const tr = createElement('tr', 'spacer');
+                const td = document.createElement('td');
+                td.colSpan = Math.max(this.columns.length, 1);
+                tr.appendChild(td);
+                return tr;
+            }
+
+            // Show only the given row positions, e.g. the rows matching the filters
+            setRows(indexes) {
+                this.indexes = indexes;
+                this.scroller.scrollTop = 0;
+                this.render();
+            }
+
+            scheduleRender() {
+                if (this.frame) return;
+                this.frame = requestAnimationFrame(() => {
+                    this.frame = 0;
+                    this.render();
+                });
+            }
+
+            render() {
+                const total = this.indexes.length;
+                // Rows only have a height once the table is attached, so measure lazily
+                if (!this.rowHeight && this.pool.length && this.pool[0].offsetHeight) {
+                    this.rowHeight = this.pool[0].offsetHeight;
+                }
+                const rowHeight = this.rowHeight || ROW_HEIGHT_ESTIMATE;
+                const first = Math.max(0, Math.min(
+                    Math.floor(this.scroller.scrollTop / rowHeight) - OVERSCAN, total - POOL_SIZE));
+                const count = Math.min(POOL_SIZE, total - first);
+
+                while (this.pool.length < count) {
+                    const tr = document.createElement('tr');
+                    this.columns.forEach(() => tr.appendChild(document.createElement('td')));
+                    this.tbody.insertBefore(tr, this.bottomSpacer);
+                    this.pool.push(tr);
+                }
+                this.pool.forEach((tr, k) => {
+                    tr.classList.toggle('hidden', k >= count);
+                    if (k >= count) return;
+                    const row = this.indexes[first + k];
+                    tr.classList.toggle('even', (first + k) % 2 === 1);
+                    for (let c = 0; c < this.columns.length; c++) {
+                        tr.cells[c].textContent = this.columns[c][row];
+                    }
+                });
+
+                this.topSpacer.firstChild.style.height = `${first * rowHeight}px`;
+                this.bottomSpacer.firstChild.style.height = `${(total - first - count) * rowHeight}px`;
+            }
+        }
+
+        // Function to create a table section with filters
+        function createTableSection(id, name, icon) {
+            const { headers, columns, rowCount } = tableData[id];
+            const section = createElement('div', 'table-section');
+            section.id = id;
+            section.appendChild(createElement('div', 'table-header', `${icon} ${name} (${rowCount} records)`));
+
+            // Create filter selects
+            const filtersContainer = createElement('div', 'filters-container');
+            headers.forEach((col, c) => {
+                const uniqueVals = PRECOMPUTED_FILTERS[id]?.[col] ?? Array.from(new Set(columns[c]), String).slice(0, 20);
                 const sortedVals = uniqueVals.sort();
-                
-                return `
-                    <div class="filter-group">
-                        <label for="filter-${{id}}-${{col}}">${{col}}:</label>
-                        <select id="filter-${{id}}-${{col}}" class="filter-select" data-table="${{id}}" data-column="${{col}}">
-                            <option value="">All</option>
-                            ${{sortedVals.map(val => `<option value="${{val}}">${{val}}</option>`).join('')}}
-                        </select>
-                    </div>
-                `;
-            }}).join('');
-            
-            let tableHTML = `
-                <div class="table-section" id="${{id}}">
-                    <div class="table-header">
-                        ${{icon}} ${{name}} (${{data.length}} records${{data.length > maxRows ? `, showing first ${{maxRows}}` : ''}})
-                    </div>
-                    <div class="table-filters">
-                        <div class="filters-container">
-                            ${{filterInputs}}
-                            <div class="filter-actions">
-                                <button class="clear-filters" data-table="${{id}}">Clear All</button>
-                                <button class="export-csv" data-table="${{id}}">Export CSV</button>
-                            </div>
-                        </div>
-                    </div>
-                    <div class="table-content">
-                        <table id="${{tableId}}">
-                            <thead>
-                                <tr>
-                                    ${{headers.map(header => `<th>${{header}}</th>`).join('')}}
-                                </tr>
-                            </thead>
-                            <tbody>
-                                ${{displayData.map(row => 
-                                    `<tr>${{headers.map(header => `<td>${{row[header] || ''}}</td>`).join('')}}</tr>`
-                                ).join('')}}
-                            </tbody>
-                        </table>
-                    </div>
-                </div>
-            `;
-            
-            return tableHTML;
-        }}
+
+                const group = createElement('div', 'filter-group');
+                const label = createElement('label', '', `${col}:`);
+                label.htmlFor = `filter-${id}-${col}`;
+                const select = createElement('select', 'filter-select');
+                select.id = label.htmlFor;
+                select.dataset.table = id;
+                select.dataset.column = col;
+                select.appendChild(createOption('', 'All'));
+                sortedVals.forEach(val => select.appendChild(createOption(val)));
+                group.append(label, select);
+                filtersContainer.appendChild(group);
+            });
+
+            const actions = createElement('div', 'filter-actions');
+            const clearButton = createElement('button', 'clear-filters', 'Clear All');
+            clearButton.dataset.table = id;
+            const exportButton = createElement('button', 'export-csv', 'Export CSV');
+            exportButton.dataset.table = id;
+            actions.append(clearButton, exportButton);
+            filtersContainer.appendChild(actions);
+
+            const filters = createElement('div', 'table-filters');
+            filters.appendChild(filtersContainer);
+
+            const table = document.createElement('table');
+            table.id = `table-${id}`;
+            const headRow = table.createTHead().insertRow();
+            headers.forEach(header => headRow.appendChild(createElement('th', '', header)));
+
+            const content = createElement('div', 'table-content');
+            content.appendChild(table);
+            tableData[id].vtable = new VirtualTable(content, table.createTBody(), columns, rowCount);
+            section.append(filters, content);
+            return section;
+        }
+
+        // A column whose every value is a finite number that prints back unchanged
+        // is stored as a typed array, so rendering and export show the same text;
+        // any other column stays an array of strings
+        function packColumn(values) {
+            if (!values.length || !values.every(value => {
+                const number = Number(value);
+                return Number.isFinite(number) && String(number) === value;
+            })) {
+                return values;
+            }
+            const numbers = Float64Array.from(values, Number);
+            const isInt32 = numbers.every(number => number === (number | 0));
+            return isInt32 ? Int32Array.from(numbers) : numbers;
+        }
+
+        // Lowercased copy of a text column for filtering; numbers print in lowercase
+        // already, and a column with nothing to lowercase is shared rather than copied
+        function lowerColumn(column) {
+            if (ArrayBuffer.isView(column)) return column;
+            const lowered = column.map(value => value.toLowerCase());
+            return lowered.every((value, i) => value === column[i]) ? column : lowered;
+        }
 
         // Function to load data file
-        async function loadDataFile(fileInfo) {{
-            try {{
-                const response = await fetch(`retail_tariff_data/${{fileInfo.file}}`);
-                if (!response.ok) {{
-                    throw new Error(`HTTP error! status: ${{response.status}}`);
-                }}
-                const csvText = await response.text();
-                const {{ headers, data }} = parseCSV(csvText);
+        async function loadDataFile(fileInfo) {
+            try {
+                const response = await fetch(`retail_tariff_data/${fileInfo.file}`);
+                if (!response.ok) {
+                    throw new Error(`HTTP error! status: ${response.status}`);
+                }
+                // Rows are parsed as the download arrives, without holding the raw text,
+                // and stored column by column rather than as one object per row
+                let headers = null;
+                let columns = [];
+                for await (const records of parseCSVStream(response.body)) {
+                    for (const values of records) {
+                        if (!headers) {
+                            headers = values.map(header => header.trim());
+                            columns = headers.map(() => []);
+                            continue;
+                        }
+                        for (let j = 0; j < headers.length; j++) {
+                            columns[j].push(values[j] ?? '');
+                        }
+                    }
+                }
+                headers = headers || [];
+                const rowCount = columns.length ? columns[0].length : 0;
+                columns = columns.map(packColumn);
                 
-                // Store data for filtering
-                tableData[fileInfo.id] = {{ headers, data }};
+                // Store data for filtering, with each column's cell index and the text
+                // cells lowercased once so filtering only compares normalized strings
+                const colIndex = Object.fromEntries(headers.map((header, i) => [header, i]));
+                const lower = columns.map(lowerColumn);
+                tableData[fileInfo.id] = { headers, columns, rowCount, colIndex, lower };
                 
-                totalRecords += data.length;
+                totalRecords += rowCount;
                 loadedTables++;
                 
-                return createTableHTML(fileInfo.id, fileInfo.name, fileInfo.icon, headers, data);
-            }} catch (error) {{
-                console.error(`Error loading ${{fileInfo.file}}:`, error);
+                return createTableSection(fileInfo.id, fileInfo.name, fileInfo.icon);
+            } catch (error) {
+                console.error(`Error loading ${fileInfo.file}:`, error);
                 
                 // Check if it's a CORS error
                 const isCorsError = error.message.includes('CORS') || 
                                   error.message.includes('Cross-Origin') ||
                                   error.message.includes('Failed to fetch');
                 
-                if (isCorsError) {{
-                    return `
-                        <div class="table-section" id="${{fileInfo.id}}">
+                const section = createElement('div', 'table-section');
+                section.id = fileInfo.id;
+                if (isCorsError) {
+                    // Static help text; only the configured table icon and name are interpolated
+                    section.innerHTML = `
                             <div class="table-header">
-                                ${{fileInfo.icon}} ${{fileInfo.name}} - CORS Error
+                                ${fileInfo.icon} ${fileInfo.name} - CORS Error
                             </div>
                             <div class="error">
                                 <h4>🚫 CORS Error Detected</h4>
@@ -473,160 +633,396 @@ def generate_dynamic_html_template(data_files):
                                     <li><strong>Use Update Script:</strong> Run <code>python3 update_data.py</code> to open with web server</li>
                                 </ol>
                             </div>
-                        </div>
                     `;
-                }} else {{
-                    return `
-                        <div class="table-section" id="${{fileInfo.id}}">
-                            <div class="table-header">
-                                ${{fileInfo.icon}} ${{fileInfo.name}}
-                            </div>
-                            <div class="error">
-                                Error loading ${{fileInfo.file}}: ${{error.message}}
-                            </div>
-                        </div>
-                    `;
-                }}
-            }}
-        }}
+                } else {
+                    section.append(
+                        createElement('div', 'table-header', `${fileInfo.icon} ${fileInfo.name}`),
+                        createElement('div', 'error', `Error loading ${fileInfo.file}: ${error.message}`)
+                    );
+                }
+                return section;
+            }
+        }
 
         // Filter functionality
-        function filterTable(tableId) {{
-            const table = document.getElementById(`table-${{tableId}}`);
-            const rows = table.querySelectorAll('tbody tr');
-            const filters = document.querySelectorAll(`[data-table="${{tableId}}"]`);
+        function filterTable(tableId) {
+            const { rowCount, colIndex, lower, vtable } = tableData[tableId];
             
-            rows.forEach(row => {{
-                let showRow = true;
-                
-                filters.forEach(filter => {{
-                    if (filter.value) {{
-                        const column = filter.dataset.column;
-                        const filterValue = filter.value.toLowerCase();
-                        const cellValue = row.querySelector(`td:nth-child(${{Array.from(table.querySelectorAll('th')).findIndex(th => th.textContent.trim() === column) + 1}})`)?.textContent.toLowerCase();
-                        
-                        if (!cellValue || !cellValue.includes(filterValue)) {{
-                            showRow = false;
-                        }}
-                    }}
-                }});
+            // Resolve the active filters to (lowercased column, value) pairs once per call
+            const activeFilters = [];
+            document.querySelectorAll(`.filter-select[data-table="${tableId}"]`).forEach(filter => {
+                if (filter.value) {
+                    activeFilters.push([lower[colIndex[filter.dataset.column]], filter.value.toLowerCase()]);
+                }
+            });
+            
+            const indexes = [];
+            for (let i = 0; i < rowCount; i++) {
+                const showRow = activeFilters.every(([column, filterValue]) =>
+                    String(column[i]).includes(filterValue));
                 
-                row.style.display = showRow ? '' : 'none';
-            }});
+                if (showRow) indexes.push(i);
+            }
+            vtable.setRows(indexes);
             
             // Update visible row count
             updateVisibleCount(tableId);
-        }}
+        }
         
-        function updateVisibleCount(tableId) {{
-            const table = document.getElementById(`table-${{tableId}}`);
-            const visibleRows = table.querySelectorAll('tbody tr:not([style*="display: none"])');
-            const header = document.querySelector(`#${{tableId}} .table-header`);
+        function updateVisibleCount(tableId) {
+            const visibleRows = tableData[tableId].vtable.indexes.length;
+            const header = document.querySelector(`#${tableId} .table-header`);
             const originalText = header.textContent;
             const baseText = originalText.split(' (')[0];
-            header.textContent = `${{baseText}} (${{visibleRows.length}} visible rows)`;
-        }}
+            header.textContent = `${baseText} (${visibleRows.toLocaleString()} visible rows)`;
+        }
         
-        function clearFilters(tableId) {{
-            const filters = document.querySelectorAll(`[data-table="${{tableId}}"]`);
-            filters.forEach(filter => {{
+        function clearFilters(tableId) {
+            const filters = document.querySelectorAll(`[data-table="${tableId}"]`);
+            filters.forEach(filter => {
                 filter.value = '';
-            }});
+            });
             filterTable(tableId);
-        }}
+        }
         
-        function exportTableToCSV(tableId) {{
-            const table = document.getElementById(`table-${{tableId}}`);
-            const rows = Array.from(table.querySelectorAll('tr'));
-            
-            const csvContent = rows.map(row => {{
-                const cells = Array.from(row.querySelectorAll('th, td'));
-                return cells.map(cell => `"${{cell.textContent.replace(/"/g, '""')}}"`).join(',');
-            }}).join('\\n');
+        // Quote a field only when it holds a quote, comma or line break, or has
+        // leading/trailing whitespace that a trimming reader would drop
+        function csvField(value) {
+            if (value.indexOf('"') >= 0) {
+                return `"${value.replaceAll('"', '""')}"`;
+            }
+            const last = value.length - 1;
+            if (value.indexOf(',') >= 0 || value.indexOf('\\n') >= 0 || value.indexOf('\\r') >= 0 ||
+                (last >= 0 && (value[0] <= ' ' || value[last] <= ' '))) {
+                return `"${value}"`;
+            }
+            return value;
+        }
+
+        function exportTableToCSV(tableId) {
+            // Only a window of rows is in the DOM, so export the filtered rows from the columns
+            const { headers, columns, vtable } = tableData[tableId];
+            const rows = [headers.map(csvField).join(',')];
+            vtable.indexes.forEach(i => {
+                rows.push(columns.map(column => csvField(String(column[i]))).join(','));
+            });
+            const csvContent = rows.join('\\n');
             
-            const blob = new Blob([csvContent], {{ type: 'text/csv' }});
+            const blob = new Blob([csvContent], { type: 'text/csv' });
             const url = window.URL.createObjectURL(blob);
             const a = document.createElement('a');
             a.href = url;
-            a.download = `${{tableId}}_filtered_data.csv`;
+            a.download = `${tableId}_filtered_data.csv`;
             document.body.appendChild(a);
             a.click();
             document.body.removeChild(a);
             window.URL.revokeObjectURL(url);
-        }}
+        }
+
+        // Trailing-edge debounce: fn runs once, ms after the last call in a burst
+        function debounce(fn, ms) {
+            let timer;
+            return function(...args) {
+                clearTimeout(timer);
+                timer = setTimeout(() => fn.apply(this, args), ms);
+            };
+        }
+
+        // Wrap async tasks so at most `limit` of them run at once; the rest wait in order
+        function limitConcurrency(limit) {
+            let active = 0;
+            const queue = [];
+            const next = () => {
+                if (active >= limit || queue.length === 0) return;
+                active++;
+                const { task, resolve, reject } = queue.shift();
+                task().then(resolve, reject).finally(() => {
+                    active--;
+                    next();
+                });
+            };
+            return task => new Promise((resolve, reject) => {
+                queue.push({ task, resolve, reject });
+                next();
+            });
+        }
+
+        const limitLoads = limitConcurrency(4);
 
         // Load all data
-        async function loadAllData() {{
+        async function loadAllData() {
             const container = document.getElementById('data-container');
-            container.innerHTML = '<div class="loading">Loading data from CSV files...</div>';
             
             // Reset counters
             totalRecords = 0;
             loadedTables = 0;
-            tableData = {{}};
+            tableData = {};
             
-            try {{
-                const tableHTMLs = await Promise.all(dataFiles.map(loadDataFile));
-                container.innerHTML = tableHTMLs.join('');
+            // A refresh waits for this load so two loads never share the counters
+            const refreshButton = document.querySelector('.refresh-btn');
+            refreshButton.disabled = true;
+            
+            // One placeholder per file keeps the page order while sections arrive in any order
+            const placeholders = dataFiles.map(fileInfo => createElement('div', 'loading', `Loading ${fileInfo.name}...`));
+            container.replaceChildren(...placeholders);
+            
+            // Each section is shown as soon as its own file is parsed
+            const results = await Promise.allSettled(dataFiles.map((fileInfo, i) => limitLoads(async () => {
+                const section = await loadDataFile(fileInfo);
+                placeholders[i].replaceWith(section);
+                // Re-render now that the table is attached and its rows can be measured
+                if (tableData[fileInfo.id]) {
+                    tableData[fileInfo.id].vtable.render();
+                    updateVisibleCount(fileInfo.id);
+                }
                 
                 // Update stats
                 document.getElementById('total-records').textContent = totalRecords.toLocaleString();
                 document.getElementById('total-tables').textContent = loadedTables;
-                document.getElementById('last-updated').textContent = new Date().toLocaleTimeString();
-                
-                // Initialize event listeners
-                initializeEventListeners();
-                
-            }} catch (error) {{
-                container.innerHTML = `
-                    <div class="error">
-                        Failed to load data: ${{error.message}}
-                    </div>
-                `;
-            }}
-        }}
-
-        // Initialize event listeners
-        function initializeEventListeners() {{
-            // Add change event listeners to all filter selects
-            document.querySelectorAll('.filter-select').forEach(select => {{
-                select.addEventListener('change', function() {{
-                    const tableId = this.dataset.table;
-                    filterTable(tableId);
-                }});
-            }});
+            })));
             
-            // Add click event listeners to clear buttons
-            document.querySelectorAll('.clear-filters').forEach(button => {{
-                button.addEventListener('click', function() {{
-                    const tableId = this.dataset.table;
-                    clearFilters(tableId);
-                }});
-            }});
+            results.forEach((result, i) => {
+                if (result.status === 'rejected') {
+                    placeholders[i].replaceWith(createElement('div', 'error', `Failed to load data: ${result.reason.message}`));
+                }
+            });
+            document.getElementById('last-updated').textContent = new Date().toLocaleTimeString();
+            refreshButton.disabled = false;
+        }
+
+        // One debounced filter per table: a burst of changes on a table is
+        // coalesced into a single filter pass
+        const scheduledFilters = {};
+        function scheduleFilter(tableId) {
+            if (!scheduledFilters[tableId]) {
+                scheduledFilters[tableId] = debounce(() => filterTable(tableId), 120);
+            }
+            scheduledFilters[tableId]();
+        }
+
+        // Initialize event listeners once; they are delegated from #data-container,
+        // so sections rebuilt by a refresh need no re-binding
+        function initializeEventListeners() {
+            const container = document.getElementById('data-container');
             
-            // Add click event listeners to export buttons
-            document.querySelectorAll('.export-csv').forEach(button => {{
-                button.addEventListener('click', function() {{
-                    const tableId = this.dataset.table;
-                    exportTableToCSV(tableId);
-                }});
-            }});
+            container.addEventListener('change', event => {
+                if (event.target.matches('.filter-select')) {
+                    scheduleFilter(event.target.dataset.table);
+                }
+            });
             
-            // Initialize visible counts for all tables
-            dataFiles.forEach(fileInfo => {{
-                if (document.getElementById(`table-${{fileInfo.id}}`)) {{
-                    updateVisibleCount(fileInfo.id);
-                }}
-            }});
-        }}
+            container.addEventListener('click', event => {
+                const target = event.target;
+                if (target.matches('.clear-filters')) {
+                    clearFilters(target.dataset.table);
+                } else if (target.matches('.export-csv')) {
+                    exportTableToCSV(target.dataset.table);
+                }
+            });
+        }
 
         // Initialize on page load
-        document.addEventListener('DOMContentLoaded', loadAllData);
+        document.addEventListener('DOMContentLoaded', () => {
+            initializeEventListeners();
+            loadAllData();
+        });
+"""
+
+CSS_FILE = Path("static") / "dynamic_viewer.css"
+JS_FILE = Path("static") / "dynamic_viewer.js"
+# Content hashes in the asset URLs, so they can be cached as immutable
+CSS_VERSION = hashlib.sha256(STYLE_CSS.encode()).hexdigest()[:12]
+JS_VERSION = hashlib.sha256(SCRIPT_JS.encode()).hexdigest()[:12]
+
+HEAD_HTML = f"""<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Retail Tariff Data Viewer - Dynamic</title>
+    <link rel="stylesheet" href="static/dynamic_viewer.css?v={CSS_VERSION}">
+"""
+
+BODY_HTML = """</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>📊 Retail Tariff Data Viewer - Dynamic</h1>
+            <p>Real-time data loading from CSV files with interactive filtering</p>
+        </div>
+        
+        <div class="content">
+            <button class="refresh-btn" onclick="loadAllData()">🔄 Refresh Data</button>
+            
+            <div class="stats" id="stats">
+                <div class="stat-card">
+                    <div class="stat-number" id="total-records">-</div>
+                    <div class="stat-label">Total Records</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-number" id="total-tables">-</div>
+                    <div class="stat-label">Data Tables</div>
+                </div>
+                <div class="stat-card">
+                    <div class="stat-number" id="last-updated">-</div>
+                    <div class="stat-label">Last Updated</div>
+                </div>
+            </div>
+            
+            <div class="toc">
+                <h3>📋 Table of Contents</h3>
+                <ul id="toc-list">
+                    <li><a href="#tariffs">📈 Tariffs</a></li>
+                    <li><a href="#products">🛍️ Products</a></li>
+                    <li><a href="#suppliers">🏭 Suppliers</a></li>
+                    <li><a href="#markets">🌍 Markets</a></li>
+                    <li><a href="#cost-transit">🚚 Cost & Transit</a></li>
+                    <li><a href="#sales-daily">📅 Sales Daily</a></li>
+                    <li><a href="#sales-weekly">📊 Sales Weekly</a></li>
+                </ul>
+            </div>
+            
+            <div id="data-container">
+                <div class="loading">Loading data from CSV files...</div>
+            </div>
+        </div>
+    </div>
+
+    <script>
+        // Data files configuration
+        const dataFiles = """
+
+FILTERS_JS = """;
+        
+        // First 20 distinct values of each column per table, computed when the page was generated
+        const PRECOMPUTED_FILTERS = """
+
+# Deferred, so it runs after the inline configuration above has been parsed
+TAIL_HTML = f""";
     </script>
+    <script defer src="static/dynamic_viewer.js?v={JS_VERSION}"></script>
 </body>
 </html>"""
+
+# Precompressed copies for servers that serve them as-is (nginx gzip_static /
+# brotli_static, Caddy precompressed); mtime=0 keeps the .gz bytes reproducible
+COMPRESSED_COPIES = [(".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+if brotli is not None:
+    COMPRESSED_COPIES.append((".br", lambda data: brotli.compress(data, quality=11)))
+
+DATA_DIR = Path("../retail_tariff_data")
+FILTER_OPTION_LIMIT = 20
+
+def config_stamp(data_files, filters_js):
+    """Stamp identifying the inputs of a generated viewer: the data file list, the embedded filter options and this template"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps(data_files, sort_keys=True).encode())
+    # The filter options are all the page embeds from the CSVs, so rewriting
+    # the CSVs with the same content leaves the stamp unchanged
+    digest.update(filters_js.encode())
+    digest.update(Path(__file__).read_bytes())
+    return f"<!-- cfg:{digest.hexdigest()} -->"
+
+def precompute_filter_options(data_files):
+    """Return {table id: {column: first FILTER_OPTION_LIMIT distinct values}}, skipping unreadable files"""
+    options = {}
+    for file_info in data_files:
+        try:
+            df = pd.read_csv(DATA_DIR / file_info['file'], dtype=str, keep_default_na=False)
+        except (OSError, pd.errors.EmptyDataError):
+            continue  # the page computes this table's options from the loaded rows
+        df.columns = df.columns.str.strip()
+        options[file_info['id']] = {col: pd.unique(df[col])[:FILTER_OPTION_LIMIT].tolist() for col in df.columns}
+    return options
+
+def write_if_changed(path, text):
+    """Write text to path unless the file already holds exactly that content; return True if written"""
+    new = text.encode('utf-8')
+    try:
+        unchanged = path.read_bytes() == new
+    except OSError:  # not generated yet
+        unchanged = False
+    if unchanged:
+        return False
+    path.write_bytes(new)
+    return True
+
+def write_compressed(path, changed):
+    """Write the precompressed copies of path: all of them if it changed, else only missing ones"""
+    data = None
+    for suffix, compress in COMPRESSED_COPIES:
+        copy = path.with_name(path.name + suffix)
+        if not changed and copy.exists():
+            continue
+        if data is None:
+            data = path.read_bytes()
+        copy.write_bytes(compress(data))
+
+def read_stamp(path):
+    """Return the config stamp line of a generated viewer, or None if there is no file"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            f.readline()  # doctype
+            return f.readline().rstrip('\n')
+    except OSError:
+        return None
+
+def generate_dynamic_html_viewer():
+    """Generate HTML viewer that dynamically loads CSV data"""
+    
+    # Data files to process
+    data_files = [
+        {'id': 'tariffs', 'name': 'Tariffs', 'file': 'tariffs.csv', 'icon': '📈'},
+        {'id': 'products', 'name': 'Products', 'file': 'products.csv', 'icon': '🛍️'},
+        {'id': 'suppliers', 'name': 'Suppliers', 'file': 'suppliers.csv', 'icon': '🏭'},
+        {'id': 'markets', 'name': 'Markets', 'file': 'markets.csv', 'icon': '🌍'},
+        {'id': 'cost-transit', 'name': 'Cost & Transit', 'file': 'cost_transit.csv', 'icon': '🚚'},
+        {'id': 'sales-daily', 'name': 'Sales Daily', 'file': 'sales_daily.csv', 'icon': '📅'},
+        {'id': 'sales-weekly', 'name': 'Sales Weekly', 'file': 'sales_weekly.csv', 'icon': '📊'}
+    ]
+    
+    # The stylesheet and script go next to the viewer, where its relative links point
+    output_file = Path("../data_viewer_dynamic.html")
+    (output_file.parent / CSS_FILE).parent.mkdir(exist_ok=True)
+    for asset, text in ((CSS_FILE, STYLE_CSS), (JS_FILE, SCRIPT_JS)):
+        written = write_if_changed(output_file.parent / asset, text)
+        write_compressed(output_file.parent / asset, written)
+        if written:
+            print(f"✅ Asset generated: {output_file.parent / asset}")
+    
+    # Skip rendering when the existing file was generated from the same inputs
+    # CSV values are data, so '<' is escaped to keep them from closing the script element
+    filters_js = json.dumps(precompute_filter_options(data_files), separators=(',', ':'), ensure_ascii=False).replace('<', '\\u003c')
+    stamp = config_stamp(data_files, filters_js)
+    html_written = read_stamp(output_file) != stamp
+    if html_written:
+        # Save HTML file, writing the sections in order rather than joining them first
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            f.writelines(generate_dynamic_html_sections(data_files, filters_js, stamp))
+        
+        print(f"🎉 Dynamic HTML viewer generated: {output_file}")
+        print(f"📊 Data files: {len(data_files)}")
+        print("💡 This version loads CSV data dynamically at runtime")
+        print("💡 Assets in static/ are versioned by content hash; serve them with")
+        print("   Cache-Control: public, max-age=31536000, immutable")
+    else:
+        print(f"✅ Dynamic HTML viewer unchanged: {output_file}")
+    
+    write_compressed(output_file, html_written)
+    print(f"🗜️ Precompressed copies: {', '.join(suffix for suffix, _ in COMPRESSED_COPIES)}")
+    print("   Served by nginx (gzip_static/brotli_static on) or Caddy (file_server { precompressed });")
+    print("   python3 -m http.server ignores them and sends the raw files")
+    
+    return output_file
+
+def generate_dynamic_html_sections(data_files, filters_js, stamp):
+    """Return the HTML page as a sequence of strings to be written in order"""
+    
+    # Create data files configuration for JavaScript
+    data_files_js = json.dumps(data_files, separators=(',', ':'), ensure_ascii=False)
     
-    return html_template
+    # The stamp goes right after the doctype so the page stays in standards mode
+    return ("<!DOCTYPE html>\n", stamp, "\n", HEAD_HTML, BODY_HTML, data_files_js,
+            FILTERS_JS, filters_js, TAIL_HTML)
 
 if __name__ == "__main__":
     generate_dynamic_html_viewer()
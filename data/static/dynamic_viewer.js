@@ -0,0 +1,536 @@
+        let totalRecords = 0;
+        let loadedTables = 0;
+        let tableData = {};
+
+        // Quote-aware CSV parser fed straight from the response stream. Each decoded
+        // chunk is scanned once, copying plain runs with slice(); quoted fields may hold
+        // commas, newlines and "" escapes. Yields the records completed in each chunk.
+        const QUOTE = 34, COMMA = 44, LF = 10, CR = 13;
+
+        async function* parseCSVStream(body) {
+            const reader = body.pipeThrough(new TextDecoderStream()).getReader();
+            let record = [];
+            let field = '';
+            let fieldStart = true;  // nothing read for the current field yet
+            let quoted = false;     // inside a quoted field
+            let quoteSeen = false;  // just read a quote inside a quoted field
+
+            const endField = () => {
+                record.push(field);
+                field = '';
+                fieldStart = true;
+            };
+            const endRecord = records => {
+                if (field.charCodeAt(field.length - 1) === CR) {
+                    field = field.slice(0, -1);
+                }
+                endField();
+                if (record.length > 1 || record[0] !== '') {  // skip blank lines
+                    records.push(record);
+                }
+                record = [];
+            };
+            // Chunks with no quotes (most of them) can't open or escape a field, so
+            // they're split by jumping between delimiters with native indexOf
+            // instead of testing every character; returns where the tail starts
+            const scanPlain = (chunk, records) => {
+                let start = 0;
+                let comma = chunk.indexOf(',');
+                let lf = chunk.indexOf('\n');
+                while (comma >= 0 || lf >= 0) {
+                    if (comma >= 0 && (lf < 0 || comma < lf)) {
+                        field += chunk.slice(start, comma);
+                        endField();
+                        start = comma + 1;
+                        comma = chunk.indexOf(',', start);
+                    } else {
+                        field += chunk.slice(start, lf);
+                        endRecord(records);
+                        start = lf + 1;
+                        lf = chunk.indexOf('\n', start);
+                    }
+                }
+                if (start < chunk.length) {
+                    fieldStart = false;
+                }
+                return start;
+            };
+
+            for (;;) {
+                const { value: chunk, done } = await reader.read();
+                if (done) break;
+
+                const records = [];
+                const plain = !quoted && !quoteSeen && chunk.indexOf('"') < 0;
+                let start = plain ? scanPlain(chunk, records) : 0;
+                for (let i = plain ? chunk.length : 0; i < chunk.length; i++) {
+                    const c = chunk.charCodeAt(i);
+                    if (quoted) {
+                        if (c === QUOTE) {
+                            field += chunk.slice(start, i);
+                            quoted = false;
+                            quoteSeen = true;
+                            start = i + 1;
+                        }
+                        continue;
+                    }
+                    if (quoteSeen) {
+                        quoteSeen = false;
+                        if (c === QUOTE) {  // "" inside quotes is a literal quote
+                            field += '"';
+                            quoted = true;
+                            start = i + 1;
+                            continue;
+                        }
+                    }
+                    if (c === COMMA) {
+                        field += chunk.slice(start, i);
+                        endField();
+                        start = i + 1;
+                    } else if (c === LF) {
+                        field += chunk.slice(start, i);
+                        endRecord(records);
+                        start = i + 1;
+                    } else if (c === QUOTE && fieldStart) {
+                        quoted = true;
+                        fieldStart = false;
+                        start = i + 1;
+                    } else {
+                        fieldStart = false;
+                    }
+                }
+                field += chunk.slice(start);
+                if (records.length) {
+                    yield records;
+                }
+            }
+
+            if (field !== '' || record.length) {
+                const records = [];
+                endRecord(records);
+                if (records.length) {
+                    yield records;
+                }
+            }
+        }
+
+        function createElement(tag, className = '', text) {
+            const el = document.createElement(tag);
+            if (className) el.className = className;
+            if (text !== undefined) el.textContent = text;
+            return el;
+        }
+
+        function createOption(value, text = value) {
+            const option = document.createElement('option');
+            option.value = value;
+            option.textContent = text;
+            return option;
+        }
+
+        // Windowed table body: only the rows around the viewport exist as <tr>
+        // nodes, recycled from a fixed pool as the container scrolls
+        const POOL_SIZE = 40;
+        const OVERSCAN = 10;
+        const ROW_HEIGHT_ESTIMATE = 37;
+
+        class VirtualTable {
+            constructor(scroller, tbody, columns, rowCount) {
+                this.scroller = scroller;
+                this.tbody = tbody;
+                this.columns = columns;
+                this.indexes = Array.from({ length: rowCount }, (_, i) => i);
+                this.rowHeight = 0;
+                this.pool = [];
+                this.frame = 0;
+
+                this.topSpacer = this.createSpacer();
+                this.bottomSpacer = this.createSpacer();
+                tbody.append(this.topSpacer, this.bottomSpacer);
+                scroller.addEventListener('scroll', () => this.scheduleRender(), { passive: true });
+                this.render();
+            }
+
+            createSpacer() {
+                const tr = createElement('tr', 'spacer');
+                const td = document.createElement('td');
+                td.colSpan = Math.max(this.columns.length, 1);
+                tr.appendChild(td);
+                return tr;
+            }
+
+            // Show only the given row positions, e.g. the rows matching the filters
+            setRows(indexes) {
+                this.indexes = indexes;
+                this.scroller.scrollTop = 0;
+                this.render();
+            }
+
+            scheduleRender() {
+                if (this.frame) return;
+                this.frame = requestAnimationFrame(() => {
+                    this.frame = 0;
+                    this.render();
+                });
+            }
+
+            render() {
+                const total = this.indexes.length;
+                // Rows only have a height once the table is attached, so measure lazily
+                if (!this.rowHeight && this.pool.length && this.pool[0].offsetHeight) {
+                    this.rowHeight = this.pool[0].offsetHeight;
+                }
+                const rowHeight = this.rowHeight || ROW_HEIGHT_ESTIMATE;
+                const first = Math.max(0, Math.min(
+                    Math.floor(this.scroller.scrollTop / rowHeight) - OVERSCAN, total - POOL_SIZE));
+                const count = Math.min(POOL_SIZE, total - first);
+
+                while (this.pool.length < count) {
+                    const tr = document.createElement('tr');
+                    this.columns.forEach(() => tr.appendChild(document.createElement('td')));
+                    this.tbody.insertBefore(tr, this.bottomSpacer);
+                    this.pool.push(tr);
+                }
+                this.pool.forEach((tr, k) => {
+                    tr.classList.toggle('hidden', k >= count);
+                    if (k >= count) return;
+                    const row = this.indexes[first + k];
+                    tr.classList.toggle('even', (first + k) % 2 === 1);
+                    for (let c = 0; c < this.columns.length; c++) {
+                        tr.cells[c].textContent = this.columns[c][row];
+                    }
+                });
+
+                this.topSpacer.firstChild.style.height = `${first * rowHeight}px`;
+                this.bottomSpacer.firstChild.style.height = `${(total - first - count) * rowHeight}px`;
+            }
+        }
+
+        // Function to create a table section with filters
+        function createTableSection(id, name, icon) {
+            const { headers, columns, rowCount } = tableData[id];
+            const section = createElement('div', 'table-section');
+            section.id = id;
+            section.appendChild(createElement('div', 'table-header', `${icon} ${name} (${rowCount} records)`));
+
+            // Create filter selects
+            const filtersContainer = createElement('div', 'filters-container');
+            headers.forEach((col, c) => {
+                const uniqueVals = PRECOMPUTED_FILTERS[id]?.[col] ?? Array.from(new Set(columns[c]), String).slice(0, 20);
+                const sortedVals = uniqueVals.sort();
+
+                const group = createElement('div', 'filter-group');
+                const label = createElement('label', '', `${col}:`);
+                label.htmlFor = `filter-${id}-${col}`;
+                const select = createElement('select', 'filter-select');
+                select.id = label.htmlFor;
+                select.dataset.table = id;
+                select.dataset.column = col;
+                select.appendChild(createOption('', 'All'));
+                sortedVals.forEach(val => select.appendChild(createOption(val)));
+                group.append(label, select);
+                filtersContainer.appendChild(group);
+            });
+
+            const actions = createElement('div', 'filter-actions');
+            const clearButton = createElement('button', 'clear-filters', 'Clear All');
+            clearButton.dataset.table = id;
+            const exportButton = createElement('button', 'export-csv', 'Export CSV');
+            exportButton.dataset.table = id;
+            actions.append(clearButton, exportButton);
+            filtersContainer.appendChild(actions);
+
+            const filters = createElement('div', 'table-filters');
+            filters.appendChild(filtersContainer);
+
+            const table = document.createElement('table');
+            table.id = `table-${id}`;
+            const headRow = table.createTHead().insertRow();
+            headers.forEach(header => headRow.appendChild(createElement('th', '', header)));
+
+            const content = createElement('div', 'table-content');
+            content.appendChild(table);
+            tableData[id].vtable = new VirtualTable(content, table.createTBody(), columns, rowCount);
+            section.append(filters, content);
+            return section;
+        }
+
+        // A column whose every value is a finite number that prints back unchanged
+        // is stored as a typed array, so rendering and export show the same text;
+        // any other column stays an array of strings
+        function packColumn(values) {
+            if (!values.length || !values.every(value => {
+                const number = Number(value);
+                return Number.isFinite(number) && String(number) === value;
+            })) {
+                return values;
+            }
+            const numbers = Float64Array.from(values, Number);
+            const isInt32 = numbers.every(number => number === (number | 0));
+            return isInt32 ? Int32Array.from(numbers) : numbers;
+        }
+
+        // Lowercased copy of a text column for filtering; numbers print in lowercase
+        // already, and a column with nothing to lowercase is shared rather than copied
+        function lowerColumn(column) {
+            if (ArrayBuffer.isView(column)) return column;
+            const lowered = column.map(value => value.toLowerCase());
+            return lowered.every((value, i) => value === column[i]) ? column : lowered;
+        }
+
+        // Function to load data file
+        async function loadDataFile(fileInfo) {
+            try {
+                const response = await fetch(`retail_tariff_data/${fileInfo.file}`);
+                if (!response.ok) {
+                    throw new Error(`HTTP error! status: ${response.status}`);
+                }
+                // Rows are parsed as the download arrives, without holding the raw text,
+                // and stored column by column rather than as one object per row
+                let headers = null;
+                let columns = [];
+                for await (const records of parseCSVStream(response.body)) {
+                    for (const values of records) {
+                        if (!headers) {
+                            headers = values.map(header => header.trim());
+                            columns = headers.map(() => []);
+                            continue;
+                        }
+                        for (let j = 0; j < headers.length; j++) {
+                            columns[j].push(values[j] ?? '');
+                        }
+                    }
+                }
+                headers = headers || [];
+                const rowCount = columns.length ? columns[0].length : 0;
+                columns = columns.map(packColumn);
+                
+                // Store data for filtering, with each column's cell index and the text
+                // cells lowercased once so filtering only compares normalized strings
+                const colIndex = Object.fromEntries(headers.map((header, i) => [header, i]));
+                const lower = columns.map(lowerColumn);
+                tableData[fileInfo.id] = { headers, columns, rowCount, colIndex, lower };
+                
+                totalRecords += rowCount;
+                loadedTables++;
+                
+                return createTableSection(fileInfo.id, fileInfo.name, fileInfo.icon);
+            } catch (error) {
+                console.error(`Error loading ${fileInfo.file}:`, error);
+                
+                // Check if it's a CORS error
+                const isCorsError = error.message.includes('CORS') || 
+                                  error.message.includes('Cross-Origin') ||
+                                  error.message.includes('Failed to fetch');
+                
+                const section = createElement('div', 'table-section');
+                section.id = fileInfo.id;
+                if (isCorsError) {
+                    // Static help text; only the configured table icon and name are interpolated
+                    section.innerHTML = `
+                            <div class="table-header">
+                                ${fileInfo.icon} ${fileInfo.name} - CORS Error
+                            </div>
+                            <div class="error">
+                                <h4>🚫 CORS Error Detected</h4>
+                                <p>Cannot load CSV files directly from file system due to browser security restrictions.</p>
+                                <h5>Solutions:</h5>
+                                <ol>
+                                    <li><strong>Use Web Server:</strong> Run <code>python3 -m http.server 5002</code> and open <code>http://localhost:5002/data_viewer_dynamic.html</code></li>
+                                    <li><strong>Use Embedded Viewer:</strong> Open <code>data_viewer_embedded.html</code> instead (works offline)</li>
+                                    <li><strong>Use Update Script:</strong> Run <code>python3 update_data.py</code> to open with web server</li>
+                                </ol>
+                            </div>
+                    `;
+                } else {
+                    section.append(
+                        createElement('div', 'table-header', `${fileInfo.icon} ${fileInfo.name}`),
+                        createElement('div', 'error', `Error loading ${fileInfo.file}: ${error.message}`)
+                    );
+                }
+                return section;
+            }
+        }
+
+        // Filter functionality
+        function filterTable(tableId) {
+            const { rowCount, colIndex, lower, vtable } = tableData[tableId];
+            
+            // Resolve the active filters to (lowercased column, value) pairs once per call
+            const activeFilters = [];
+            document.querySelectorAll(`.filter-select[data-table="${tableId}"]`).forEach(filter => {
+                if (filter.value) {
+                    activeFilters.push([lower[colIndex[filter.dataset.column]], filter.value.toLowerCase()]);
+                }
+            });
+            
+            const indexes = [];
+            for (let i = 0; i < rowCount; i++) {
+                const showRow = activeFilters.every(([column, filterValue]) =>
+                    String(column[i]).includes(filterValue));
+                
+                if (showRow) indexes.push(i);
+            }
+            vtable.setRows(indexes);
+            
+            // Update visible row count
+            updateVisibleCount(tableId);
+        }
+        
+        function updateVisibleCount(tableId) {
+            const visibleRows = tableData[tableId].vtable.indexes.length;
+            const header = document.querySelector(`#${tableId} .table-header`);
+            const originalText = header.textContent;
+            const baseText = originalText.split(' (')[0];
+            header.textContent = `${baseText} (${visibleRows.toLocaleString()} visible rows)`;
+        }
+        
+        function clearFilters(tableId) {
+            const filters = document.querySelectorAll(`[data-table="${tableId}"]`);
+            filters.forEach(filter => {
+                filter.value = '';
+            });
+            filterTable(tableId);
+        }
+        
+        // Quote a field only when it holds a quote, comma or line break, or has
+        // leading/trailing whitespace that a trimming reader would drop
+        function csvField(value) {
+            if (value.indexOf('"') >= 0) {
+                return `"${value.replaceAll('"', '""')}"`;
+            }
+            const last = value.length - 1;
+            if (value.indexOf(',') >= 0 || value.indexOf('\n') >= 0 || value.indexOf('\r') >= 0 ||
+                (last >= 0 && (value[0] <= ' ' || value[last] <= ' '))) {
+                return `"${value}"`;
+            }
+            return value;
+        }
+
+        function exportTableToCSV(tableId) {
+            // Only a window of rows is in the DOM, so export the filtered rows from the columns
+            const { headers, columns, vtable } = tableData[tableId];
+            const rows = [headers.map(csvField).join(',')];
+            vtable.indexes.forEach(i => {
+                rows.push(columns.map(column => csvField(String(column[i]))).join(','));
+            });
+            const csvContent = rows.join('\n');
+            
+            const blob = new Blob([csvContent], { type: 'text/csv' });
+            const url = window.URL.createObjectURL(blob);
+            const a = document.createElement('a');
+            a.href = url;
+            a.download = `${tableId}_filtered_data.csv`;
+            document.body.appendChild(a);
+            a.click();
+            document.body.removeChild(a);
+            window.URL.revokeObjectURL(url);
+        }
+
+        // Trailing-edge debounce: fn runs once, ms after the last call in a burst
+        function debounce(fn, ms) {
+            let timer;
+            return function(...args) {
+                clearTimeout(timer);
+                timer = setTimeout(() => fn.apply(this, args), ms);
+            };
+        }
+
+        // Wrap async tasks so at most `limit` of them run at once; the rest wait in order
+        function limitConcurrency(limit) {
+            let active = 0;
+            const queue = [];
+            const next = () => {
+                if (active >= limit || queue.length === 0) return;
+                active++;
+                const { task, resolve, reject } = queue.shift();
+                task().then(resolve, reject).finally(() => {
+                    active--;
+                    next();
+                });
+            };
+            return task => new Promise((resolve, reject) => {
+                queue.push({ task, resolve, reject });
+                next();
+            });
+        }
+
+        const limitLoads = limitConcurrency(4);
+
+        // Load all data
+        async function loadAllData() {
+            const container = document.getElementById('data-container');
+            
+            // Reset counters
+            totalRecords = 0;
+            loadedTables = 0;
+            tableData = {};
+            
+            // A refresh waits for this load so two loads never share the counters
+            const refreshButton = document.querySelector('.refresh-btn');
+            refreshButton.disabled = true;
+            
+            // One placeholder per file keeps the page order while sections arrive in any order
+            const placeholders = dataFiles.map(fileInfo => createElement('div', 'loading', `Loading ${fileInfo.name}...`));
+            container.replaceChildren(...placeholders);
+            
+            // Each section is shown as soon as its own file is parsed
+            const results = await Promise.allSettled(dataFiles.map((fileInfo, i) => limitLoads(async () => {
+                const section = await loadDataFile(fileInfo);
+                placeholders[i].replaceWith(section);
+                // Re-render now that the table is attached and its rows can be measured
+                if (tableData[fileInfo.id]) {
+                    tableData[fileInfo.id].vtable.render();
+                    updateVisibleCount(fileInfo.id);
+                }
+                
+                // Update stats
+                document.getElementById('total-records').textContent = totalRecords.toLocaleString();
+                document.getElementById('total-tables').textContent = loadedTables;
+            })));
+            
+            results.forEach((result, i) => {
+                if (result.status === 'rejected') {
+                    placeholders[i].replaceWith(createElement('div', 'error', `Failed to load data: ${result.reason.message}`));
+                }
+            });
+            document.getElementById('last-updated').textContent = new Date().toLocaleTimeString();
+            refreshButton.disabled = false;
+        }
+
+        // One debounced filter per table: a burst of changes on a table is
+        // coalesced into a single filter pass
+        const scheduledFilters = {};
+        function scheduleFilter(tableId) {
+            if (!scheduledFilters[tableId]) {
+                scheduledFilters[tableId] = debounce(() => filterTable(tableId), 120);
+            }
+            scheduledFilters[tableId]();
+        }
+
+        // Initialize event listeners once; they are delegated from #data-container,
+        // so sections rebuilt by a refresh need no re-binding
+        function initializeEventListeners() {
+            const container = document.getElementById('data-container');
+            
+            container.addEventListener('change', event => {
+                if (event.target.matches('.filter-select')) {
+                    scheduleFilter(event.target.dataset.table);
+                }
+            });
+            
+            container.addEventListener('click', event => {
+                const target = event.target;
+                if (target.matches('.clear-filters')) {
+                    clearFilters(target.dataset.table);
+                } else if (target.matches('.export-csv')) {
+                    exportTableToCSV(target.dataset.table);
+                }
+            });
+        }
+
+        // Initialize on page load
+        document.addEventListener('DOMContentLoaded', () => {
+            initializeEventListeners();
+            loadAllData();
+        });
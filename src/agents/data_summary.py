@@ -7,6 +7,27 @@ from src.core.models import AgentState, QueryIntent
 from src.core.data_loader import data_loader
 
 
+SUMMARY_TEMPLATE = """Our tariff database contains comprehensive information:
+
+📊 Data Overview:
+• {total_records} total tariff records
+• {country_count} countries: {countries}
+• {product_type_count} product categories: {product_types}
+
+📅 Date Range:
+• From: {earliest}
+• To: {latest}
+
+📈 Tariff Range:
+• Minimum: {tariff_min:.2%}
+• Maximum: {tariff_max:.2%}
+
+I can provide current rates, historical changes, and comparisons between countries and products."""
+
+# Last summary dict formatted and the text it produced
+_rendered = {'summary': None, 'text': None}
+
+
 def data_summary_node(state: AgentState) -> AgentState:
     """
     LangGraph node function for providing data summary.
@@ -19,35 +40,34 @@ def data_summary_node(state: AgentState) -> AgentState:
     """
     try:
         # Record start time
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Get data summary
         data_summary = data_loader.get_data_summary()
         
-        # Create summary response
-        summary_text = f"""Our tariff database contains comprehensive information:
-
-📊 Data Overview:
-• {data_summary['total_records']} total tariff records
-• {len(data_summary['countries'])} countries: {', '.join([str(c) for c in data_summary['countries']])}
-• {len(data_summary['product_types'])} product categories: {', '.join([str(p) for p in data_summary['product_types']])}
-
-📅 Date Range:
-• From: {data_summary['date_range']['earliest']}
-• To: {data_summary['date_range']['latest']}
-
-📈 Tariff Range:
-• Minimum: {data_summary['tariff_range']['min']:.2%}
-• Maximum: {data_summary['tariff_range']['max']:.2%}
-
-I can provide current rates, historical changes, and comparisons between countries and products."""
+        # Format the summary once per summary dict; the loader reuses the same
+        # dict until the data changes, so repeat calls skip the formatting
+        if _rendered['summary'] is not data_summary:
+            _rendered['text'] = SUMMARY_TEMPLATE.format_map({
+                'total_records': data_summary['total_records'],
+                'country_count': len(data_summary['countries']),
+                'countries': ', '.join(map(str, data_summary['countries'])),
+                'product_type_count': len(data_summary['product_types']),
+                'product_types': ', '.join(map(str, data_summary['product_types'])),
+                'earliest': data_summary['date_range']['earliest'],
+                'latest': data_summary['date_range']['latest'],
+                'tariff_min': data_summary['tariff_range']['min'],
+                'tariff_max': data_summary['tariff_range']['max'],
+            })
+            _rendered['summary'] = data_summary
+        summary_text = _rendered['text']
         
         state.response = summary_text
         state.step = "data_summary_complete"
         state.error = None
         
         # Record timing
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         state.node_timings["data_summary"] = execution_time
         
         return state
@@ -3,23 +3,42 @@ Dynamic Router Agent - Handles routing decisions based on query intent and state
 """
 
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from src.core.models import AgentState, QueryIntent
 
 
+# Routing is a few dict lookups per step and the timings it records are a handful of
+# floats, so this module stays plain Python: a JIT such as Numba would only add call
+# overhead here. Only a numeric loop over many samples would be worth compiling.
+
+# Shared, immutable routing results, so a routing decision allocates nothing
+_END = ("end",)
+_ERROR = ("error_handler",)
+
+
 class DynamicRouterAgent:
     """Handles dynamic routing decisions for the LangGraph execution."""
     
     def __init__(self):
         """Initialize the dynamic router agent."""
         self.routing_rules = {
-            QueryIntent.TARIFF_RATE: ["parse_query", "tariff_lookup", "response_formatter"],
-            QueryIntent.COMPARISON: ["parse_query", "tariff_lookup", "response_formatter"],
-            QueryIntent.GENERAL_INFO: ["parse_query", "data_summary", "response_formatter"],
-            QueryIntent.UNSUPPORTED: ["parse_query", "error_handler", "response_formatter"]
+            QueryIntent.TARIFF_RATE: ("parse_query", "tariff_lookup", "response_formatter"),
+            QueryIntent.COMPARISON: ("parse_query", "tariff_lookup", "response_formatter"),
+            QueryIntent.GENERAL_INFO: ("parse_query", "data_summary", "response_formatter"),
+            QueryIntent.UNSUPPORTED: ("parse_query", "error_handler", "response_formatter")
+        }
+        # Next nodes after every node whose successor doesn't depend on the state;
+        # any node not listed here (or in determine_next_nodes) ends the run
+        self.transitions = {
+            "start": ("parse_query",),
+            "tariff_lookup": ("response_formatter",),
+            "data_summary": ("response_formatter",),
+            "response_formatter": _END,
+            # If we hit an error handler, end
+            "error_handler": _END
         }
     
-    def determine_next_nodes(self, state: AgentState) -> List[str]:
+    def determine_next_nodes(self, state: AgentState) -> Tuple[str, ...]:
         """
         Determine the next nodes to execute based on current state.
         
@@ -27,39 +46,17 @@ class DynamicRouterAgent:
             state: Current agent state
             
         Returns:
-            List of next node names to execute
+            Tuple of next node names to execute
         """
         current_node = state.current_node
         
-        # If we're at the start, determine initial routing
-        if current_node == "start":
-            return ["parse_query"]
-        
         # If we just parsed the query, route based on intent
         if current_node == "parse_query":
             if state.parsed_query and state.parsed_query.intent:
-                return self.routing_rules.get(state.parsed_query.intent, ["error_handler"])
-            else:
-                return ["error_handler"]
-        
-        # If we completed tariff lookup, go to response formatter
-        if current_node == "tariff_lookup":
-            return ["response_formatter"]
+                return self.routing_rules.get(state.parsed_query.intent, _ERROR)
+            return _ERROR
         
-        # If we completed data summary, go to response formatter
-        if current_node == "data_summary":
-            return ["response_formatter"]
-        
-        # If we completed response formatter, we're done
-        if current_node == "response_formatter":
-            return ["end"]
-        
-        # If we hit an error handler, try to recover or end
-        if current_node == "error_handler":
-            return ["end"]
-        
-        # Default fallback
-        return ["end"]
+        return self.transitions.get(current_node, _END)
     
     def should_retry_node(self, state: AgentState, node_name: str) -> bool:
         """
@@ -102,6 +99,10 @@ class DynamicRouterAgent:
         return ["error_handler", "response_formatter"]
 
 
+# The router holds no per-run state, so one instance serves every graph run
+_router = DynamicRouterAgent()
+
+
 def router_node(state: AgentState) -> AgentState:
     """
     LangGraph node function for dynamic routing.
@@ -112,12 +113,12 @@ def router_node(state: AgentState) -> AgentState:
     Returns:
         Updated state with routing decisions
     """
-    router = DynamicRouterAgent()
+    router = _router
     
     try:
         # Record start time for current node
         if not state.current_node_start_time:
-            state.current_node_start_time = time.time()
+            state.current_node_start_time = time.perf_counter()
         
         # Determine next nodes
         next_nodes = router.determine_next_nodes(state)
@@ -129,15 +130,17 @@ def router_node(state: AgentState) -> AgentState:
         
         # Record timing for current node
         if state.current_node_start_time:
-            execution_time = time.time() - state.current_node_start_time
+            execution_time = time.perf_counter() - state.current_node_start_time
             state.node_timings[state.current_node] = execution_time
         
-        # Update execution summary
+        # Update execution summary in place (assigning a new dict would re-validate it);
+        # the path and timings are referenced, not copied, as nothing edits them
+        # between routing steps and each step refreshes the summary anyway
         state.execution_summary.update({
             "current_node": state.current_node,
             "next_nodes": next_nodes,
-            "execution_path": state.execution_path.copy(),
-            "node_timings": state.node_timings.copy()
+            "execution_path": state.execution_path,
+            "node_timings": state.node_timings
         })
         
         state.step = "routed"
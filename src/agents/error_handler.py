@@ -6,6 +6,22 @@ import time
 from src.core.models import AgentState
 
 
+# Response text is fixed apart from the error, so the template is built once at import
+ERROR_RESPONSE_TEMPLATE = """I encountered an issue processing your query: {error}
+
+🔧 **Troubleshooting Tips:**
+• Make sure you're asking about supported countries: China, Vietnam, Mexico, India, USA
+• Supported products: Electronics, Apparel, Home, Toys
+• Try rephrasing your question more clearly
+
+💡 **Example queries that work:**
+• "What's the tariff rate for Electronics from China?"
+• "Compare tariff rates for Toys between Vietnam and India"
+• "How much tariff is charged on Apparel from Mexico?"
+
+Please try again with a clearer question, and I'll do my best to help!"""
+
+
 def error_handler_node(state: AgentState) -> AgentState:
     """
     LangGraph node function for error handling.
@@ -18,29 +34,19 @@ def error_handler_node(state: AgentState) -> AgentState:
     """
     try:
         # Record start time
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Create helpful error response
-        error_response = f"""I encountered an issue processing your query: {state.error if state.error else 'Unknown error'}
-
-🔧 **Troubleshooting Tips:**
-• Make sure you're asking about supported countries: China, Vietnam, Mexico, India, USA
-• Supported products: Electronics, Apparel, Home, Toys
-• Try rephrasing your question more clearly
-
-💡 **Example queries that work:**
-• "What's the tariff rate for Electronics from China?"
-• "Compare tariff rates for Toys between Vietnam and India"
-• "How much tariff is charged on Apparel from Mexico?"
-
-Please try again with a clearer question, and I'll do my best to help!"""
+        error_response = ERROR_RESPONSE_TEMPLATE.format_map({
+            'error': state.error if state.error else 'Unknown error'
+        })
         
         state.response = error_response
         state.step = "error_handled"
         state.error = None
         
         # Record timing
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
         state.node_timings["error_handler"] = execution_time
         
         return state
@@ -2,31 +2,176 @@
 Query Parser Agent - Extracts structured information from natural language queries.
 """
 
+import asyncio
+import hashlib
 import json
-from typing import Dict, Any, Optional
-from openai import AzureOpenAI
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
 from src.core.models import AgentState, TariffQuery, Country, ProductType, QueryIntent
 from src.core.config import settings
+from src.core.openai_client import get_openai_client
 from src.core.data_loader import data_loader
 
+try:
+    import orjson
+except ImportError:  # fall back to json
+    orjson = None
+
+# Decoder for the model's JSON responses
+json_loads = orjson.loads if orjson is not None else json.loads
+
+
+# Model responses for recently parsed queries, most recently used last. Keys include
+# the deployment and a digest of the system prompt, so a changed prompt or model
+# never reuses an old parse. The raw JSON text is kept so each hit gets fresh objects.
+PARSE_CACHE_SIZE = 2048
+_parse_cache: "OrderedDict[tuple, str]" = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+# Aliases from the system prompt, for classifying plain queries without a model call.
+# "US" is matched case-sensitively on its own so the pronoun "us" isn't read as a country.
+COUNTRY_ALIASES = {
+    "usa": "USA", "united states": "USA", "america": "USA",
+    "china": "China", "chinese": "China",
+    "vietnam": "Vietnam", "vietnamese": "Vietnam",
+    "mexico": "Mexico", "mexican": "Mexico",
+    "india": "India", "indian": "India",
+}
+PRODUCT_ALIASES = {
+    "electronic": "Electronics", "electronics": "Electronics", "tech": "Electronics", "technology": "Electronics",
+    "clothing": "Apparel", "apparel": "Apparel", "garments": "Apparel", "fashion": "Apparel",
+    "home goods": "Home", "housewares": "Home", "household": "Home", "home": "Home",
+    "toy": "Toys", "toys": "Toys", "games": "Toys", "playthings": "Toys",
+}
+
+
+# Enum members by value: the enums' own lookup tables, read directly so an
+# unknown or missing value is just None instead of a caught ValueError
+COUNTRY_BY_VALUE = Country._value2member_map_
+PRODUCT_TYPE_BY_VALUE = ProductType._value2member_map_
+INTENT_BY_VALUE = QueryIntent._value2member_map_
+
+
+def _nullable_enum(members) -> Dict[str, Any]:
+    """Schema for one of the enum's values or null."""
+    return {"type": ["string", "null"], "enum": [m.value for m in members] + [None]}
+
+
+# Structured-output schema for one parsed query. Strict mode constrains decoding to
+# exactly these fields and values, and the token caps bound the reply length.
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+QUERY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "country": _nullable_enum(Country),
+        "product_type": _nullable_enum(ProductType),
+        "intent": {"type": "string", "enum": [m.value for m in QueryIntent]},
+        "confidence": {"type": "number"},
+        "parsed_entities": {
+            "type": "object",
+            "properties": {
+                "countries_mentioned": _STRING_LIST,
+                "products_mentioned": _STRING_LIST,
+                "keywords": _STRING_LIST
+            },
+            "required": ["countries_mentioned", "products_mentioned", "keywords"],
+            "additionalProperties": False
+        }
+    },
+    "required": ["country", "product_type", "intent", "confidence", "parsed_entities"],
+    "additionalProperties": False
+}
+QUERY_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "TariffQuery", "schema": QUERY_SCHEMA, "strict": True}
+}
+BATCH_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "TariffQueries",
+        "schema": {
+            "type": "object",
+            "properties": {"results": {"type": "array", "items": QUERY_SCHEMA}},
+            "required": ["results"],
+            "additionalProperties": False
+        },
+        "strict": True
+    }
+}
+QUERY_MAX_TOKENS = 200
+
+
+def _alias_pattern(aliases) -> "re.Pattern[str]":
+    """Match any alias as whole words, longest first so "home goods" wins over "home"."""
+    return re.compile(r"\b(" + "|".join(map(re.escape, sorted(aliases, key=len, reverse=True))) + r")\b")
+
+
+COUNTRY_PATTERN = _alias_pattern(COUNTRY_ALIASES)
+US_PATTERN = re.compile(r"\bUS\b")
+PRODUCT_PATTERN = _alias_pattern(PRODUCT_ALIASES)
+TARIFF_PATTERN = re.compile(r"\b(tariffs?|rates?|dut(?:y|ies)|charged)\b")
+COMPARISON_PATTERN = re.compile(r"\b(compare|comparison|versus|vs|between)\b")
+GENERAL_INFO_PATTERN = re.compile(r"\b(data|available|support(?:ed)?|can you)\b")
+# General-info questions are only answered locally when every word is one of these,
+# so a query naming any country, product or other entity ("Is data available for
+# Japan?") goes to the model, which reports the name in parsed_entities
+GENERAL_INFO_WORDS = frozenset("""
+    a about all any are available can categories category countries country cover covers
+    data database dataset do does have help i info information is kind kinds list me
+    of offer product products provide show support supported supports tell the there
+    type types we what what's which with you your
+""".split())
+WORD_PATTERN = re.compile(r"\w+(?:'\w+)?")
+# Anything hinting at scenarios, analysis, history or forecasts is left to the model
+DEFER_PATTERN = re.compile(
+    r"\b(what if|if|would|scenario|margins?|profits?|impact|analy[sz]\w*|predict\w*|forecast\w*|future|"
+    r"increase\w*|decrease\w*|chang\w*|trend\w*|histor\w*|pricing|costs?|business|competitive|not|no)\b|%"
+)
+
+
+def _distinct(values) -> list:
+    """Values in first-seen order without repeats."""
+    return list(dict.fromkeys(values))
+
+
+def _cache_get(cache_key: tuple) -> Optional[str]:
+    """Return the cached response for a key, marking it recently used."""
+    with _parse_cache_lock:
+        content = _parse_cache.get(cache_key)
+        if content is not None:
+            _parse_cache.move_to_end(cache_key)
+        return content
+
+
+def _cache_put(cache_key: tuple, content: str) -> None:
+    """Cache a response, evicting the least recently used one when full."""
+    with _parse_cache_lock:
+        _parse_cache[cache_key] = content
+        if len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+
+
+def _normalize_query(query: str) -> str:
+    """Normalize case, whitespace and trailing punctuation, which don't change the parse."""
+    return " ".join(query.lower().split()).rstrip("?!. ")
+
 
 class QueryParserAgent:
     """Parses natural language queries about tariffs."""
     
     def __init__(self):
         """Initialize the query parser agent."""
-        self.client = self._setup_client()
+        self.client = get_openai_client()
+        # The tariff data the lists below were read from, so callers can tell when they are stale
+        self.tariffs_df = data_loader.tariffs_df
         self.available_countries = [c.value for c in data_loader.get_available_countries()]
         self.available_product_types = [p.value for p in data_loader.get_available_product_types()]
-    
-    def _setup_client(self) -> AzureOpenAI:
-        """Setup Azure OpenAI client."""
-        azure_config = settings.get_azure_config()
-        return AzureOpenAI(
-            api_key=azure_config["api_key"],
-            api_version=azure_config["api_version"],
-            azure_endpoint=azure_config["endpoint"]
-        )
+        # The prompt only depends on the lists above, so it is built once per agent
+        self.system_prompt = self._create_system_prompt()
+        self.system_prompt_digest = hashlib.blake2b(self.system_prompt.encode(), digest_size=16).digest()
     
     def _create_system_prompt(self) -> str:
         """Create the system prompt for query parsing."""
@@ -161,7 +306,60 @@ Response:
 4. **JSON only**: Return ONLY the JSON object, no explanations or markdown
 5. **Validate data**: If country/product not in available lists, set to null but mention in parsed_entities"""
 
-    def parse_query(self, query: str) -> TariffQuery:
+    def _classify_fast(self, query: str) -> Optional[TariffQuery]:
+        """
+        Classify a plain query by alias and keyword matching, without the model.
+        
+        Args:
+            query: User's natural language query
+            
+        Returns:
+            TariffQuery for an unambiguous tariff-rate, comparison or general-info
+            query, or None when the model should parse it
+        """
+        query_lower = query.lower()
+        if DEFER_PATTERN.search(query_lower):
+            return None
+        
+        country_names = [COUNTRY_ALIASES[m] for m in COUNTRY_PATTERN.findall(query_lower)]
+        if US_PATTERN.search(query):
+            country_names.append("USA")
+        countries = _distinct(country_names)
+        products = _distinct(PRODUCT_ALIASES[m] for m in PRODUCT_PATTERN.findall(query_lower))
+        if any(c not in self.available_countries for c in countries) or \
+                any(p not in self.available_product_types for p in products):
+            return None  # the model reports unsupported names in parsed_entities
+        
+        keywords = _distinct(TARIFF_PATTERN.findall(query_lower) + COMPARISON_PATTERN.findall(query_lower))
+        comparing = COMPARISON_PATTERN.search(query_lower) is not None
+        if len(countries) == 1 and len(products) == 1 and not comparing and TARIFF_PATTERN.search(query_lower):
+            intent, country, product_type = QueryIntent.TARIFF_RATE, countries[0], products[0]
+        # Several countries without a comparison word is usually origin plus destination
+        # ("toys from Vietnam into the US"), which the model tells apart
+        elif len(countries) >= 2 and len(products) <= 1 and comparing:
+            intent, country, product_type = QueryIntent.COMPARISON, None, products[0] if products else None
+        elif not countries and not products and not TARIFF_PATTERN.search(query_lower) and \
+                GENERAL_INFO_PATTERN.search(query_lower) and \
+                GENERAL_INFO_WORDS.issuperset(WORD_PATTERN.findall(query_lower)):
+            intent, country, product_type = QueryIntent.GENERAL_INFO, None, None
+            keywords = _distinct(GENERAL_INFO_PATTERN.findall(query_lower))
+        else:
+            return None
+        
+        return TariffQuery(
+            country=COUNTRY_BY_VALUE.get(country),
+            product_type=PRODUCT_TYPE_BY_VALUE.get(product_type),
+            intent=intent,
+            confidence=0.9,
+            original_query=query,
+            parsed_entities={
+                "countries_mentioned": countries,
+                "products_mentioned": products,
+                "keywords": keywords
+            }
+        )
+    
+    async def parse_query(self, query: str) -> TariffQuery:
         """
         Parse a natural language query into structured data.
         
@@ -172,42 +370,145 @@ Response:
             TariffQuery object with parsed information
         """
         try:
-            response = self.client.chat.completions.create(
-                model=settings.azure_openai_deployment_name,
-                messages=[
-                    {"role": "system", "content": self._create_system_prompt()},
-                    {"role": "user", "content": f"Parse this query: {query}"}
-                ],
-                temperature=0.1,
-                response_format={"type": "json_object"}
-            )
+            # Plain queries are classified locally; only ambiguous ones reach the model
+            tariff_query = self._classify_fast(query)
+            if tariff_query is not None:
+                return tariff_query
             
-            # Parse the JSON response
-            parsed_data = json.loads(response.choices[0].message.content)
+            cache_key = self._cache_key(query)
+            content = _cache_get(cache_key)
+            if content is None:
+                response = await self.client.chat.completions.create(
+                    model=settings.azure_openai_deployment_name,
+                    messages=[
+                        {"role": "system", "content": self.system_prompt},
+                        {"role": "user", "content": f"Parse this query: {query}"}
+                    ],
+                    temperature=0.1,
+                    max_tokens=QUERY_MAX_TOKENS,
+                    response_format=QUERY_RESPONSE_FORMAT
+                )
+                content = response.choices[0].message.content
             
-            # Create TariffQuery object
-            return TariffQuery(
-                country=Country(parsed_data["country"]) if parsed_data.get("country") else None,
-                product_type=ProductType(parsed_data["product_type"]) if parsed_data.get("product_type") else None,
-                intent=QueryIntent(parsed_data["intent"]),
-                confidence=parsed_data.get("confidence", 0.0),
-                original_query=query,
-                parsed_entities=parsed_data.get("parsed_entities", {})
-            )
+            tariff_query = self._build_query(content, query)
+            # Only responses that produced a valid query are reused
+            _cache_put(cache_key, content)
+            return tariff_query
             
         except Exception as e:
-            # Return a basic query with error information
-            return TariffQuery(
-                country=None,
-                product_type=None,
-                intent=QueryIntent.GENERAL_INFO,
-                confidence=0.0,
-                original_query=query,
-                parsed_entities={"error": str(e)}
+            return self._error_query(query, e)
+    
+    async def parse_queries(self, queries: List[str]) -> List[TariffQuery]:
+        """
+        Parse several queries, sending every one that needs the model in a single request.
+        
+        Args:
+            queries: User queries, in order
+            
+        Returns:
+            TariffQuery objects in the same order as the queries
+        """
+        results: List[Optional[TariffQuery]] = [None] * len(queries)
+        # Queries left for the model, grouped by cache key so repeats are sent once
+        pending: Dict[tuple, List[int]] = {}
+        for i, query in enumerate(queries):
+            try:
+                results[i] = self._classify_fast(query)
+                if results[i] is None:
+                    cache_key = self._cache_key(query)
+                    content = _cache_get(cache_key)
+                    if content is not None:
+                        results[i] = self._build_query(content, query)
+                    else:
+                        pending.setdefault(cache_key, []).append(i)
+            except Exception as e:
+                results[i] = self._error_query(query, e)
+        
+        keys = list(pending)
+        contents = await self._complete_batch([queries[pending[key][0]] for key in keys]) if len(keys) > 1 else None
+        retry = []
+        for n, key in enumerate(keys):
+            for i in pending[key]:
+                if contents is None:
+                    retry.append(i)
+                    continue
+                try:
+                    results[i] = self._build_query(contents[n], queries[i])
+                    _cache_put(key, contents[n])
+                except Exception:  # this entry of the batch didn't parse
+                    retry.append(i)
+        
+        # Anything the batch didn't answer is parsed on its own, concurrently
+        retried = await asyncio.gather(*(self.parse_query(queries[i]) for i in retry))
+        for i, tariff_query in zip(retry, retried):
+            results[i] = tariff_query
+        return results
+    
+    async def _complete_batch(self, queries: List[str]) -> Optional[List[str]]:
+        """Ask the model to parse several queries at once; None unless it returns one object per query."""
+        numbered = "\n".join(f"{n}. {' '.join(query.split())}" for n, query in enumerate(queries, 1))
+        try:
+            response = await self.client.chat.completions.create(
+                model=settings.azure_openai_deployment_name,
+                messages=[
+                    {"role": "system", "content": self.system_prompt},
+                    {"role": "user", "content": (
+                        'Parse these queries. Return a JSON object {"results": [...]} holding one '
+                        f"object per query, in order, each in the output format above:\n{numbered}"
+                    )}
+                ],
+                temperature=0.1,
+                max_tokens=QUERY_MAX_TOKENS * len(queries),
+                response_format=BATCH_RESPONSE_FORMAT
             )
+            items = json_loads(response.choices[0].message.content).get("results")
+        except Exception:
+            return None
+        if not isinstance(items, list) or len(items) != len(queries) or \
+                not all(isinstance(item, dict) for item in items):
+            return None
+        return [json.dumps(item) for item in items]
+    
+    def _cache_key(self, query: str) -> tuple:
+        """Response cache key for a query parsed with this agent's prompt."""
+        return (settings.azure_openai_deployment_name, self.system_prompt_digest, _normalize_query(query))
+    
+    def _build_query(self, content: str, query: str) -> TariffQuery:
+        """Create the TariffQuery for a model response (JSON text) to a query."""
+        parsed_data = json_loads(content)
+        return TariffQuery(
+            country=COUNTRY_BY_VALUE.get(parsed_data.get("country")),
+            product_type=PRODUCT_TYPE_BY_VALUE.get(parsed_data.get("product_type")),
+            intent=INTENT_BY_VALUE[parsed_data["intent"]],
+            confidence=parsed_data.get("confidence", 0.0),
+            original_query=query,
+            parsed_entities=parsed_data.get("parsed_entities", {})
+        )
+    
+    def _error_query(self, query: str, error: Exception) -> TariffQuery:
+        """Return a basic query with error information."""
+        return TariffQuery(
+            country=None,
+            product_type=None,
+            intent=QueryIntent.GENERAL_INFO,
+            confidence=0.0,
+            original_query=query,
+            parsed_entities={"error": str(error)}
+        )
+
+
+_agent: Optional[QueryParserAgent] = None
+
+
+def get_query_parser() -> QueryParserAgent:
+    """Return the shared parser agent, rebuilt only when the tariff data is reloaded."""
+    global _agent
+    if _agent is None or _agent.tariffs_df is not data_loader.tariffs_df:
+        _agent = QueryParserAgent()
+    return _agent
 
 
-def parse_query_node(state: AgentState) -> AgentState:
+async def parse_query_node(state: AgentState) -> AgentState:
     """
     LangGraph node function for query parsing.
     
@@ -217,10 +518,11 @@ def parse_query_node(state: AgentState) -> AgentState:
     Returns:
         Updated state with parsed query
     """
-    agent = QueryParserAgent()
+    agent = get_query_parser()
     
     try:
-        parsed_query = agent.parse_query(state.query)
+        # Batch runs arrive already parsed by parse_queries
+        parsed_query = state.parsed_query or await agent.parse_query(state.query)
         
         # Update the state object directly
         state.parsed_query = parsed_query
@@ -2,31 +2,18 @@
 Response Formatter Agent - Generates human-like responses using LLM.
 """
 
+import logging
 from typing import Optional, List
-from openai import AzureOpenAI
 from src.core.models import AgentState, TariffResult, QueryIntent
 from src.core.config import settings
+from src.core.openai_client import get_openai_client
 
+logger = logging.getLogger(__name__)
 
-class ResponseFormatterAgent:
-    """Formats tariff data into human-readable responses."""
-    
-    def __init__(self):
-        """Initialize the response formatter agent."""
-        self.client = self._setup_client()
-    
-    def _setup_client(self) -> AzureOpenAI:
-        """Setup Azure OpenAI client."""
-        azure_config = settings.get_azure_config()
-        return AzureOpenAI(
-            api_key=azure_config["api_key"],
-            api_version=azure_config["api_version"],
-            azure_endpoint=azure_config["endpoint"]
-        )
-    
-    def _create_system_prompt(self) -> str:
-        """Create the system prompt for response formatting."""
-        return """You are a helpful tariff analysis assistant. Your job is to create clear, informative, and human-like responses about tariff rates.
+# System prompts are fixed text, so each is built once and sent as the same string.
+# Messages keep static text first and per-request data last so the shared prefix
+# is eligible for Azure OpenAI's automatic prompt cache.
+SYSTEM_PROMPT = """You are a helpful tariff analysis assistant. Your job is to create clear, informative, and human-like responses about tariff rates.
 
 ## Your Task
 Convert tariff data into natural, conversational responses that:
@@ -69,7 +56,52 @@ Convert tariff data into natural, conversational responses that:
 - If the query is unclear, ask for clarification
 - If there's a system error, acknowledge it and suggest retrying"""
 
-    def format_tariff_response(
+COMPARISON_SYSTEM_PROMPT = """You are a helpful tariff analysis assistant. Your job is to create clear, informative, and human-like responses for tariff comparisons.
+
+## Your Task
+Create comparison responses that:
+1. **Present all results clearly** with specific rates and percentages
+2. **Highlight key differences** between countries
+3. **Include historical context** when available (trends, changes)
+4. **Use professional yet approachable tone**
+5. **Provide actionable insights** about which country might be better for imports
+
+## Response Guidelines
+- **Be specific**: Include exact percentages and dates
+- **Compare directly**: Show which country has higher/lower rates
+- **Explain implications**: What the differences mean for importers
+- **Include trends**: Mention if rates are increasing/decreasing
+- **Stay focused**: Address the specific comparison requested
+
+## Example Response Structure
+"Here's a comparison of tariff rates for [Product] between [Country1] and [Country2]:
+
+[Country1]: [Rate]% (effective [Date]) - [Trend info]
+[Country2]: [Rate]% (effective [Date]) - [Trend info]
+
+[Country1] has a [higher/lower] tariff rate than [Country2] by [difference] percentage points. This means importing from [Country2] would cost [X] less per $100 in tariff duties. [Additional insights about trends and implications]"
+
+Focus on providing a clear, actionable comparison."""
+
+
+def _log_cache_usage(response) -> None:
+    """Log how many prompt tokens Azure served from its prompt cache."""
+    usage = response.usage
+    if usage is None:
+        return
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", None) or 0
+    logger.debug("Prompt cache: %d of %d prompt tokens cached", cached, usage.prompt_tokens)
+
+
+class ResponseFormatterAgent:
+    """Formats tariff data into human-readable responses."""
+    
+    def __init__(self):
+        """Initialize the response formatter agent."""
+        self.client = get_openai_client()
+    
+    async def format_tariff_response(
         self, 
         tariff_result: TariffResult, 
         original_query: str,
@@ -109,16 +141,17 @@ Convert tariff data into natural, conversational responses that:
                 }
             }
             
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=settings.azure_openai_deployment_name,
                 messages=[
-                    {"role": "system", "content": self._create_system_prompt()},
+                    {"role": "system", "content": SYSTEM_PROMPT},
                     {"role": "user", "content": f"Format this tariff data into a helpful response:\n\nContext: {context}\n\nOriginal Query: {original_query}"}
                 ],
                 temperature=0.3,
                 max_tokens=300
             )
             
+            _log_cache_usage(response)
             return response.choices[0].message.content.strip()
             
         except Exception as e:
@@ -159,7 +192,7 @@ Convert tariff data into natural, conversational responses that:
                    f"Electronics, Apparel, Home goods, and Toys. "
                    f"Please try asking about one of these combinations.")
     
-    def format_error_response(self, error_message: str, original_query: str) -> str:
+    async def format_error_response(self, error_message: str, original_query: str) -> str:
         """
         Format error messages into helpful responses.
         
@@ -171,16 +204,17 @@ Convert tariff data into natural, conversational responses that:
             Formatted error response
         """
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=settings.azure_openai_deployment_name,
                 messages=[
-                    {"role": "system", "content": self._create_system_prompt()},
-                    {"role": "user", "content": f"Create a helpful error response for this situation:\n\nError: {error_message}\nOriginal Query: {original_query}\n\nBe apologetic but helpful, and suggest alternatives."}
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": f"Create a helpful error response for this situation. Be apologetic but helpful, and suggest alternatives.\n\nError: {error_message}\nOriginal Query: {original_query}"}
                 ],
                 temperature=0.3,
                 max_tokens=200
             )
             
+            _log_cache_usage(response)
             return response.choices[0].message.content.strip()
             
         except Exception:
@@ -190,7 +224,7 @@ Convert tariff data into natural, conversational responses that:
                    f"Electronics, Apparel, Home goods, and Toys. "
                    f"Please try asking about one of these combinations.")
     
-    def format_comparison_response(
+    async def format_comparison_response(
         self, 
         tariff_results: List[TariffResult], 
         original_query: str
@@ -230,43 +264,17 @@ Convert tariff data into natural, conversational responses that:
                 ]
             }
             
-            system_prompt = """You are a helpful tariff analysis assistant. Your job is to create clear, informative, and human-like responses for tariff comparisons.
-
-## Your Task
-Create comparison responses that:
-1. **Present all results clearly** with specific rates and percentages
-2. **Highlight key differences** between countries
-3. **Include historical context** when available (trends, changes)
-4. **Use professional yet approachable tone**
-5. **Provide actionable insights** about which country might be better for imports
-
-## Response Guidelines
-- **Be specific**: Include exact percentages and dates
-- **Compare directly**: Show which country has higher/lower rates
-- **Explain implications**: What the differences mean for importers
-- **Include trends**: Mention if rates are increasing/decreasing
-- **Stay focused**: Address the specific comparison requested
-
-## Example Response Structure
-"Here's a comparison of tariff rates for [Product] between [Country1] and [Country2]:
-
-[Country1]: [Rate]% (effective [Date]) - [Trend info]
-[Country2]: [Rate]% (effective [Date]) - [Trend info]
-
-[Country1] has a [higher/lower] tariff rate than [Country2] by [difference] percentage points. This means importing from [Country2] would cost [X] less per $100 in tariff duties. [Additional insights about trends and implications]"
-
-Focus on providing a clear, actionable comparison."""
-
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=settings.azure_openai_deployment_name,
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": COMPARISON_SYSTEM_PROMPT},
                     {"role": "user", "content": f"Create a comparison response for this tariff data:\n\nContext: {context}\n\nOriginal Query: {original_query}"}
                 ],
                 temperature=0.3,
                 max_tokens=400
             )
             
+            _log_cache_usage(response)
             return response.choices[0].message.content.strip()
             
         except Exception as e:
@@ -307,7 +315,18 @@ Focus on providing a clear, actionable comparison."""
         return response
 
 
-def response_formatter_node(state: AgentState) -> AgentState:
+_agent: Optional[ResponseFormatterAgent] = None
+
+
+def get_response_formatter() -> ResponseFormatterAgent:
+    """Return the shared formatter agent, created on first use."""
+    global _agent
+    if _agent is None:
+        _agent = ResponseFormatterAgent()
+    return _agent
+
+
+async def response_formatter_node(state: AgentState) -> AgentState:
     """
     LangGraph node function for response formatting.
     
@@ -317,19 +336,19 @@ def response_formatter_node(state: AgentState) -> AgentState:
     Returns:
         Updated state with formatted response
     """
-    agent = ResponseFormatterAgent()
+    agent = get_response_formatter()
     
     try:
         if state.error:
             # Format error response
-            formatted_response = agent.format_error_response(state.error, state.query)
+            formatted_response = await agent.format_error_response(state.error, state.query)
             state.response = formatted_response
             state.step = "complete"
             return state
         
         elif state.tariff_results:
             # Format comparison response
-            formatted_response = agent.format_comparison_response(
+            formatted_response = await agent.format_comparison_response(
                 state.tariff_results,
                 state.query
             )
@@ -342,7 +361,7 @@ def response_formatter_node(state: AgentState) -> AgentState:
             parsed_query = state.parsed_query
             query_intent = parsed_query.intent if parsed_query else QueryIntent.TARIFF_RATE
             
-            formatted_response = agent.format_tariff_response(
+            formatted_response = await agent.format_tariff_response(
                 state.tariff_result,
                 state.query,
                 query_intent
@@ -358,7 +377,7 @@ def response_formatter_node(state: AgentState) -> AgentState:
         
         else:
             # No data to format
-            formatted_response = agent.format_error_response(
+            formatted_response = await agent.format_error_response(
                 "No tariff data available",
                 state.query
             )
@@ -170,6 +170,10 @@ class TariffLookupAgent:
         return self.data_loader.get_data_summary()
 
 
+# The agent only holds a reference to the shared data loader, so one instance serves every lookup
+_agent = TariffLookupAgent()
+
+
 def tariff_lookup_node(state: AgentState) -> AgentState:
     """
     LangGraph node function for tariff lookup.
@@ -180,7 +184,7 @@ def tariff_lookup_node(state: AgentState) -> AgentState:
     Returns:
         Updated state with tariff results
     """
-    agent = TariffLookupAgent()
+    agent = _agent
     
     try:
         parsed_query = state.parsed_query
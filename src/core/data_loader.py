@@ -18,19 +18,28 @@ class TariffDataLoader:
         self.data_path = data_path or settings.data_path
         self._tariffs_df = None
         self._cache_valid = False
+        # (mtime_ns, size) of the CSV the cached frame was read from
+        self._tariffs_stamp = None
+        # Summary of the cached frame, built on first request
+        self._summary = None
     
     @property
     def tariffs_df(self) -> pd.DataFrame:
-        """Load and cache tariffs data."""
-        if self._tariffs_df is None or not self._cache_valid:
-            csv_path = os.path.join(self.data_path, "tariffs.csv")
-            if not os.path.exists(csv_path):
-                raise FileNotFoundError(f"Tariffs CSV not found at {csv_path}")
-            
+        """Load and cache tariffs data, reloading when the CSV changes."""
+        csv_path = os.path.join(self.data_path, "tariffs.csv")
+        try:
+            st = os.stat(csv_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Tariffs CSV not found at {csv_path}") from None
+        stamp = (st.st_mtime_ns, st.st_size)
+        
+        if self._tariffs_df is None or not self._cache_valid or stamp != self._tariffs_stamp:
             self._tariffs_df = pd.read_csv(csv_path)
             # Convert start_time to date
             self._tariffs_df['start_time'] = pd.to_datetime(self._tariffs_df['start_time']).dt.date
             self._cache_valid = True
+            self._tariffs_stamp = stamp
+            self._summary = None
         
         return self._tariffs_df
     
@@ -158,8 +167,18 @@ class TariffDataLoader:
         return [ProductType(pt) for pt in product_types if pt in [p.value for p in ProductType]]
     
     def get_data_summary(self) -> dict:
-        """Get summary of available data."""
+        """Get summary of available data.
+        
+        The summary is computed once per load of the CSV; the returned dict
+        is shared, so callers must not modify it.
+        """
         df = self.tariffs_df
+        if self._summary is None:
+            self._summary = self._build_summary(df)
+        return self._summary
+    
+    def _build_summary(self, df: pd.DataFrame) -> dict:
+        """Aggregate the tariffs frame into the data summary."""
         return {
             "total_records": len(df),
             "countries": [c.value for c in self.get_available_countries()],
@@ -2,10 +2,12 @@
 Dynamic LangGraph Pipeline with Graphviz Visualization.
 """
 
+import asyncio
+import inspect
 import time
 from typing import Dict, Any, List, Optional
-from src.core.models import AgentState
-from src.agents.query_parser import parse_query_node
+from src.core.models import AgentState, TariffQuery
+from src.agents.query_parser import get_query_parser, parse_query_node
 from src.agents.tariff_lookup import tariff_lookup_node
 from src.agents.response_formatter import response_formatter_node
 from src.agents.dynamic_router import router_node
@@ -43,7 +45,7 @@ class DynamicLangGraphPipeline:
     def _start_node(self, state: AgentState) -> AgentState:
         """Start node - initializes execution tracking."""
         state.current_node = "start"
-        state.current_node_start_time = time.time()
+        state.current_node_start_time = time.perf_counter()
         state.execution_path = ["start"]
         state.step = "started"
         return state
@@ -60,7 +62,7 @@ class DynamicLangGraphPipeline:
         
         return state
     
-    def execute_node(self, state: AgentState, node_name: str) -> AgentState:
+    async def execute_node(self, state: AgentState, node_name: str) -> AgentState:
         """
         Execute a specific node and update state.
         
@@ -77,16 +79,18 @@ class DynamicLangGraphPipeline:
         
         # Update current node
         state.current_node = node_name
-        state.current_node_start_time = time.time()
+        state.current_node_start_time = time.perf_counter()
         
         try:
-            # Execute the node
+            # Execute the node; nodes that wait on the network are coroutines
             node_func = self.node_registry[node_name]
             state = node_func(state)
+            if inspect.isawaitable(state):
+                state = await state
             
             # Record timing
             if state.current_node_start_time:
-                execution_time = time.time() - state.current_node_start_time
+                execution_time = time.perf_counter() - state.current_node_start_time
                 state.node_timings[node_name] = execution_time
             
             # Update execution path
@@ -100,12 +104,13 @@ class DynamicLangGraphPipeline:
             state.step = "error"
             return state
     
-    def run_dynamic_analysis(self, query: str) -> Dict[str, Any]:
+    async def run_dynamic_analysis(self, query: str, parsed_query: Optional[TariffQuery] = None) -> Dict[str, Any]:
         """
         Run complete dynamic tariff analysis pipeline.
         
         Args:
             query: User's natural language query
+            parsed_query: Query already parsed by a batch run, if any
             
         Returns:
             Dictionary with analysis results and execution metadata
@@ -113,11 +118,12 @@ class DynamicLangGraphPipeline:
         # Create initial state
         state = AgentState(
             query=query,
+            parsed_query=parsed_query,
             current_node="start",
             step="initial"
         )
         
-        total_start_time = time.time()
+        total_start_time = time.perf_counter()
         
         try:
             # Execute the dynamic pipeline
@@ -129,7 +135,7 @@ class DynamicLangGraphPipeline:
                 iteration += 1
                 
                 # Execute current node
-                state = self.execute_node(state, current_node)
+                state = await self.execute_node(state, current_node)
                 
                 if state.error and current_node != "error_handler":
                     # Route to error handler
@@ -159,14 +165,14 @@ class DynamicLangGraphPipeline:
                     current_node = "end"
             
             # Finalize execution
-            state = self.execute_node(state, "end")
+            state = await self.execute_node(state, "end")
             
         except Exception as e:
             state.error = f"Pipeline error: {str(e)}"
             state.step = "error"
         
         # Calculate total execution time
-        total_execution_time = time.time() - total_start_time
+        total_execution_time = time.perf_counter() - total_start_time
         state.execution_time = total_execution_time
         
         # Return results with execution metadata
@@ -184,6 +190,22 @@ class DynamicLangGraphPipeline:
             "execution_summary": state.execution_summary
         }
     
+    async def run_batch_analysis(self, queries: List[str]) -> List[Dict[str, Any]]:
+        """
+        Run the pipeline for several queries, parsing them together in one model request.
+        
+        Args:
+            queries: User queries, in order
+            
+        Returns:
+            Analysis results in the same order as the queries
+        """
+        parsed_queries = await get_query_parser().parse_queries(queries)
+        return await asyncio.gather(*(
+            self.run_dynamic_analysis(query, parsed_query)
+            for query, parsed_query in zip(queries, parsed_queries)
+        ))
+    
     def generate_graphviz_dot(self, execution_path: Optional[List[str]] = None) -> str:
         """
         Generate Graphviz DOT representation of the LangGraph.
@@ -276,7 +298,7 @@ class DynamicLangGraphPipeline:
 dynamic_pipeline = DynamicLangGraphPipeline()
 
 
-def run_tariff_analysis(query: str) -> Dict[str, Any]:
+async def run_tariff_analysis(query: str) -> Dict[str, Any]:
     """
     Run complete tariff analysis using dynamic LangGraph pipeline.
     
@@ -286,7 +308,20 @@ def run_tariff_analysis(query: str) -> Dict[str, Any]:
     Returns:
         Dictionary with analysis results and execution metadata
     """
-    return dynamic_pipeline.run_dynamic_analysis(query)
+    return await dynamic_pipeline.run_dynamic_analysis(query)
+
+
+async def run_batch_tariff_analysis(queries: List[str]) -> List[Dict[str, Any]]:
+    """
+    Run tariff analysis for several queries using dynamic LangGraph pipeline.
+    
+    Args:
+        queries: User queries, in order
+        
+    Returns:
+        Analysis results in the same order as the queries
+    """
+    return await dynamic_pipeline.run_batch_analysis(queries)
 
 
 def get_graph_visualization(execution_path: Optional[List[str]] = None) -> str:
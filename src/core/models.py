@@ -119,7 +119,7 @@ class AgentState(BaseModel):
     retry_count: Dict[str, int] = Field(default_factory=dict)  # Error recovery
     execution_summary: Dict[str, Any] = Field(default_factory=dict)  # Metadata
     execution_time: Optional[float] = None  # Total execution time
-    current_node_start_time: Optional[float] = None  # Current node start time
+    current_node_start_time: Optional[float] = None  # Current node start (time.perf_counter())
 
     class Config:
         """Pydantic configuration."""
@@ -132,6 +132,11 @@ class ChatRequest(BaseModel):
     message: str
 
 
+class BatchChatRequest(BaseModel):
+    """API request model for several messages."""
+    messages: List[str]
+
+
 class ChatResponse(BaseModel):
     """API response model."""
     response: str
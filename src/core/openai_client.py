@@ -0,0 +1,29 @@
+"""
+Shared Azure OpenAI client for the TariffTok AI agents.
+"""
+
+from typing import Optional
+import httpx
+from openai import AsyncAzureOpenAI
+from src.core.config import settings
+
+# One connection pool for every agent, sized for concurrent queries; idle
+# connections are kept alive so later requests skip the TCP and TLS handshake
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+_client: Optional[AsyncAzureOpenAI] = None
+
+
+def get_openai_client() -> AsyncAzureOpenAI:
+    """Return the process-wide Azure OpenAI client, created on first use."""
+    global _client
+    if _client is None:
+        azure_config = settings.get_azure_config()
+        _client = AsyncAzureOpenAI(
+            api_key=azure_config["api_key"],
+            api_version=azure_config["api_version"],
+            azure_endpoint=azure_config["endpoint"],
+            http_client=httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+        )
+    return _client
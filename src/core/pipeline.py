@@ -9,7 +9,7 @@ from src.agents.tariff_lookup import tariff_lookup_node
 from src.agents.response_formatter import response_formatter_node
 
 
-def run_tariff_analysis(query: str) -> Dict[str, Any]:
+async def run_tariff_analysis(query: str) -> Dict[str, Any]:
     """
     Run complete tariff analysis pipeline.
     
@@ -27,13 +27,13 @@ def run_tariff_analysis(query: str) -> Dict[str, Any]:
     
     try:
         # Step 1: Parse query
-        state = parse_query_node(state)
+        state = await parse_query_node(state)
         
         # Step 2: Lookup tariff
         state = tariff_lookup_node(state)
         
         # Step 3: Format response
-        state = response_formatter_node(state)
+        state = await response_formatter_node(state)
         
     except Exception as e:
         state.error = f"Pipeline error: {str(e)}"
@@ -6,10 +6,11 @@ import uvicorn
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
-from src.core.models import ChatRequest, ChatResponse
+from typing import Any, Dict, List
+from src.core.models import ChatRequest, BatchChatRequest, ChatResponse
 import requests
 import json
-from src.core.dynamic_pipeline import run_tariff_analysis, get_graph_visualization
+from src.core.dynamic_pipeline import run_tariff_analysis, run_batch_tariff_analysis, get_graph_visualization
 from src.core.config import settings
 from src.core.data_loader import data_loader
 
@@ -1176,24 +1177,49 @@ async def chat_endpoint(request: ChatRequest):
     """
     try:
         # Run the tariff analysis pipeline
-        result = run_tariff_analysis(request.message)
+        result = await run_tariff_analysis(request.message)
         
-        return ChatResponse(
-            response=result["response"] or "Analysis completed successfully.",
-            tariff_info=result["tariff_info"],
-            comparison_data=result["comparison_data"],
-            error=result["error"],
-            execution_path=result["execution_path"],
-            execution_time=result["execution_time"],
-            current_node=result["current_node"],
-            node_timings=result.get("node_timings"),
-            execution_summary=result.get("execution_summary")
-        )
+        return _chat_response(result)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 
+@app.post("/api/chat/batch", response_model=List[ChatResponse])
+async def chat_batch_endpoint(request: BatchChatRequest):
+    """
+    Chat endpoint for several messages, parsed together in one model request.
+    
+    Args:
+        request: Batch request with user messages
+        
+    Returns:
+        Chat responses in the same order as the messages
+    """
+    try:
+        results = await run_batch_tariff_analysis(request.messages)
+        
+        return [_chat_response(result) for result in results]
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
+
+
+def _chat_response(result: Dict[str, Any]) -> ChatResponse:
+    """Build the API response for one pipeline result."""
+    return ChatResponse(
+        response=result["response"] or "Analysis completed successfully.",
+        tariff_info=result["tariff_info"],
+        comparison_data=result["comparison_data"],
+        error=result["error"],
+        execution_path=result["execution_path"],
+        execution_time=result["execution_time"],
+        current_node=result["current_node"],
+        node_timings=result.get("node_timings"),
+        execution_summary=result.get("execution_summary")
+    )
+
+
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint."""
@@ -0,0 +1,11 @@
+"""
+Shared test setup for the TariffTok AI system.
+"""
+
+import os
+
+# Settings are validated when src.core.config is imported, so placeholder Azure
+# values are set before any test module imports the agents. No requests are sent.
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "test-api-key-0000")
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_DEPLOYMENT_NAME", "test-deployment")
@@ -0,0 +1,132 @@
+"""
+Tests for the query parser's local classification and batch parsing.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+import pytest
+from src.agents import query_parser
+from src.agents.query_parser import get_query_parser
+from src.agents.response_formatter import get_response_formatter
+from src.core.dynamic_pipeline import run_batch_tariff_analysis
+from src.core.models import QueryIntent
+
+# Neither query can be classified locally, so both need the model
+MODEL_QUERIES = [
+    "Which country has the lowest tariff on toys?",
+    "Are tariffs on apparel from Mexico higher than from India?",
+]
+
+
+def _parsed(country, product_type):
+    return {
+        "country": country,
+        "product_type": product_type,
+        "intent": "tariff_rate",
+        "confidence": 0.8,
+        "parsed_entities": {"countries_mentioned": [], "products_mentioned": [], "keywords": []}
+    }
+
+
+class FakeCompletions:
+    """Records requests and answers them with canned JSON replies, in order."""
+    
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.requests = []
+    
+    async def create(self, **kwargs):
+        self.requests.append(kwargs)
+        content = json.dumps(self.replies.pop(0))
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+@pytest.fixture
+def parser():
+    return get_query_parser()
+
+
+@pytest.fixture
+def fake_completions(parser, monkeypatch):
+    """Install a fake client on the parser; set .replies before use."""
+    completions = FakeCompletions([])
+    monkeypatch.setattr(parser, "client", SimpleNamespace(chat=SimpleNamespace(completions=completions)))
+    monkeypatch.setattr(query_parser, "_parse_cache", query_parser.OrderedDict())
+    return completions
+
+
+def test_tariff_rate_query_is_classified_locally(parser):
+    result = parser._classify_fast("What's the tariff rate for electronics from China?")
+    assert result.intent == QueryIntent.TARIFF_RATE
+    assert result.country.value == "China"
+    assert result.product_type.value == "Electronics"
+
+
+def test_comparison_query_is_classified_locally(parser):
+    result = parser._classify_fast("Compare tariffs between China and India for electronics")
+    assert result.intent == QueryIntent.COMPARISON
+    assert result.parsed_entities["countries_mentioned"] == ["China", "India"]
+
+
+def test_general_info_query_is_classified_locally(parser):
+    result = parser._classify_fast("What data do you have available?")
+    assert result.intent == QueryIntent.GENERAL_INFO
+    assert result.parsed_entities["countries_mentioned"] == []
+
+
+@pytest.mark.parametrize("query", [
+    "Can you tell me the tariff on cars from Japan?",
+    "Is data available for Japan?",
+    "is data available for japan?",
+    "Can you show data on furniture?",
+    "Do you have data for 2024?",
+])
+def test_unknown_entities_are_left_to_the_model(parser, query):
+    assert parser._classify_fast(query) is None
+
+
+def test_tariff_keyword_is_never_general_info(parser):
+    assert parser._classify_fast("Can you show tariff data?") is None
+
+
+def test_parse_queries_sends_one_request(parser, fake_completions):
+    fake_completions.replies = [{"results": [_parsed(None, "Toys"), _parsed("Mexico", "Apparel")]}]
+    queries = MODEL_QUERIES + ["What's the tariff rate for electronics from China?"]
+    
+    results = asyncio.run(parser.parse_queries(queries))
+    
+    assert len(fake_completions.requests) == 1
+    assert [r.original_query for r in results] == queries
+    assert results[0].product_type.value == "Toys"
+    assert results[1].country.value == "Mexico"
+    assert results[2].country.value == "China"
+
+
+def test_parse_queries_falls_back_per_query_on_length_mismatch(parser, fake_completions):
+    fake_completions.replies = [
+        {"results": [_parsed(None, "Toys")]},
+        _parsed(None, "Toys"),
+        _parsed("Mexico", "Apparel"),
+    ]
+    
+    results = asyncio.run(parser.parse_queries(MODEL_QUERIES))
+    
+    assert len(fake_completions.requests) == 3
+    assert [r.original_query for r in results] == MODEL_QUERIES
+    assert results[1].country.value == "Mexico"
+
+
+def test_batch_analysis_parses_queries_once(parser, fake_completions, monkeypatch):
+    fake_completions.replies = [{"results": [_parsed(None, "Toys"), _parsed("Mexico", "Apparel")]}]
+    # The formatter falls back to its template responses when it gets no reply
+    formatter_completions = FakeCompletions([])
+    monkeypatch.setattr(
+        get_response_formatter(), "client", SimpleNamespace(chat=SimpleNamespace(completions=formatter_completions))
+    )
+    
+    results = asyncio.run(run_batch_tariff_analysis(MODEL_QUERIES))
+    
+    assert len(fake_completions.requests) == 1
+    assert [r["query"] for r in results] == MODEL_QUERIES
+    assert all("parse_query" in r["execution_path"] for r in results)